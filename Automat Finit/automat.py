@@ -1,128 +1,227 @@
-class AutomatonValidator:
+import glob
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfa_core.automaton import EPSILON_ALIASES, AutomatonFormatError, load_automaton
+from lfa_core.section_parser import has_section_header
+
+
+class ValidationReport:
+    """rezultatul structurat al validarii unui automat (fara afisari)"""
+
     def __init__(self):
+        self.errors = []  # erori structurale (automatul este invalid)
+        self.warnings = []  # observatii (stari inaccesibile / moarte)
+        self.unreachable_states = []  # stari la care nu se ajunge din start
+        self.dead_states = []  # stari din care nu se ajunge intr-o stare finala
+        self.nondeterministic = []  # (stare, simbol, destinatii) care incalca determinismul
+        self.missing_transitions = []  # (stare, simbol) fara tranzitie
+        self.is_deterministic = True
+        self.is_complete = True
+
+    @property
+    def is_valid(self):
+        return not self.errors
+
+    def to_dict(self):
+        """raportul ca dictionar serializabil JSON"""
+        return {
+            "valid": self.is_valid,
+            "deterministic": self.is_deterministic,
+            "complete": self.is_complete,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "unreachable_states": self.unreachable_states,
+            "dead_states": self.dead_states,
+            "nondeterministic": [list(entry) for entry in self.nondeterministic],
+            "missing_transitions": [list(entry) for entry in self.missing_transitions],
+        }
+
+    def display(self):
+        """afisez raportul in formatul validatorului"""
+        if self.errors:
+            print("❌ VALIDARE EȘUATĂ:")
+            for error in self.errors:
+                print(f"  • {error}")
+        else:
+            print("✅ VALIDARE REUȘITĂ: Automatul este valid!")
+
+        for warning in self.warnings:
+            print(f"  ⚠️  {warning}")
+        print(f"  Determinist: {'da' if self.is_deterministic else 'nu'}"
+              f" | Complet: {'da' if self.is_complete else f'nu ({len(self.missing_transitions)} tranziții lipsă)'}")
+
+
+class AutomatonValidator:
+    def __init__(self, verbose=True):
         self.sigma = set()  # alfabet
         self.states = set()  # stari
         self.final_states = set()  # stari finale
         self.start_states = set()  # stari de start
         self.transitions = []  # tranzitii
+        self.automaton = None  # reprezentarea internata (lfa_core.automaton.Automaton)
+        self.verbose = verbose  # afisez erorile de parsare (dezactivat in modul --bulk)
+        self.parse_error = None  # ultimul mesaj de eroare de parsare
+
+    def report_parse_error(self, message):
+        """retin eroarea de parsare si o afisez doar in modul interactiv"""
+        self.parse_error = message
+        if self.verbose:
+            print(message)
 
     def parse_file(self, filename):
-        """parsez fisierul de intrare pentru automat"""
+        """parsez fisierul de intrare pentru automat (parserul comun din lfa_core/automaton.py)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            automaton = load_automaton(filename)
         except FileNotFoundError:
-            print(f"Eroare: Fișierul '{filename}' nu a fost găsit.")
+            self.report_parse_error(f"Eroare: Fișierul '{filename}' nu a fost găsit.")
+            return False
+        except AutomatonFormatError as e:
+            self.report_parse_error(str(e))
             return False
         except Exception as e:
-            print(f"Eroare la citirea fișierului: {e}")
+            self.report_parse_error(f"Eroare la citirea fișierului: {e}")
             return False
 
-        current_section = None
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # ignor liniile goale si comentariile
-            if not line or line.startswith('#'):
-                continue
-
-            # detectez sectiunile
-            if line == "Sigma:":
-                current_section = "sigma"
-                continue
-            elif line == "End":
-                current_section = None
-                continue
-            elif line == "States:":
-                current_section = "states"
-                continue
-            elif line == "Transitions:":
-                current_section = "transitions"
-                continue
-
-            # procesez continutul sectiunilor
-            if current_section == "sigma":
-                if line != "...":  # ignor
-                    self.sigma.add(line)
-
-            elif current_section == "states":
-                if line != "...":  # ignor
-                    # verific daca starea este finala (se termina cu ,F)
-                    if line.endswith(',F'):
-                        state = line[:-2]  # elimin ',F'
-                        self.states.add(state)
-                        self.final_states.add(state)
-                    # verific daca starea este de start (se termina cu ,S)
-                    elif line.endswith(',S'):
-                        state = line[:-2]  # elimin ',S'
-                        self.states.add(state)
-                        self.start_states.add(state)
-                    else:
-                        self.states.add(line)
-
-            elif current_section == "transitions":
-                if line != "...":  # ignor
-                    # parsez tranzactia: stateX, wordY, stateZ
-                    parts = [part.strip() for part in line.split(',')]
-                    if len(parts) == 3:
-                        from_state, word, to_state = parts
-                        self.transitions.append((from_state, word, to_state))
-                    else:
-                        print(f"Eroare la linia {line_num}: format tranziție invalid '{line}'")
-                        return False
-
+        self.automaton = automaton
+        self.sigma = automaton.alphabet()
+        self.states = automaton.state_names()
+        self.final_states = automaton.final_states()
+        self.start_states = {automaton.states[state_id] for state_id in automaton.start_states}
+        self.transitions = list(automaton.transitions())
         return True
 
-    def validate(self):
-        """Validează automatul conform cerințelor"""
+    def check_transitions(self):
+        """o singura trecere prin array-urile de tranzitii: erorile de referinta si sursele simbolului 'S'"""
+        automaton = self.automaton
+        names = automaton.states
+        declared_states = automaton.declared_states
+        declared_symbols = automaton.declared_symbols
+        s_symbol = automaton.symbol_ids.get('S', -1)
+
         errors = []
+        s_successors = set()
+        for i, (source, label, target) in enumerate(zip(automaton.sources, automaton.labels, automaton.targets), 1):
+            if label == s_symbol:
+                s_successors.add(names[source])
 
-        print("=== INFORMAȚII DESPRE AUTOMAT ===")
-        print(f"Alfabet (Sigma): {sorted(self.sigma)}")
-        print(f"Stări: {sorted(self.states)}")
-        print(f"Stări finale: {sorted(self.final_states)}")
-        print(f"Stări de start: {sorted(self.start_states)}")
-        print(f"Numărul de tranziții: {len(self.transitions)}")
-        print()
+            # verific ca starile din tranzitii exista
+            if not declared_states[source]:
+                errors.append(f"Tranziția {i}: starea sursă '{names[source]}' nu există în lista de stări")
+            if not declared_states[target]:
+                errors.append(f"Tranziția {i}: starea destinație '{names[target]}' nu există în lista de stări")
 
-        print("=== VALIDARE ===")
+            # verific daca cuvintele din tranzitii exista in alfabet
+            if not declared_symbols[label]:
+                errors.append(f"Tranziția {i}: cuvântul '{automaton.symbols[label]}' nu există în alfabet")
+
+        return errors, s_successors
+
+    def search(self, sources, index, ends):
+        """BFS pe indexul CSR (offsets, edges): id-urile starilor declarate atinse din sources
+
+        ends este automaton.targets pentru parcurgerea inainte si automaton.sources pentru cea inapoi.
+        """
+        offsets, edges = index
+        declared = self.automaton.declared_states
+        seen = bytearray(len(declared))
+        queue = deque()
+        for state_id in sources:
+            if declared[state_id] and not seen[state_id]:
+                seen[state_id] = 1
+                queue.append(state_id)
+
+        while queue:
+            state_id = queue.popleft()
+            for edge in edges[offsets[state_id]:offsets[state_id + 1]]:
+                next_id = ends[edge]
+                if declared[next_id] and not seen[next_id]:
+                    seen[next_id] = 1
+                    queue.append(next_id)
+        return seen
+
+    def analyze(self):
+        """validez automatul fara afisari si intorc un ValidationReport
+
+        Toate verificarile sunt liniare in numarul de stari si tranzitii (completitudinea
+        in stari x simboluri): indexurile CSR sunt construite o data, apoi accesibilitatea
+        si co-accesibilitatea sunt cate un BFS pe id-uri intregi.
+        """
+        report = ValidationReport()
+        automaton = self.automaton
+        names = automaton.states
+        declared = automaton.declared_states
+        transition_errors, s_successors = self.check_transitions()
 
         # verific ca exista cel putin o stare de start
         if not self.start_states:
-            errors.append("Nu există stări de start (marcate cu ,S)")
+            report.errors.append("Nu există stări de start (marcate cu ,S)")
 
         # verific ca simbolul 'S' poate succede doar o stare
-        s_successors = set()
-        for from_state, word, to_state in self.transitions:
-            if word == 'S':
-                s_successors.add(from_state)
-
         if len(s_successors) > 1:
-            errors.append(f"Simbolul 'S' poate succede mai mult de o stare: {s_successors}")
+            report.errors.append(f"Simbolul 'S' poate succede mai mult de o stare: {s_successors}")
 
-        # validez tranzitiile
-        for i, (from_state, word, to_state) in enumerate(self.transitions):
-            # verific ca starile din tranzitii exista
-            if from_state not in self.states:
-                errors.append(f"Tranziția {i + 1}: starea sursă '{from_state}' nu există în lista de stări")
+        report.errors.extend(transition_errors)
 
-            if to_state not in self.states:
-                errors.append(f"Tranziția {i + 1}: starea destinație '{to_state}' nu există în lista de stări")
+        forward = automaton.adjacency()
+        backward = automaton.adjacency(reverse=True)
+        final_ids = [state_id for state_id, flag in enumerate(automaton.final_flags) if flag]
 
-            # verific daca cuvintele din tranzitii exista in alfabet
-            if word not in self.sigma:
-                errors.append(f"Tranziția {i + 1}: cuvântul '{word}' nu există în alfabet")
+        # stari accesibile (BFS inainte din start) si co-accesibile (BFS inapoi din finale)
+        reachable = self.search(automaton.start_states, forward, automaton.targets)
+        co_reachable = self.search(final_ids, backward, automaton.sources)
+        ordered = sorted((state_id for state_id, flag in enumerate(declared) if flag), key=names.__getitem__)
+        report.unreachable_states = [names[state_id] for state_id in ordered if not reachable[state_id]]
+        report.dead_states = [names[state_id] for state_id in ordered if not co_reachable[state_id]]
 
-        # raportez rezultatele
-        if errors:
-            print("❌ VALIDARE EȘUATĂ:")
-            for error in errors:
-                print(f"  • {error}")
-            return False
-        else:
-            print("✅ VALIDARE REUȘITĂ: Automatul este valid!")
-            return True
+        # determinism: o singura stare de start, fara epsilon si fara doua destinatii pe acelasi simbol
+        symbols = automaton.symbols
+        offsets, edges = forward
+        alphabet = sorted(self.sigma - set(EPSILON_ALIASES))
+        for state_id in ordered:
+            moves = {}
+            for edge in edges[offsets[state_id]:offsets[state_id + 1]]:
+                target = automaton.targets[edge]
+                if declared[target]:
+                    moves.setdefault(symbols[automaton.labels[edge]], set()).add(names[target])
+
+            for word, targets in moves.items():
+                if word in EPSILON_ALIASES or len(targets) > 1:
+                    report.nondeterministic.append((names[state_id], word, sorted(targets)))
+
+            # completitudine: fiecare stare are tranzitie pe fiecare simbol din alfabet
+            for word in alphabet:
+                if word not in moves:
+                    report.missing_transitions.append((names[state_id], word))
+
+        report.is_deterministic = not report.nondeterministic and len(self.start_states) <= 1
+        report.is_complete = not report.missing_transitions
+
+        if report.unreachable_states:
+            report.warnings.append(f"Stări inaccesibile din starea de start: {report.unreachable_states}")
+        if report.dead_states:
+            report.warnings.append(f"Stări din care nu se ajunge într-o stare finală: {report.dead_states}")
+
+        return report
+
+    def validate(self):
+        """Validează automatul conform cerințelor"""
+        print("=== INFORMAȚII DESPRE AUTOMAT ===")
+        print(f"Alfabet (Sigma): {sorted(self.sigma)}")
+        print(f"Stări: {sorted(self.states)}")
+        print(f"Stări finale: {sorted(self.final_states)}")
+        print(f"Stări de start: {sorted(self.start_states)}")
+        print(f"Numărul de tranziții: {len(self.transitions)}")
+        print()
+
+        print("=== VALIDARE ===")
+        report = self.analyze()
+        report.display()
+        return report.is_valid
 
     def display_transitions(self):
         """Afișează toate tranzițiile"""
@@ -131,11 +230,82 @@ class AutomatonValidator:
             print(f"{i:2d}. {from_state} --({word})--> {to_state}")
 
 
+def validate_file(filename):
+    """validez un singur fisier fara afisari; intorc o linie de raport (dictionar) pentru JSONL"""
+    validator = AutomatonValidator(verbose=False)
+    if not validator.parse_file(filename):
+        return {"file": filename, "parsed": False, "valid": False, "errors": [validator.parse_error]}
+
+    result = {"file": filename, "parsed": True}
+    result.update(validator.analyze().to_dict())
+    return result
+
+
+def find_automaton_files(target):
+    """(fisierele de validat, fisierele .txt sarite) dintr-un director (recursiv) sau dintr-un glob
+
+    In modul director sunt validate doar fisierele .txt care incep cu o sectiune (Sigma:/States:/
+    Transitions:); celelalte (requirements.txt, siruri de test) sunt sarite. Potrivirile unui glob
+    sunt alese explicit, deci sunt validate toate.
+    """
+    if os.path.isdir(target):
+        files, skipped = [], []
+        for root, _, names in os.walk(target):
+            for name in names:
+                if name.endswith('.txt'):
+                    path = os.path.join(root, name)
+                    (files if has_section_header(path) else skipped).append(path)
+        return sorted(files), sorted(skipped)
+    return sorted(path for path in glob.glob(target, recursive=True) if os.path.isfile(path)), []
+
+
+def run_bulk(target, workers=None, output=None):
+    """validez in paralel toate fisierele din target si scriu cate o linie JSON pentru fiecare"""
+    files, skipped = find_automaton_files(target)
+    if skipped:
+        print(f"⏭️  {len(skipped)} fișiere .txt fără secțiuni de automat sărite", file=sys.stderr)
+    if not files:
+        print(f"❌ Niciun fișier de automat găsit pentru '{target}'", file=sys.stderr)
+        return False
+
+    workers = workers or os.cpu_count() or 1
+    # bucati suficient de mari cat sa nu platim IPC per fisier, dar destule pentru echilibrare
+    chunk_size = max(1, len(files) // (workers * 4))
+
+    out = open(output, 'w', encoding='utf-8') if output else sys.stdout
+    valid_count = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for result in pool.map(validate_file, files, chunksize=chunk_size):
+                valid_count += result["valid"]
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+    finally:
+        if output:
+            out.close()
+
+    print(f"📊 {valid_count}/{len(files)} automate valide ({workers} procese)", file=sys.stderr)
+    return valid_count == len(files)
+
+
 def main():
-    # nume fix al fisierului din care se citeste
-    filename = 'test_automat.txt'
+    args = sys.argv[1:]
+
+    # modul --bulk: director sau glob, validat in paralel, raport JSON Lines
+    if '--bulk' in args:
+        position = args.index('--bulk')
+        try:
+            target = args[position + 1]
+            workers = int(args[args.index('--workers') + 1]) if '--workers' in args else None
+        except (IndexError, ValueError):
+            print("Utilizare: python automat.py --bulk <director|glob> [--workers N] [--output raport.jsonl]")
+            sys.exit(2)
+        output = args[args.index('--output') + 1] if '--output' in args and args.index('--output') + 1 < len(args) else None
+        sys.exit(0 if run_bulk(target, workers, output) else 1)
+
+    # implicit se citeste din test_automat.txt
+    filename = args[0] if args else 'test_automat.txt'
 
-    print(f"🔍 Citesc obligatoriu din fișierul: {filename}")
+    print(f"🔍 Citesc din fișierul: {filename}")
     print("=" * 50)
 
     # creez validatorul
@@ -156,4 +326,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -33,11 +33,27 @@ Testeaza daca "(a+a)" poate fi derivat: python cfg.py test exemple_arithmetic.js
 """
 
 
+import os
 import sys
 import json
+import random
 import re
 from collections import defaultdict
 
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfa_core.cnf import CNF_STAGES, to_cnf
+from lfa_core.cyk import BitsetCYK
+from lfa_core.derivation import DerivationSearch, leftmost_forms
+from lfa_core.earley import EarleyRecognizer
+from lfa_core.generate import StringGenerator
+from lfa_core.grammar import CompiledGrammar, Grammar, format_tree
+from lfa_core.grammar_analysis import (first_sets, follow_sets, productive_nonterminals, reachable_nonterminals,
+                                       remove_useless, symbol_names)
+from lfa_core.parse_tables import build_parse_table, load_table, save_table
+from lfa_core.sppf import build_sppf
+
 
 class CFG:
     def __init__(self):
@@ -45,6 +61,16 @@ class CFG:
         self.terminals = set()  # terminals (lowercase letters, digits, symbols)
         self.rules = defaultdict(list)  # variable -> [list of productions]
         self.start_variable = None
+        self.productions = None  # variable -> [tuple of symbols], parsate o singura data (vezi compile)
+        self.compiled = None  # CompiledGrammar: simboluri internate, reguli indexate
+        self.trimmed = None  # CompiledGrammar fara simboluri inutile, folosit de recunoastere si derivare
+        self.symbol_pattern = None  # cel mai lung simbol declarat, pentru parse_production
+        self.token_pattern = None  # cel mai lung terminal declarat, pentru tokenize
+        self.recognizer = None  # EarleyRecognizer compilat la prima recunoastere (vezi compile_recognizer)
+        self.cyk = None  # BitsetCYK (gramatica in CNF) compilat la prima recunoastere pe loturi
+        self.derivation = None  # DerivationSearch compilat la prima derivare
+        self.parse_table = None  # tabel LL(1)/LALR(1), generat la prima analiza (vezi build_parse_table)
+        self.generator = None  # StringGenerator (tabelul de numarare pe lungimi), construit la prima generare
 
     def load_from_file(self, filename):
         """Partea 1: Incarca si valideaza un CFG dintr un fisier de configuratie"""
@@ -80,6 +106,12 @@ class CFG:
             print(f"❌ Error loading CFG: {e}")
             return False
 
+    def load_config(self, config_file):
+        """incarc gramatica dupa extensie: JSON pentru .json, altfel formatul text; True daca este valida"""
+        if config_file.endswith('.json'):
+            return self.load_from_file(config_file)
+        return self.load_from_text_format(config_file)
+
     def load_from_text_format(self, filename):
         """ incarcator de formate de text alternative"""
         try:
@@ -135,6 +167,8 @@ class CFG:
     def validate_cfg(self):
         """validam daca CFG este bine format"""
         errors = []
+        # regulile s-au schimbat: productiile se parseaza din nou, o singura data
+        self.compile()
 
         # verific daca variabila de start exista
         if not self.start_variable:
@@ -149,11 +183,7 @@ class CFG:
 
         # verific toate simbolurile
         for variable, productions in self.rules.items():
-            for production in productions:
-                if production == 'ε' or production == 'epsilon':
-                    continue
-
-                symbols = self.parse_production(production)
+            for production, symbols in zip(productions, self.productions[variable]):
                 for symbol in symbols:
                     if symbol not in self.variables and symbol not in self.terminals:
                         errors.append(f"Unknown symbol '{symbol}' in production '{variable} -> {production}'")
@@ -165,24 +195,44 @@ class CFG:
             return False
 
         print("✅ CFG validation successful!")
+        analysis = self.analysis()
+        if analysis['unproductive']:
+            print(f"⚠️  Unproductive variables (derive no terminal string): {analysis['unproductive']}")
+        if analysis['unreachable']:
+            print(f"⚠️  Unreachable variables (not reachable from {self.start_variable}): {analysis['unreachable']}")
         return True
 
     def parse_production(self, production):
-        """ analizarea unui sir de productie in simboluri individuale"""
+        """ analizarea unui sir de productie in simboluri individuale
+
+        Spatiile separa simbolurile. Intr-o bucata fara spatii se ia la fiecare pas cel mai lung simbol
+        declarat (variabila sau terminal, de exemplu 'id' sau "E'"); daca niciunul nu se potriveste, o
+        majuscula urmata de litere/cifre/' este variabila, iar orice alt caracter este terminal.
+        """
+        if production == 'ε' or production == 'epsilon':
+            return []
+
+        pattern = self.symbol_pattern or longest_match_pattern(self.variables | self.terminals)
         symbols = []
-        i = 0
-        while i < len(production):
-            if production[i].isupper():
-                symbol = production[i]
-                j = i + 1
-                while j < len(production) and (production[j].isalnum() or production[j] == "'"):
-                    symbol += production[j]
-                    j += 1
+        for chunk in production.split():
+            if chunk in self.variables or chunk in self.terminals:
+                symbols.append(chunk)
+                continue
+
+            i = 0
+            while i < len(chunk):
+                match = pattern.match(chunk, i) if pattern else None
+                if match:
+                    symbol = match.group()
+                elif chunk[i].isupper():
+                    j = i + 1
+                    while j < len(chunk) and (chunk[j].isalnum() or chunk[j] == "'"):
+                        j += 1
+                    symbol = chunk[i:j]
+                else:
+                    symbol = chunk[i]
                 symbols.append(symbol)
-                i = j
-            else:
-                symbols.append(production[i])
-                i += 1
+                i += len(symbol)
         return symbols
 
     def create_from_input(self):
@@ -293,76 +343,262 @@ class CFG:
             productions = ' | '.join(self.rules[variable])
             print(f"{variable} -> {productions}")
 
-    def derive_string(self, target_string, max_steps=20):
-        """incercare de a deriva un sir de caractere folosind CFG (derivare simpls din stanga)"""
-        print(f"\n🎯 Attempting to derive: '{target_string}'")
-
-        # se incepe cu variabila de start
-        current = [self.start_variable]
-        steps = 0
-
-        print(f"Step 0: {' '.join(current)}")
-
-        while steps < max_steps and current != list(target_string):
-            steps += 1
-
-            # gasiti cel mai din stanga neterminal
-            leftmost_var = None
-            var_index = -1
-
-            for i, symbol in enumerate(current):
-                if symbol in self.variables:
-                    leftmost_var = symbol
-                    var_index = i
-                    break
-
-            if leftmost_var is None:
-                break
-
-            # obtineti productiile posibile pentru aceasta variabila
-            if leftmost_var not in self.rules:
-                print(f"❌ No rules for variable '{leftmost_var}'")
-                return False
-
-            # se incearca fiecare productie (euristica simpla: se prefera mai intai cele mai scurte)
-            productions = sorted(self.rules[leftmost_var], key=len)
-
-            for production in productions:
-                # se creaza o noua derivare
-                new_current = current[:var_index]
-
-                if production == 'ε' or production == 'epsilon':
-                    pass
-                else:
-                    # se adauga simbolul in productie
-                    new_current.extend(list(production))
-
-                new_current.extend(current[var_index + 1:])
+    def derive_string(self, target_string, max_states=200000):
+        """cautarea unei derivari de stanga pentru sir (best-first, memoizata, vezi lfa_core/derivation.py)
 
-                print(
-                    f"Step {steps}: {' '.join(current)} -> {' '.join(new_current)} (using {leftmost_var} -> {production})")
-                current = new_current
-                break
+        Sirurile care nu apartin limbajului sunt respinse direct (Earley), fara cautare. max_states
+        limiteaza numarul de forme propozitionale memorate. Intoarce lista pasilor
+        (productie folosita, forma propozitionala) sau None.
+        """
+        print(f"\n🎯 Attempting to derive: '{target_string}'")
+        if not self.recognize(target_string):
+            print(f"❌ Could not derive '{target_string}': not in the language")
+            return None
+
+        if self.derivation is None:
+            self.derivation = DerivationSearch(self.trimmed, self.recognizer)
+        rule_ids = self.derivation.search(self.tokenize(target_string), max_states)
+        if rule_ids is None:
+            if self.derivation.truncated:
+                print(f"❌ Could not derive '{target_string}': search limit reached ({max_states} forms)")
             else:
-                print(f"❌ No suitable production found for '{leftmost_var}'")
-                return False
+                print(f"❌ Could not derive '{target_string}'")
+            return None
+
+        compiled = self.derivation.compiled
+        steps = []
+        current = self.start_variable
+        print(f"Step 0: {current}")
+        for number, (rule_id, form) in enumerate(zip(rule_ids, leftmost_forms(compiled, rule_ids)), 1):
+            body = ' '.join(compiled.decode(compiled.bodies[rule_id])) or 'ε'
+            production = f"{compiled.symbols[compiled.heads[rule_id]]} -> {body}"
+            new_current = ' '.join(compiled.decode(form)) or 'ε'
+            print(f"Step {number}: {current} -> {new_current} (using {production})")
+            steps.append((production, new_current))
+            current = new_current
+
+        print(f"✅ Successfully derived '{target_string}' in {len(steps)} steps ({self.derivation.explored} forms explored)")
+        return steps
+
+    def compile(self):
+        """parsez productiile o singura data si construiesc gramatica compilata (CompiledGrammar)
+
+        Apelat la fiecare incarcare/validare; Earley, CNF/CYK si derivarea folosesc rezultatul, fara sa
+        mai re-tokenizeze productiile. Formele compilate mai departe (recunoscatoarele) se refac la nevoie.
+        """
+        self.symbol_pattern = longest_match_pattern(self.variables | self.terminals)
+        self.token_pattern = longest_match_pattern(self.terminals, r'\S')
+        self.productions = {variable: [] for variable in sorted(self.variables)}
+        for variable, productions in self.rules.items():
+            self.productions.setdefault(variable, []).extend(tuple(self.parse_production(p)) for p in productions)
+
+        grammar = Grammar.from_dict(self.start_variable, self.productions, self.terminals)
+        self.compiled = CompiledGrammar(grammar)
+        self.trimmed = CompiledGrammar(remove_useless(self.compiled))
+        self.recognizer = None
+        self.cyk = None
+        self.derivation = None
+        self.parse_table = None
+        self.generator = None
+        return self.compiled
+
+    def compiled_grammar(self):
+        """gramatica compilata (o construiesc daca CFG-ul nu a fost inca validat)"""
+        if self.compiled is None:
+            self.compile()
+        return self.compiled
+
+    def grammar_rules(self):
+        """regulile ca dictionar variabila -> lista de corpuri (tupluri de simboluri, ε = tuplu gol)"""
+        self.compiled_grammar()
+        return self.productions
+
+    def to_grammar(self):
+        """gramatica in forma folosita de algoritmii din lfa_core (Grammar)"""
+        return self.compiled_grammar().grammar
+
+    def load_grammar(self, grammar):
+        """incarc un Grammar (de exemplu rezultatul unei transformari) in acest CFG"""
+        self.variables = set(grammar.nonterminals)
+        self.terminals = set(grammar.terminals)
+        self.start_variable = grammar.start
+        self.rules = defaultdict(list)
+        for head, body in grammar.rules:
+            self.rules[head].append(' '.join(body) if body else 'ε')
+        self.compile()
+        return self
+
+    def to_cnf(self, stages=None):
+        """intorc un CFG nou, echivalent, in forma normala Chomsky
+
+        stages: lista de etape (nume, functie) din lfa_core.cnf; implicit START, TERM, BIN, DEL, UNIT.
+        """
+        return CFG().load_grammar(to_cnf(self.to_grammar(), stages))
+
+    def analysis(self):
+        """analizele gramaticii (lfa_core/grammar_analysis.py), cu nume de simboluri
+
+        Intoarce un dictionar cu: nullable, first, follow ('$' = sfarsitul sirului), unproductive
+        (variabile care nu deriva niciun sir de terminali) si unreachable (neaccesibile din start).
+        """
+        compiled = self.compiled_grammar()
+        names = compiled.symbols[:compiled.num_nonterminals]
+        first = first_sets(compiled)
+        follow = follow_sets(compiled, first)
+        productive = productive_nonterminals(compiled)
+        reachable = reachable_nonterminals(compiled)
+        return {
+            'nullable': [name for name, flag in zip(names, compiled.nullable) if flag],
+            'first': {name: symbol_names(compiled, first[i]) for i, name in enumerate(names)},
+            'follow': {name: symbol_names(compiled, follow[i]) for i, name in enumerate(names)},
+            'unproductive': [name for name, flag in zip(names, productive) if not flag],
+            'unreachable': [name for name, flag in zip(names, reachable) if not flag],
+        }
 
-        # verific daca am derivat sirul
-        derived_string = ''.join(current)
-        if derived_string == target_string:
-            print(f"✅ Successfully derived '{target_string}'!")
-            return True
-        else:
-            print(f"❌ Could not derive '{target_string}'. Got: '{derived_string}'")
+    def display_analysis(self):
+        """afiseaza multimile nullable, FIRST si FOLLOW si simbolurile inutile"""
+        analysis = self.analysis()
+        print("\n=== GRAMMAR ANALYSIS ===")
+        print(f"Nullable: {analysis['nullable']}")
+        print(f"Unproductive: {analysis['unproductive']}")
+        print(f"Unreachable: {analysis['unreachable']}")
+        print("\nFIRST / FOLLOW:")
+        for variable in analysis['first']:
+            first = ', '.join(analysis['first'][variable])
+            follow = ', '.join(analysis['follow'][variable])
+            print(f"  {variable:<6} FIRST = {{{first}}}   FOLLOW = {{{follow}}}")
+        return analysis
+
+    def remove_useless(self):
+        """intorc un CFG nou, echivalent, fara variabile neproductive sau inaccesibile"""
+        return CFG().load_grammar(remove_useless(self.compiled_grammar()))
+
+    def build_parse_table(self):
+        """tabelul LL(1) al gramaticii sau, daca nu este LL(1), tabelul LALR(1) (lfa_core/parse_tables.py)"""
+        if self.parse_table is None:
+            self.compiled_grammar()
+            self.parse_table = build_parse_table(self.trimmed)
+        return self.parse_table
+
+    def save_parse_table(self, filename):
+        """salvez tabelul in JSON, ca sa poata fi refolosit fara regenerare"""
+        save_table(self.build_parse_table(), filename)
+        print(f"✅ {self.parse_table.kind} table saved to '{filename}'")
+
+    def load_parse_table(self, filename):
+        """folosesc un tabel salvat, doar daca a fost generat pentru aceasta gramatica; True daca l-am folosit"""
+        table = load_table(filename)
+        self.compiled_grammar()
+        if not table.same_grammar(self.trimmed):
             return False
+        self.parse_table = table
+        return True
+
+    def parse(self, string):
+        """arborele de derivare al sirului, in timp liniar, cu tabelul LL(1)/LALR(1); None daca sirul este respins
+
+        ValueError daca gramatica are conflicte (nu este nici LL(1), nici LALR(1)); pentru astfel de
+        gramatici raman recognize (Earley) si derive_string.
+        """
+        table = self.build_parse_table()
+        if table.conflicts:
+            raise ValueError(f"Grammar is not LL(1) or LALR(1): {len(table.conflicts)} conflicts")
+        return table.parse(self.tokenize(string))
+
+    def parse_forest(self, string):
+        """padurea de derivare partajata (SPPF, lfa_core/sppf.py) a sirului, pentru gramatici ambigue
+
+        Padurea are dimensiune polinomiala; forest.count() da numarul de derivari fara enumerare, iar
+        forest.trees(limit) construieste arborii lenes, unul cate unul. Daca sirul este respins,
+        forest.root este None si count() este 0.
+        """
+        if self.recognizer is None:
+            self.compile_recognizer()
+        return build_sppf(self.recognizer, self.tokenize(string))
+
+    def string_generator(self):
+        """generatorul de siruri (lfa_core/generate.py), construit o singura data pe gramatica fara simboluri inutile"""
+        if self.generator is None:
+            self.compiled_grammar()
+            self.generator = StringGenerator(self.trimmed.grammar)
+        return self.generator
+
+    def generate(self, max_length):
+        """generator: toate sirurile limbajului de lungime <= max_length (in terminali), in ordine canonica
+
+        Sirurile apar dupa lungime, apoi lexicografic, fiecare o singura data; sunt produse lenes, deci
+        se pot scrie direct intr-un fisier fara a le tine in memorie.
+        """
+        for tokens in self.string_generator().enumerate(max_length):
+            yield ''.join(tokens)
+
+    def sample(self, length, count=1, seed=None):
+        """count siruri aleatoare de lungime exact length, din tabelul de numarare (fara respingere)
+
+        Distributia este uniforma pe siruri pentru gramaticile neambigue (pentru cele ambigue, pe
+        derivari). seed face esantionarea repetabila. ValueError daca nu exista siruri de aceasta lungime.
+        """
+        generator = self.string_generator()
+        rng = random.Random(seed)
+        return [''.join(generator.sample(length, rng)) for _ in range(count)]
+
+    def tokenize(self, string):
+        """impart sirul de intrare in terminali: la fiecare pozitie cel mai lung terminal declarat
+
+        Terminalii pot avea mai multe caractere (de exemplu 'id'); spatiile sunt ignorate, iar un caracter
+        care nu incepe niciun terminal devine un token separat (deci sirul este respins).
+        """
+        self.compiled_grammar()
+        return self.token_pattern.findall(string)
+
+    def compile_recognizer(self):
+        """compilez gramatica pentru recunoasterea Earley (o singura data, refolosit pentru toate sirurile)"""
+        self.compiled_grammar()
+        self.recognizer = EarleyRecognizer(self.trimmed)
+        return self.recognizer
+
+    def recognize(self, string):
+        """decid daca sirul apartine limbajului (Earley: gramatici ambigue / recursive la stanga, O(n^3))"""
+        if self.recognizer is None:
+            self.compile_recognizer()
+        return self.recognizer.recognize(self.tokenize(string))
+
+    def recognize_many(self, strings, method='cyk'):
+        """recunosc o colectie de siruri cu aceeasi gramatica compilata; intorc un vector NumPy de bool
+
+        method='cyk': CYK bit-parallel pe gramatica in CNF (lfa_core/cyk.py), vectorizat pe loturi de
+        siruri de aceeasi lungime; method='earley': cate un sir pe rand, cu recunoscatorul Earley
+        (mai rapid pentru siruri lungi si gramatici deterministe).
+        """
+        token_lists = [self.tokenize(string) for string in strings]
+        if method == 'earley':
+            if self.recognizer is None:
+                self.compile_recognizer()
+            return np.array([self.recognizer.recognize(tokens) for tokens in token_lists], dtype=bool)
+
+        if self.cyk is None:
+            self.compiled_grammar()
+            self.cyk = BitsetCYK(self.trimmed.grammar)
+        return self.cyk.recognize_many(token_lists)
 
     def is_in_language(self, test_string):
-        """verificam daca un sir de caractere ar putea fi in limbaj (verificare euristica simpla)"""
-        for char in test_string:
+        """verificam daca un sir de caractere este in limbaj (recunoastere Earley)"""
+        for char in self.tokenize(test_string):
             if char not in self.terminals:
                 return False, f"Character '{char}' not in terminals"
 
-        return True, "String uses only terminal symbols"
+        if self.recognize(test_string):
+            return True, "String is in the language (Earley recognizer)"
+        return False, "String is not in the language (Earley recognizer)"
+
+
+def longest_match_pattern(symbols, fallback=None):
+    """expresie regulata care potriveste cel mai lung simbol din multime (sau fallback); None daca e goala"""
+    # alternativele sunt incercate in ordine, deci cele mai lungi primele
+    alternatives = [re.escape(symbol) for symbol in sorted(symbols, key=lambda s: (-len(s), s)) if symbol]
+    if fallback:
+        alternatives.append(fallback)
+    return re.compile('|'.join(alternatives)) if alternatives else None
 
 
 def create_sipser_examples():
@@ -441,11 +677,20 @@ def main():
         print("2. python cfg.py create [output_file]         # Exercise 2: Create interactively")
         print("3. python cfg.py exemple                      # Exercise 3: Create examples")
         print("4. python cfg.py test <config_file> <string>  # Test string derivation")
+        print("5. python cfg.py check <config_file> <strings_file>  # Recognize every line of a file")
+        print("6. python cfg.py cnf <config_file> [output_file]     # Convert to Chomsky Normal Form")
+        print("7. python cfg.py analyze <config_file> [output_file] # Nullable, FIRST/FOLLOW, useless symbols")
+        print("8. python cfg.py tables <config_file> [table_file]   # LL(1) / LALR(1) parse tables")
+        print("9. python cfg.py parse <config_file> <string> [table_file]  # Linear-time parse tree")
+        print("10. python cfg.py forest <config_file> <string> [max_trees] # Parse forest of an ambiguous grammar")
+        print("11. python cfg.py generate <config_file> <max_length>      # Every string up to a length")
+        print("12. python cfg.py sample <config_file> <length> [count] [seed]  # Random strings of a length")
         print("\nExamples:")
         print("python cfg.py load exemple_arithmetic.json")
         print("python cfg.py create my_cfg.json")
         print("python cfg.py exemple")
         print("python cfg.py test exemple_balanced.json '(())'")
+        print("python cfg.py check exemple_arithmetic.json strings.txt")
         return
 
     command = sys.argv[1].lower()
@@ -458,13 +703,7 @@ def main():
 
         config_file = sys.argv[2]
         cfg = CFG()
-
-        if config_file.endswith('.json'):
-            success = cfg.load_from_file(config_file)
-        else:
-            success = cfg.load_from_text_format(config_file)
-
-        if success:
+        if cfg.load_config(config_file):
             cfg.display_info()
 
     elif command == "create":
@@ -509,9 +748,194 @@ def main():
             if valid:
                 cfg.derive_string(test_string)
 
+    elif command == "check":
+        # recunoastere pentru fiecare linie dintr-un fisier (gramatica se compileaza o singura data)
+        if len(sys.argv) != 4:
+            print("❌ Usage: python cfg.py check <config_file> <strings_file>")
+            return
+
+        config_file = sys.argv[2]
+        strings_file = sys.argv[3]
+
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        try:
+            with open(strings_file, 'r', encoding='utf-8') as file:
+                strings = [line.rstrip('\n') for line in file]
+        except FileNotFoundError:
+            print(f"❌ Error: File '{strings_file}' not found")
+            return
+
+        results = cfg.recognize_many(strings)
+        for string, accepted in zip(strings, results):
+            print(f"{'ACCEPT' if accepted else 'REJECT'}\t{string}")
+        print(f"\n📊 {sum(results)} accepted / {len(strings)} strings")
+
+    elif command == "cnf":
+        # conversie in forma normala Chomsky, cu dimensiunea gramaticii dupa fiecare etapa
+        if len(sys.argv) not in (3, 4):
+            print("❌ Usage: python cfg.py cnf <config_file> [output_file]")
+            return
+
+        config_file = sys.argv[2]
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        grammar = cfg.to_grammar()
+        print(f"\n🔧 CNF conversion ({len(grammar.rules)} rules)")
+        for name, stage in CNF_STAGES:
+            grammar = stage(grammar)
+            print(f"  {name:<5} → {len(grammar.rules)} rules, {len(grammar.nonterminals)} variables")
+
+        cnf = CFG().load_grammar(grammar)
+        cnf.display_info()
+        if len(sys.argv) == 4:
+            cnf.save_to_file(sys.argv[3])
+
+    elif command == "analyze":
+        # nullable, FIRST/FOLLOW si eliminarea simbolurilor inutile
+        if len(sys.argv) not in (3, 4):
+            print("❌ Usage: python cfg.py analyze <config_file> [output_file]")
+            return
+
+        config_file = sys.argv[2]
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        cfg.display_analysis()
+        if len(sys.argv) == 4:
+            cleaned = cfg.remove_useless()
+            print(f"\n🧹 Without useless symbols: {sum(len(p) for p in cleaned.rules.values())} rules")
+            cleaned.display_info()
+            cleaned.save_to_file(sys.argv[3])
+
+    elif command in ("tables", "parse"):
+        # tabele LL(1)/LALR(1) si analiza liniara cu arbore de derivare
+        if command == "tables" and len(sys.argv) not in (3, 4):
+            print("❌ Usage: python cfg.py tables <config_file> [table_file]")
+            return
+        if command == "parse" and len(sys.argv) not in (4, 5):
+            print("❌ Usage: python cfg.py parse <config_file> <string> [table_file]")
+            return
+
+        config_file = sys.argv[2]
+        table_file = sys.argv[3] if command == "tables" and len(sys.argv) == 4 else None
+        if command == "parse" and len(sys.argv) == 5:
+            table_file = sys.argv[4]
+
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        # tabelul salvat este refolosit daca a fost generat pentru aceeasi gramatica; fisierul este
+        # suprascris doar daca lipseste sau este un tabel (vechi) al altei gramatici
+        cached = False
+        writable = True
+        if table_file and os.path.exists(table_file):
+            try:
+                if command == "parse":
+                    cached = cfg.load_parse_table(table_file)
+                else:
+                    load_table(table_file)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Ignoring table file (it will not be overwritten): {e}")
+                writable = False
+
+        table = cfg.build_parse_table()
+        source = f"loaded from '{table_file}'" if cached else "generated"
+        print(f"\n📊 {table.kind} table ({source})")
+        if table.conflicts:
+            print(f"❌ {len(table.conflicts)} conflicts:")
+            for conflict in table.conflicts:
+                print(f"  • {conflict}")
+            return
+        if table_file and not cached and writable:
+            cfg.save_parse_table(table_file)
+
+        if command == "parse":
+            tree = cfg.parse(sys.argv[3])
+            if tree is None:
+                print(f"❌ '{sys.argv[3]}' is rejected")
+            else:
+                print(f"✅ '{sys.argv[3]}' parsed:\n{format_tree(tree)}")
+
+    elif command == "forest":
+        # padurea de derivare: numarul de derivari si primii arbori, fara enumerarea tuturor
+        if len(sys.argv) not in (4, 5):
+            print("❌ Usage: python cfg.py forest <config_file> <string> [max_trees]")
+            return
+
+        config_file = sys.argv[2]
+        string = sys.argv[3]
+        try:
+            max_trees = int(sys.argv[4]) if len(sys.argv) == 5 else 3
+        except ValueError:
+            print(f"❌ Invalid max_trees: {sys.argv[4]}")
+            return
+
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        forest = cfg.parse_forest(string)
+        if forest.root is None:
+            print(f"❌ '{string}' is rejected")
+            return
+
+        nodes, packed = forest.size()
+        print(f"\n🌲 Parse forest: {nodes} nodes, {packed} packed alternatives")
+        print(f"📊 Derivations: {forest.count()}")
+        if forest.cyclic:
+            print("⚠️  Cyclic forest (ε/unit cycles): infinitely many derivations, only cycle-free trees are counted")
+        for index, tree in enumerate(forest.trees(max_trees), 1):
+            print(f"\n🌳 Tree {index}:\n{format_tree(tree)}")
+
+    elif command in ("generate", "sample"):
+        # generare de siruri: toate sirurile pana la o lungime sau siruri aleatoare de o lungime data
+        if command == "generate" and len(sys.argv) != 4:
+            print("❌ Usage: python cfg.py generate <config_file> <max_length>")
+            return
+        if command == "sample" and len(sys.argv) not in (4, 5, 6):
+            print("❌ Usage: python cfg.py sample <config_file> <length> [count] [seed]")
+            return
+
+        config_file = sys.argv[2]
+        try:
+            length = int(sys.argv[3])
+            count = int(sys.argv[4]) if len(sys.argv) > 4 else 1
+            seed = int(sys.argv[5]) if len(sys.argv) > 5 else None
+        except ValueError:
+            print("❌ Length, count and seed must be integers")
+            return
+
+        cfg = CFG()
+        if not cfg.load_config(config_file):
+            return
+
+        if command == "generate":
+            total = 0
+            for string in cfg.generate(length):
+                print(string)
+                total += 1
+            print(f"\n📊 {total} strings of length <= {length}")
+        else:
+            try:
+                strings = cfg.sample(length, count, seed)
+            except ValueError as e:
+                print(f"❌ {e}")
+                return
+            for string in strings:
+                print(string)
+            derivations = cfg.string_generator().count(length)
+            print(f"\n📊 {len(strings)} strings sampled from {derivations} derivations of length {length}")
+
     else:
         print(f"❌ Unknown command: {command}")
-        print("Use: load, create, exemple, or test")
+        print("Use: load, create, exemple, test, check, cnf, analyze, tables, parse, forest, generate, or sample")
 
 
 if __name__ == "__main__":
@@ -6,7 +6,16 @@ configuratie corecta. In plus, va afisa pentru string daca este acceptat sau res
 """
 
 
+import os
 import sys
+from array import array
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfa_core.automaton import AutomatonFormatError, load_automaton
+from lfa_core.binary_format import KIND_DFA, open_automaton, write_automaton
+from lfa_core.minimize import hopcroft_minimize
 
 
 class DFA:
@@ -17,77 +26,49 @@ class DFA:
         self.final_states = set()
         self.transitions = {}  # (state, symbol) -> next_state
 
+        # forma compilata (vezi compile): stari si simboluri internate ca indici mici
+        self.state_ids = {}  # state -> id
+        self.symbol_ids = {}  # symbol -> id
+        self.id_to_state = []  # id -> state
+        self.table = None  # array plat: table[state_id * len(symbol_ids) + symbol_id] -> next_id sau -1
+        self.final_flags = None  # bytearray: 1 daca starea cu id-ul respectiv este finala
+        self.start_id = -1
+        self.matrix = None  # tabelul compilat ca matrice NumPy, completat cu o stare/un simbol "mort"
+
+    @property
+    def num_states(self):
+        """numarul de stari (MappedDFA il citeste din antet, fara sa completeze states)"""
+        return len(self.states)
+
     def load_from_file(self, filename):
-        """incarcam DFA ul din fisierul de configurare"""
+        """incarcam DFA ul din fisierul de configurare (parserul comun din lfa_core/automaton.py)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            automaton = load_automaton(filename)
         except FileNotFoundError:
             print(f"❌ Eroare: Fișierul '{filename}' nu a fost găsit.")
             return False
+        except AutomatonFormatError as e:
+            print(f"❌ {e}")
+            return False
         except Exception as e:
             print(f"❌ Eroare la citirea fișierului: {e}")
             return False
 
-        current_section = None
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # ignor liniile goale si comentariile
-            if not line or line.startswith('#'):
-                continue
-
-            # detectez sectiunile
-            if line == "Sigma:":
-                current_section = "sigma"
-                continue
-            elif line == "End":
-                current_section = None
-                continue
-            elif line == "States:":
-                current_section = "states"
-                continue
-            elif line == "Transitions:":
-                current_section = "transitions"
-                continue
-
-            # procesez continutul secțtunilor
-            if current_section == "sigma":
-                self.alphabet.add(line)
-
-            elif current_section == "states":
-                # verific daca starea este finala (se termina cu ,F)
-                if line.endswith(',F'):
-                    state = line[:-2]
-                    self.states.add(state)
-                    self.final_states.add(state)
-                # verific daca starea este de start (se termina cu ,S)
-                elif line.endswith(',S'):
-                    state = line[:-2]
-                    self.states.add(state)
-                    self.start_state = state
-                # verific daca starea este si de start si finala
-                elif ',S,F' in line or ',F,S' in line:
-                    state = line.replace(',S,F', '').replace(',F,S', '')
-                    self.states.add(state)
-                    self.start_state = state
-                    self.final_states.add(state)
-                else:
-                    self.states.add(line)
-
-            elif current_section == "transitions":
-                # parsez tranzitia: stateX, symbolY, stateZ
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) == 3:
-                    from_state, symbol, to_state = parts
-                    self.transitions[(from_state, symbol)] = to_state
-                else:
-                    print(f"❌ Eroare la linia {line_num}: format tranziție invalid '{line}'")
-                    return False
-
+        self.from_automaton(automaton)
         return self.validate_dfa()
 
+    def from_automaton(self, automaton):
+        """preiau un Automaton parsat; pentru aceeasi pereche (stare, simbol) ultima tranzitie castiga"""
+        self.alphabet = automaton.alphabet()
+        self.states = automaton.state_names()
+        self.start_state = automaton.start_state()
+        self.final_states = automaton.final_states()
+        self.transitions = {(from_state, symbol): to_state
+                            for from_state, symbol, to_state in automaton.transitions()}
+        self.table = None
+        self.matrix = None
+        return self
+
     def validate_dfa(self):
         """validez ca automatul este un DFA valid"""
         errors = []
@@ -114,6 +95,58 @@ class DFA:
         print("✅ DFA valid încărcat cu succes!")
         return True
 
+    def save_binary(self, filename):
+        """salvez DFA-ul compilat in formatul binar .lfab (tabel de tranzitii impachetat)"""
+        if self.table is None:
+            self.compile()
+
+        symbols = sorted(self.symbol_ids, key=self.symbol_ids.get)
+        start = self.start_id if self.start_id >= 0 else None
+        write_automaton(filename, KIND_DFA, symbols, self.id_to_state, start, self.final_flags, self.table)
+        print(f"💾 DFA salvat în format binar: '{filename}'")
+
+    def load_binary(self, filename):
+        """incarcam DFA-ul dintr-un fisier .lfab; tabelul compilat este preluat direct, fara recompilare"""
+        try:
+            automaton = open_automaton(filename, use_mmap=False)
+        except FileNotFoundError:
+            print(f"❌ Eroare: Fișierul '{filename}' nu a fost găsit.")
+            return False
+        except ValueError as e:
+            print(f"❌ Eroare la citirea fișierului binar: {e}")
+            return False
+
+        with automaton:
+            if automaton.kind != KIND_DFA:
+                print(f"❌ Eroare: '{filename}' nu conține un DFA")
+                return False
+
+            symbols = automaton.symbols()
+            states = automaton.states()
+            self.alphabet = set(symbols)
+            self.states = set(states)
+            self.transitions = {}
+            self.start_state = states[automaton.start] if automaton.start is not None else None
+            self.final_states = {state for state, flag in zip(states, automaton.finals) if flag}
+
+            num_symbols = len(symbols)
+            self.table = array('i', automaton.table)
+            self.final_flags = bytearray(automaton.finals)
+
+        for state_id, state in enumerate(states):
+            for symbol_id, symbol in enumerate(symbols):
+                target = self.table[state_id * num_symbols + symbol_id]
+                if target >= 0:
+                    self.transitions[(state, symbol)] = states[target]
+
+        self.id_to_state = states
+        self.state_ids = {state: i for i, state in enumerate(states)}
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+        self.start_id = automaton.start if automaton.start is not None else -1
+        self.matrix = None
+
+        return self.validate_dfa()
+
     def accepts(self, input_string):
         """Verific daca DFA accepta string-ul de intrare"""
         if not self.start_state:
@@ -147,6 +180,213 @@ class DFA:
 
         return is_accepted
 
+    def compile(self):
+        """compilez functia de tranzitie intr-un tabel plat indexat prin intregi"""
+        # starea de start primeste id-ul 0, restul in ordine sortata (numerotare determinista)
+        ordered_states = sorted(self.states)
+        if self.start_state in self.states:
+            ordered_states.remove(self.start_state)
+            ordered_states.insert(0, self.start_state)
+
+        self.id_to_state = ordered_states
+        self.state_ids = {state: i for i, state in enumerate(ordered_states)}
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(sorted(self.alphabet))}
+
+        num_symbols = len(self.symbol_ids)
+        table = array('i', [-1]) * (len(ordered_states) * num_symbols)
+        for (from_state, symbol), to_state in self.transitions.items():
+            table[self.state_ids[from_state] * num_symbols + self.symbol_ids[symbol]] = self.state_ids[to_state]
+
+        self.table = table
+        self.final_flags = bytearray(1 if state in self.final_states else 0 for state in ordered_states)
+        self.start_id = self.state_ids.get(self.start_state, -1)
+        self.matrix = None
+        return self
+
+    def minimize(self):
+        """intorc un DFA nou, minimal (Hopcroft); fiecare stare noua pastreaza numele primei stari din clasa ei"""
+        if self.table is None:
+            self.compile()
+
+        minimized = DFA()
+        minimized.alphabet = set(self.alphabet)
+        if self.start_id < 0:
+            return minimized
+
+        new_table, new_finals, block_of = hopcroft_minimize(
+            len(self.id_to_state), len(self.symbol_ids), self.table, self.final_flags, self.start_id)
+
+        # id-urile compilate sunt in ordinea (start, apoi sortat), deci primul reprezentant gasit e cel mai mic
+        names = [None] * len(new_finals)
+        for state_id, block in enumerate(block_of):
+            if block >= 0 and names[block] is None:
+                names[block] = self.id_to_state[state_id]
+
+        symbols = sorted(self.symbol_ids, key=self.symbol_ids.get)
+        num_symbols = len(symbols)
+        minimized.states = set(names)
+        minimized.start_state = names[0]
+        minimized.final_states = {names[block] for block, is_final in enumerate(new_finals) if is_final}
+        for block, name in enumerate(names):
+            for symbol_id, symbol in enumerate(symbols):
+                target = new_table[block * num_symbols + symbol_id]
+                if target >= 0:
+                    minimized.transitions[(name, symbol)] = names[target]
+
+        return minimized
+
+    def accepts_stream(self, stream, chunk_size=64 * 1024, ignore_newlines=True):
+        """verific un text citit in bucati de chunk_size dintr-un fisier deschis (memorie constanta)"""
+        if self.table is None:
+            self.compile()
+        if self.start_id < 0:
+            return False
+
+        # starea curenta se pastreaza de la un chunk la altul
+        state_id = self.start_id
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+            if ignore_newlines:
+                chunk = chunk.replace('\r', '').replace('\n', '')
+            state_id = self.advance(state_id, chunk)
+            if state_id < 0:
+                return False
+
+        return self.final_flags[state_id] == 1
+
+    def grep_stream(self, stream, separator='\n', chunk_size=64 * 1024):
+        """generator in stilul grep: intorc (numar_inregistrare, inregistrare) pentru fiecare inregistrare acceptata"""
+        if self.table is None:
+            self.compile()
+
+        record_num = 0
+        pending = ''
+        while True:
+            chunk = stream.read(chunk_size)
+            if not chunk:
+                break
+
+            # doar inregistrarile complete sunt verificate; restul ramane pentru chunk-ul urmator
+            records = (pending + chunk).split(separator)
+            pending = records.pop()
+            for record in records:
+                record_num += 1
+                if separator == '\n':
+                    record = record.rstrip('\r')
+                if self.accepts_fast(record):
+                    yield record_num, record
+
+        if pending:
+            record_num += 1
+            if separator == '\n':
+                pending = pending.rstrip('\r')
+            if self.accepts_fast(pending):
+                yield record_num, pending
+
+    def build_matrix(self):
+        """construiesc matricea de tranzitie pentru accepts_many (o stare moarta si un simbol necunoscut in plus)"""
+        if self.table is None:
+            self.compile()
+
+        num_states = len(self.id_to_state)
+        num_symbols = len(self.symbol_ids)
+        dead = num_states
+
+        matrix = np.full((num_states + 1, num_symbols + 1), dead, dtype=np.int32)
+        if num_states and num_symbols:
+            compiled = np.frombuffer(self.table, dtype=np.int32).reshape(num_states, num_symbols)
+            matrix[:num_states, :num_symbols] = np.where(compiled < 0, dead, compiled)
+
+        self.matrix = matrix
+        return matrix
+
+    def encode_symbols(self, text):
+        """transform un text in vectorul de id-uri de simboluri (simbolurile necunoscute primesc ultima coloana)"""
+        codepoints = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+        unknown = len(self.symbol_ids)
+
+        # caut fiecare caracter in alfabetul sortat dupa codepoint (simbolurile de mai multe caractere nu pot aparea in input)
+        single = sorted((ord(symbol), symbol_id) for symbol, symbol_id in self.symbol_ids.items() if len(symbol) == 1)
+        if not single:
+            return np.full(len(codepoints), unknown, dtype=np.int32)
+
+        keys = np.array([code for code, _ in single], dtype=np.uint32)
+        values = np.array([symbol_id for _, symbol_id in single], dtype=np.int32)
+        positions = np.minimum(np.searchsorted(keys, codepoints), len(keys) - 1)
+        return np.where(keys[positions] == codepoints, values[positions], unknown).astype(np.int32)
+
+    def step_batch(self, states, symbols):
+        """un pas vectorizat: starile urmatoare pentru perechile (stare, simbol) date"""
+        if self.matrix is None:
+            self.build_matrix()
+        return self.matrix[states, symbols]
+
+    def final_batch(self, states):
+        """vector bool: care dintre starile date sunt finale (starea moarta nu este)"""
+        return np.append(np.frombuffer(self.final_flags, dtype=np.uint8), 0).astype(bool)[states]
+
+    def accepts_many(self, strings):
+        """verific simultan o colectie de string-uri; intorc un vector NumPy de bool (True = acceptat)"""
+        strings = list(strings)
+        if self.table is None:
+            self.compile()
+        if self.start_id < 0 or not strings:
+            return np.zeros(len(strings), dtype=bool)
+
+        lengths = np.fromiter((len(s) for s in strings), dtype=np.int64, count=len(strings))
+        starts = np.zeros(len(strings), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=starts[1:])
+        symbols = self.encode_symbols(''.join(strings))
+
+        # ordonez descrescator dupa lungime: la pasul t string-urile active formeaza un prefix
+        order = np.argsort(-lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        sorted_starts = starts[order]
+        states = np.full(len(strings), self.start_id, dtype=np.int32)
+
+        max_length = int(sorted_lengths[0])
+        # active[t] = numarul de string-uri cu lungimea > t
+        active_counts = len(strings) - np.searchsorted(sorted_lengths[::-1], np.arange(max_length), side='right')
+
+        for step in range(max_length):
+            active = int(active_counts[step])
+            states[:active] = self.step_batch(states[:active], symbols[sorted_starts[:active] + step])
+
+        accepted = np.zeros(len(strings), dtype=bool)
+        accepted[order] = self.final_batch(states)
+        return accepted
+
+    def advance(self, state_id, text):
+        """parcurg tabelul compilat pornind din state_id; intorc id-ul starii atinse sau -1 daca nu exista tranzitie"""
+        if self.table is None:
+            self.compile()
+
+        table = self.table
+        symbol_ids = self.symbol_ids
+        num_symbols = len(symbol_ids)
+
+        for symbol in text:
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                return -1
+            state_id = table[state_id * num_symbols + symbol_id]
+            if state_id < 0:
+                return -1
+
+        return state_id
+
+    def accepts_fast(self, input_string):
+        """varianta silentioasa a lui accepts, pe tabelul compilat (fara tupluri si fara afisari la fiecare pas)"""
+        if self.table is None:
+            self.compile()
+        if self.start_id < 0:
+            return False
+
+        state_id = self.advance(self.start_id, input_string)
+        return state_id >= 0 and self.final_flags[state_id] == 1
+
     def display_info(self):
         """Afișează informații despre DFA"""
         print("\n=== INFORMAȚII DFA ===")
@@ -161,27 +401,227 @@ class DFA:
             print(f"{i:2d}. {from_state} --({symbol})--> {to_state}")
 
 
+class StateNames:
+    """lista read-only a numelor de stari, decodate la cerere din fisierul mapat"""
+
+    def __init__(self, automaton):
+        self.automaton = automaton
+
+    def __len__(self):
+        return self.automaton.num_states
+
+    def __getitem__(self, state_id):
+        if not 0 <= state_id < self.automaton.num_states:
+            raise IndexError(state_id)
+        return self.automaton.state(state_id)
+
+
+class MappedDFA(DFA):
+    """DFA precompilat (.lfab) deschis read-only cu mmap
+
+    Tabelul de tranzitii nu este copiat si nici transformat in dictionar: toate procesele care
+deschid acelasi fisier (sau il mostenesc prin fork) folosesc aceeasi copie din page cache.
+Deschiderea citeste doar antetul si alfabetul, deci costa O(1) fata de numarul de tranzitii.
+    """
+
+    def __init__(self, filename):
+        super().__init__()
+        self.automaton = open_automaton(filename, use_mmap=True)
+        if self.automaton.kind != KIND_DFA:
+            self.automaton.close()
+            raise ValueError(f"'{filename}' nu conține un DFA")
+
+        symbols = self.automaton.symbols()
+        self.alphabet = set(symbols)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(symbols)}
+        self.id_to_state = StateNames(self.automaton)
+        self.table = self.automaton.table  # memoryview peste mmap
+        self.final_flags = self.automaton.finals
+        self.start_id = self.automaton.start if self.automaton.start is not None else -1
+        self.start_state = self.id_to_state[self.start_id] if self.start_id >= 0 else None
+
+    @property
+    def num_states(self):
+        return self.automaton.num_states
+
+    def compile(self):
+        """tabelul este deja compilat in fisier"""
+        return self
+
+    def step_batch(self, states, symbols):
+        """pas vectorizat direct pe tabelul mapat (vedere NumPy fara copiere; -1 = stare moarta)"""
+        table = self.automaton.table_array()
+        num_symbols = len(self.symbol_ids)
+        valid = (states >= 0) & (symbols < num_symbols)
+        result = np.full(len(states), -1, dtype=np.int32)
+        result[valid] = table[states[valid].astype(np.int64) * num_symbols + symbols[valid]]
+        return result
+
+    def final_batch(self, states):
+        """vector bool: care dintre starile date sunt finale"""
+        finals = np.frombuffer(self.final_flags, dtype=np.uint8)
+        result = np.zeros(len(states), dtype=bool)
+        alive = states >= 0
+        result[alive] = finals[states[alive]] == 1
+        return result
+
+    def accepts(self, input_string):
+        """varianta detaliata, pas cu pas, direct pe tabelul mapat"""
+        print(f"\n🔍 Procesez string-ul: '{input_string}'")
+        state_id = self.start_id
+        for i, symbol in enumerate(input_string):
+            next_id = self.advance(state_id, symbol)
+            if next_id < 0:
+                print(f"❌ Nu există tranziție din starea '{self.id_to_state[state_id]}' cu simbolul '{symbol}'")
+                return False
+            print(f"Pas {i + 1}: {self.id_to_state[state_id]} --({symbol})--> {self.id_to_state[next_id]}")
+            state_id = next_id
+
+        is_accepted = self.final_flags[state_id] == 1
+        print(f"📍 Stare finală: {self.id_to_state[state_id]}")
+        if is_accepted:
+            print(f"✅ String-ul '{input_string}' este ACCEPTAT!")
+        else:
+            print(f"❌ String-ul '{input_string}' este RESPINS!")
+        return is_accepted
+
+    def display_info(self):
+        """Afișează un rezumat (tranzițiile nu sunt listate)"""
+        print("\n=== INFORMAȚII DFA (mapat cu mmap) ===")
+        print(f"Alfabet: {sorted(self.alphabet)}")
+        print(f"Numărul de stări: {len(self.id_to_state)}")
+        print(f"Stare de start: {self.start_state}")
+
+    def close(self):
+        """inchid maparea fisierului"""
+        self.table = None
+        self.final_flags = None
+        self.automaton.close()
+
+
+def open_input(path):
+    """deschid fisierul de intrare ('-' inseamna stdin)"""
+    if path == '-':
+        return sys.stdin
+    return open(path, 'r', encoding='utf-8')
+
+
+def run_batch(dfa, strings_file):
+    """testez toate string-urile dintr-un fisier (cate unul pe linie) cu accepts_many"""
+    try:
+        with open_input(strings_file) as file:
+            strings = [line.rstrip('\n') for line in file]
+    except FileNotFoundError:
+        print(f"❌ Eroare: Fișierul '{strings_file}' nu a fost găsit.")
+        return
+
+    results = dfa.accepts_many(strings)
+    for string, accepted in zip(strings, results):
+        print(f"{'ACCEPT' if accepted else 'REJECT'}\t{string}")
+
+    print("\n" + "=" * 50)
+    print(f"📊 {int(results.sum())} acceptate / {len(strings)} string-uri")
+
+
+def run_stream(dfa, input_file):
+    """verific tot continutul fisierului (fara liniile noi) ca un singur string, citit pe bucati"""
+    try:
+        with open_input(input_file) as file:
+            result = dfa.accepts_stream(file)
+    except FileNotFoundError:
+        print(f"❌ Eroare: Fișierul '{input_file}' nu a fost găsit.")
+        return
+
+    if result:
+        print("🎉 REZULTAT: ACCEPT")
+    else:
+        print("🚫 REZULTAT: REJECT")
+
+
+def run_grep(dfa, input_file):
+    """afisez liniile acceptate de DFA, in stilul grep"""
+    try:
+        with open_input(input_file) as file:
+            for line_num, line in dfa.grep_stream(file):
+                print(f"{line_num}:{line}")
+    except FileNotFoundError:
+        print(f"❌ Eroare: Fișierul '{input_file}' nu a fost găsit.")
+
+
+def run_save_binary(dfa, output_file):
+    """salvez DFA-ul (eventual minimizat) in format binar"""
+    dfa.save_binary(output_file)
+
+
+MODES = {
+    '--batch': run_batch,
+    '--stream': run_stream,
+    '--grep': run_grep,
+    '--save-binary': run_save_binary,
+}
+
+
 def main():
-    if len(sys.argv) != 3:
+    args = sys.argv[1:]
+    minimize = '--minimize' in args
+    if minimize:
+        args.remove('--minimize')
+    mapped = '--mmap' in args
+    if mapped:
+        args.remove('--mmap')
+
+    if len(args) not in (2, 3) or (len(args) == 3 and args[1] not in MODES):
         print("❌ Utilizare incorectă!")
         print("📖 Sintaxa corectă:")
         print("python dfa.py dfa_config_file input_string")
+        print("python dfa.py dfa_config_file --batch strings_file")
+        print("python dfa.py dfa_config_file --stream input_file   # '-' pentru stdin")
+        print("python dfa.py dfa_config_file --grep input_file     # '-' pentru stdin")
+        print("python dfa.py dfa_config_file --save-binary output.lfab")
+        print("Opțional: --minimize (minimizează DFA-ul înainte de rulare)")
+        print("Fișierele .lfab (format binar) sunt încărcate direct, fără parsare.")
+        print("Opțional: --mmap (fișierul .lfab este mapat read-only, fără să fie copiat în memorie)")
         print("\n📋 Exemple:")
         print("python dfa.py dfa_input1.txt 1001")
         print("python dfa.py dfa_input2.txt 1101")
+        print("python dfa.py dfa_input1.txt --batch strings.txt")
+        print("python dfa.py --minimize dfa_input3.txt 1101")
+        print("cat log.txt | python dfa.py dfa_input1.txt --grep -")
         return
 
-    config_file = sys.argv[1]
-    input_string = sys.argv[2]
+    config_file = args[0]
 
     print(f"🚀 DFA Engine")
     print("=" * 50)
 
     # creeaza si incarca DFA
     dfa = DFA()
-    if not dfa.load_from_file(config_file):
+    if mapped:
+        try:
+            dfa = MappedDFA(config_file)
+            loaded = True
+        except (OSError, ValueError) as e:
+            print(f"❌ Eroare la maparea fișierului: {e}")
+            loaded = False
+    elif config_file.endswith('.lfab'):
+        loaded = dfa.load_binary(config_file)
+    else:
+        loaded = dfa.load_from_file(config_file)
+    if not loaded:
         return
 
+    if minimize:
+        num_states = dfa.num_states
+        dfa = dfa.minimize()
+        print(f"✂️  DFA minimizat: {num_states} → {dfa.num_states} stări")
+
+    if len(args) == 3:
+        # moduri fara afisare pas cu pas: batch, stream sau grep
+        MODES[args[1]](dfa, args[2])
+        return
+
+    input_string = args[1]
+
     # afisez informatii despre DFA
     dfa.display_info()
 
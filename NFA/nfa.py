@@ -6,8 +6,16 @@ configuratie corecta. In plus, va afisa pentru string daca este acceptat sau res
 """
 
 
+import itertools
+import os
 import sys
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfa_core.automaton import Automaton, AutomatonFormatError, load_automaton
+from lfa_core.binary_format import KIND_NFA, open_automaton
+from lfa_core.bitset import build_step_tables, step_mask
+from lfa_core.closure import epsilon_closures
 
 
 class NFA:
@@ -17,85 +25,52 @@ class NFA:
         self.start_state = None
         self.final_states = set()
         self.transitions = defaultdict(lambda: defaultdict(list))  # state -> symbol -> [next_states]
+        self.closure_cache = None  # state -> frozenset, ε-closure precalculata (vezi build_closure_cache)
+        self.lazy_dfa = None  # cache-ul de determinizare la cerere (vezi accepts_lazy)
+
+        # forma compilata (vezi compile): multimile de stari sunt bitmask-uri intregi
+        self.state_ids = {}  # state -> id (bitul id din masca)
+        self.symbol_ids = {}  # symbol -> id (fara ε)
+        self.id_to_state = []
+        self.step_tables = None  # step_tables[symbol_id][byte_index][byte_value] -> masca succesorilor (cu ε-closure)
+        self.start_mask = 0
+        self.final_mask = 0
 
     def load_from_file(self, filename):
-        """incarcam NFA-ul din fisierul de configurare"""
+        """incarcam NFA-ul din fisierul de configurare (parserul comun din lfa_core/automaton.py)"""
         try:
-            with open(filename, 'r', encoding='utf-8') as file:
-                lines = file.readlines()
+            # 'epsilon' si 'eps' sunt aduse la forma standard 'ε'
+            automaton = load_automaton(filename, normalize_epsilon=True)
         except FileNotFoundError:
             print(f"❌ Eroare: Fișierul '{filename}' nu a fost găsit.")
             return False
+        except AutomatonFormatError as e:
+            print(f"❌ {e}")
+            return False
         except Exception as e:
             print(f"❌ Eroare la citirea fișierului: {e}")
             return False
 
-        current_section = None
-
-        for line_num, line in enumerate(lines, 1):
-            line = line.strip()
-
-            # ignor liniile goale si comentariile
-            if not line or line.startswith('#'):
-                continue
-
-            # detectez sectiunile
-            if line == "Sigma:":
-                current_section = "sigma"
-                continue
-            elif line == "End":
-                current_section = None
-                continue
-            elif line == "States:":
-                current_section = "states"
-                continue
-            elif line == "Transitions:":
-                current_section = "transitions"
-                continue
+        self.from_automaton(automaton)
+        if not self.validate_nfa():
+            return False
 
-            # procesez continutul sectiunilor
-            if current_section == "sigma":
-                # adaug simbolul in alfabet (inclusiv epsilon dacă este specificat)
-                if line in ['ε', 'epsilon', 'eps']:
-                    self.alphabet.add('ε')
-                else:
-                    self.alphabet.add(line)
-
-            elif current_section == "states":
-                # verific daca starea este finala (se termina cu ,F)
-                if line.endswith(',F'):
-                    state = line[:-2]
-                    self.states.add(state)
-                    self.final_states.add(state)
-                # verific daca starea este de start (se termina cu ,S)
-                elif line.endswith(',S'):
-                    state = line[:-2]
-                    self.states.add(state)
-                    self.start_state = state
-                # verific daca starea este si de start si finala
-                elif ',S,F' in line or ',F,S' in line:
-                    state = line.replace(',S,F', '').replace(',F,S', '')
-                    self.states.add(state)
-                    self.start_state = state
-                    self.final_states.add(state)
-                else:
-                    self.states.add(line)
-
-            elif current_section == "transitions":
-                # parsez tranzitia: stateX, symbolY, stateZ
-                # pentru NFA, pot avea multiple tranzitii pentru aceeasi combinatie
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) == 3:
-                    from_state, symbol, to_state = parts
-                    # convertesc epsilon in forma standard
-                    if symbol in ['epsilon', 'eps']:
-                        symbol = 'ε'
-                    self.transitions[from_state][symbol].append(to_state)
-                else:
-                    print(f"❌ Eroare la linia {line_num}: format tranziție invalid '{line}'")
-                    return False
+        self.build_closure_cache()
+        return True
 
-        return self.validate_nfa()
+    def from_automaton(self, automaton):
+        """preiau un Automaton parsat (pentru NFA pot exista mai multe tranzitii pe aceeasi pereche)"""
+        self.alphabet = automaton.alphabet()
+        self.states = automaton.state_names()
+        self.start_state = automaton.start_state()
+        self.final_states = automaton.final_states()
+        self.transitions = defaultdict(lambda: defaultdict(list))
+        for from_state, symbol, to_state in automaton.transitions():
+            self.transitions[from_state][symbol].append(to_state)
+        self.closure_cache = None
+        self.lazy_dfa = None
+        self.step_tables = None
+        return self
 
     def validate_nfa(self):
         """validez ca automatul este un NFA valid"""
@@ -127,20 +102,64 @@ class NFA:
         print("✅ NFA valid încărcat cu succes!")
         return True
 
+    def to_automaton(self):
+        """NFA-ul ca Automaton internat, cu starile in ordinea compilata (start primul)"""
+        if self.step_tables is None:
+            self.compile()
+
+        automaton = Automaton()
+        for symbol in sorted(self.symbol_ids, key=self.symbol_ids.get):
+            automaton.add_symbol(symbol)
+        for state in self.id_to_state:
+            automaton.add_state(state, start=state == self.start_state, final=state in self.final_states)
+        for state in self.id_to_state:
+            for symbol, next_states in self.transitions.get(state, {}).items():
+                for next_state in next_states:
+                    automaton.add_transition(state, symbol, next_state)
+        return automaton
+
+    def save_binary(self, filename):
+        """salvez NFA-ul in formatul binar .lfab (tranzitii impachetate pe (stare, simbol), ε ultimul)"""
+        self.to_automaton().save_binary(filename, KIND_NFA)
+        print(f"💾 NFA salvat în format binar: '{filename}'")
+
+    def load_binary(self, filename):
+        """incarcam NFA-ul dintr-un fisier .lfab"""
+        try:
+            binary = open_automaton(filename, use_mmap=False)
+        except FileNotFoundError:
+            print(f"❌ Eroare: Fișierul '{filename}' nu a fost găsit.")
+            return False
+        except ValueError as e:
+            print(f"❌ Eroare la citirea fișierului binar: {e}")
+            return False
+
+        with binary:
+            if binary.kind != KIND_NFA:
+                print(f"❌ Eroare: '{filename}' nu conține un NFA")
+                return False
+            self.from_automaton(Automaton.from_binary(binary))
+
+        if not self.validate_nfa():
+            return False
+
+        self.build_closure_cache()
+        return True
+
+    def build_closure_cache(self):
+        """precalculez o singura data ε-closure pentru fiecare stare (condensare in componente tare conexe)"""
+        epsilon_edges = {state: symbols['ε'] for state, symbols in self.transitions.items() if 'ε' in symbols}
+        self.closure_cache = epsilon_closures(sorted(self.states), epsilon_edges)
+        return self.closure_cache
+
     def epsilon_closure(self, states):
-        """calculez epsilon-closure pentru un set de stari"""
-        closure = set(states)
-        stack = list(states)
-
-        while stack:
-            state = stack.pop()
-            # verific pentru tranzitii epsilon
-            if 'ε' in self.transitions[state]:
-                for next_state in self.transitions[state]['ε']:
-                    if next_state not in closure:
-                        closure.add(next_state)
-                        stack.append(next_state)
+        """calculez epsilon-closure pentru un set de stari, ca reuniune a inchiderilor precalculate"""
+        if self.closure_cache is None:
+            self.build_closure_cache()
 
+        closure = set()
+        for state in states:
+            closure |= self.closure_cache.get(state, {state})
         return closure
 
     def move(self, states, symbol):
@@ -151,6 +170,81 @@ class NFA:
                 result.update(self.transitions[state][symbol])
         return result
 
+    def states_to_mask(self, states):
+        """transform o multime de stari in bitmask (forma compilata)"""
+        mask = 0
+        for state in states:
+            mask |= 1 << self.state_ids[state]
+        return mask
+
+    def mask_to_states(self, mask):
+        """transform un bitmask inapoi in multimea de stari"""
+        states = set()
+        state_id = 0
+        while mask:
+            if mask & 1:
+                states.add(self.id_to_state[state_id])
+            mask >>= 1
+            state_id += 1
+        return states
+
+    def compile(self):
+        """numerotez starile si precalculez, pentru fiecare simbol, mastile succesorilor (inclusiv ε-closure)"""
+        ordered_states = sorted(self.states)
+        if self.start_state in self.states:
+            ordered_states.remove(self.start_state)
+            ordered_states.insert(0, self.start_state)
+
+        self.id_to_state = ordered_states
+        self.state_ids = {state: i for i, state in enumerate(ordered_states)}
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(sorted(self.alphabet - {'ε'}))}
+
+        closure_masks = [self.states_to_mask(self.epsilon_closure({state})) for state in ordered_states]
+
+        self.step_tables = []
+        for symbol in sorted(self.symbol_ids, key=self.symbol_ids.get):
+            # succesorii fiecarei stari pe simbol, urmati de ε-closure
+            successors = []
+            for state in ordered_states:
+                mask = 0
+                for next_state in self.transitions[state].get(symbol, []):
+                    mask |= closure_masks[self.state_ids[next_state]]
+                successors.append(mask)
+            self.step_tables.append(build_step_tables(successors))
+
+        self.start_mask = closure_masks[0] if self.start_state in self.state_ids else 0
+        self.final_mask = self.states_to_mask(self.final_states & self.states)
+        return self
+
+    def step_mask(self, mask, symbol_id):
+        """un pas al simularii pe bitmask-uri: OR intre intrarile precalculate pentru fiecare octet nenul"""
+        return step_mask(self.step_tables[symbol_id], mask)
+
+    def accepts_fast(self, input_string):
+        """varianta silentioasa a lui accepts, pe bitmask-uri precalculate (fara multimi de string-uri)"""
+        if self.step_tables is None:
+            self.compile()
+        if not self.start_mask:
+            return False
+
+        symbol_ids = self.symbol_ids
+        mask = self.start_mask
+        for symbol in input_string:
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                return False
+            mask = self.step_mask(mask, symbol_id)
+            if not mask:
+                return False
+
+        return (mask & self.final_mask) != 0
+
+    def accepts_lazy(self, input_string, memory_budget=1 << 20):
+        """verific string-ul cu un DFA construit la cerere (doar starile atinse de input), cu memorie limitata"""
+        if self.lazy_dfa is None or self.lazy_dfa.memory_budget != memory_budget:
+            self.lazy_dfa = LazyDFA(self, memory_budget)
+        return self.lazy_dfa.accepts(input_string)
+
     def accepts(self, input_string):
         """verific daca NFA accepta string-ul de intrare"""
         if not self.start_state:
@@ -234,49 +328,200 @@ class NFA:
         print(f"📊 Tranziții nondeterministice: {nondeterministic_transitions}")
         print(f"📊 Tranziții epsilon: {epsilon_transitions}")
 
-    def get_computation_tree(self, input_string, max_depth=10):
-        """generez arborele de computatie pentru un string (pentru debugging)"""
+    def build_computation_dag(self, input_string):
+        """construiesc graful de computatie stratificat (trellis) pentru un string
+
+        layers[i] este un dictionar stare -> tuplu de predecesori din layers[i - 1]: fiecare nod
+    (pozitie, stare) apare o singura data, iar caile sunt refacute prin pointerii inapoi.
+        """
         if not self.start_state:
             return []
 
-        # structura: (stare_curenta, poziție_in_string, istoric_path)
-        initial_states = self.epsilon_closure({self.start_state})
-        queue = [(state, 0, [state]) for state in initial_states]
-        all_paths = []
+        current = {state: () for state in self.epsilon_closure({self.start_state})}
+        layers = [current]
+
+        for symbol in input_string:
+            next_layer = {}
+            for state in current:
+                for next_state in self.transitions.get(state, {}).get(symbol, []):
+                    # starea urmatoare, urmata de ε-closure
+                    for eps_state in self.epsilon_closure({next_state}):
+                        next_layer.setdefault(eps_state, {})[state] = None
+
+            current = {state: tuple(sorted(predecessors)) for state, predecessors in next_layer.items()}
+            layers.append(current)
+            if not current:
+                break
+
+        return layers
+
+    def count_computation_paths(self, layers):
+        """numar caile complete din graf (total si acceptate) fara sa le enumer"""
+        if not layers:
+            return 0, 0
+
+        counts = {state: 1 for state in layers[0]}
+        for layer in layers[1:]:
+            counts = {state: sum(counts[p] for p in predecessors) for state, predecessors in layer.items()}
+
+        total = sum(counts.values())
+        accepted = sum(count for state, count in counts.items() if state in self.final_states)
+        return total, accepted
+
+    def get_computation_tree(self, input_string):
+        """generator pentru caile de computatie ale unui string (pentru debugging), produse pe rand din graf"""
+        layers = self.build_computation_dag(input_string)
+        last = len(input_string)
+        if len(layers) != last + 1:
+            return
+
+        for end_state in sorted(layers[last]):
+            is_accepting = end_state in self.final_states
+            chain = [end_state]  # starile caii curente, de la final spre inceput
+
+            if last == 0:
+                yield [end_state], is_accepting
+                continue
 
-        while queue and len(all_paths) < 100:  # limitez numarul de cai pentru performanta
-            current_state, pos, path = queue.pop(0)
+            stack = [iter(layers[last][end_state])]
+            while stack:
+                predecessor = next(stack[-1], None)
+                if predecessor is None:
+                    stack.pop()
+                    chain.pop()
+                    continue
+
+                chain.append(predecessor)
+                position = last - len(chain) + 1
+                if position > 0:
+                    stack.append(iter(layers[position][predecessor]))
+                    continue
+
+                # am ajuns la inceputul string-ului: refac calea in ordinea normala
+                states = chain[::-1]
+                path = [states[0]]
+                for symbol, state in zip(input_string, states[1:]):
+                    path.extend([f"--{symbol}-->", state])
+                yield path, is_accepting
+                chain.pop()
+
+
+class LazyDFA:
+    """determinizare la cerere a unui NFA, in stilul RE2
+
+    O stare DFA este o masca de stari NFA (forma compilata a lui NFA). Starile si tranzitiile sunt
+create doar cand input-ul ajunge la ele si sunt tinute intr-un tabel LRU limitat de memory_budget
+(octeti, estimati): fiecare folosire a unei stari, din cache sau nou calculata, o muta la final,
+iar la depasire este eliminata starea folosita cel mai demult. Cand cache-ul se goleste prea des (thrashing), restul input-ului este simulat
+direct pe bitmask-uri, fara cache.
+    """
+
+    # structura unui rand: [masca, este_finala, este_in_cache, urmatorul_rand_pe_simbolul_0, ...]
+    MASK, FINAL, ALIVE, NEXT = 0, 1, 2, 3
+
+    def __init__(self, nfa, memory_budget=1 << 20, thrash_ratio=0.5):
+        if nfa.step_tables is None:
+            nfa.compile()
+
+        self.nfa = nfa
+        self.memory_budget = memory_budget
+        self.thrash_ratio = thrash_ratio
+        self.rows = OrderedDict()  # masca -> rand, in ordinea LRU
+
+        # cost estimat al unei stari: lista randului, masca (int) si intrarea din dictionar
+        num_symbols = len(nfa.symbol_ids)
+        state_cost = 56 + 8 * (num_symbols + 3) + 28 + len(nfa.id_to_state) // 8 + 100
+        self.max_states = max(2, memory_budget // state_cost)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.fallbacks = 0
+
+    def get_row(self, mask):
+        """intorc randul pentru masca data, creandu-l (si eliminand cel mai vechi rand) daca este nevoie"""
+        row = self.rows.get(mask)
+        if row is not None:
+            self.rows.move_to_end(mask)
+            return row
+
+        row = [mask, (mask & self.nfa.final_mask) != 0, True] + [None] * len(self.nfa.symbol_ids)
+        self.rows[mask] = row
+        if len(self.rows) > self.max_states:
+            _, evicted = self.rows.popitem(last=False)
+            # randul eliminat nu mai retine vecinii; cine il refera il va recalcula
+            evicted[self.ALIVE] = False
+            del evicted[self.NEXT:]
+            self.evictions += 1
+        return row
 
-            # daca am procesat tot string-ul
-            if pos == len(input_string):
-                is_accepting = current_state in self.final_states
-                all_paths.append((path, is_accepting))
-                continue
+    def accepts(self, input_string):
+        """verific string-ul folosind (si completand) cache-ul de stari DFA"""
+        nfa = self.nfa
+        if not nfa.start_mask:
+            return False
 
-            # daca am depasit adancimea maxima
-            if len(path) > max_depth:
-                continue
+        symbol_ids = nfa.symbol_ids
+        row = self.get_row(nfa.start_mask)
+        steps = 0
+        misses = 0
+        evictions_before = self.evictions
 
-            symbol = input_string[pos]
-            if symbol in self.transitions[current_state]:
-                for next_state in self.transitions[current_state][symbol]:
-                    # calculez epsilon-closure pentru urmatoarea stare
-                    epsilon_closure = self.epsilon_closure({next_state})
-                    for eps_state in epsilon_closure:
-                        new_path = path + [f"--{symbol}-->", eps_state]
-                        queue.append((eps_state, pos + 1, new_path))
+        for position, symbol in enumerate(input_string):
+            symbol_id = symbol_ids.get(symbol)
+            if symbol_id is None:
+                return False
 
-        return all_paths
+            next_row = row[self.NEXT + symbol_id] if row[self.ALIVE] else None
+            if next_row is None or not next_row[self.ALIVE]:
+                misses += 1
+                next_mask = nfa.step_mask(row[self.MASK], symbol_id)
+                if not next_mask:
+                    return False
+                next_row = self.get_row(next_mask)
+                if row[self.ALIVE]:
+                    row[self.NEXT + symbol_id] = next_row
+            else:
+                # pas din cache: reimprospatez si aici ordinea LRU, altfel starile fierbinti
+                # inserate devreme ar fi primele eliminate
+                self.rows.move_to_end(next_row[self.MASK])
+            row = next_row
+            steps += 1
+
+            # thrashing: am golit cel putin un cache intreg si majoritatea pasilor sunt ratari
+            if self.evictions - evictions_before > self.max_states and misses > self.thrash_ratio * steps:
+                self.fallbacks += 1
+                self.hits += steps - misses
+                self.misses += misses
+                return self.simulate(row[self.MASK], input_string[position + 1:])
+
+        self.hits += steps - misses
+        self.misses += misses
+        return row[self.FINAL]
+
+    def simulate(self, mask, rest):
+        """continui simularea pe bitmask-uri, fara cache"""
+        nfa = self.nfa
+        for symbol in rest:
+            symbol_id = nfa.symbol_ids.get(symbol)
+            if symbol_id is None:
+                return False
+            mask = nfa.step_mask(mask, symbol_id)
+            if not mask:
+                return False
+        return (mask & nfa.final_mask) != 0
 
 
 def main():
-    if len(sys.argv) != 3:
+    if len(sys.argv) not in (3, 4) or (len(sys.argv) == 4 and sys.argv[2] != '--save-binary'):
         print("❌ Utilizare incorectă!")
         print("📖 Sintaxa corectă:")
         print("python nfa.py nfa_config_file input_string")
+        print("python nfa.py nfa_config_file --save-binary output.lfab")
         print("\n📋 Exemple:")
         print("python nfa.py nfa_input1.txt 1001")
         print("python nfa.py nfa_input2.txt ab")
+        print("python nfa.py nfa_input1.lfab 1001")
         print("\n📝 Format fișier configurare:")
         print("Sigma:")
         print("0")
@@ -298,16 +543,25 @@ def main():
         return
 
     config_file = sys.argv[1]
-    input_string = sys.argv[2]
 
     print(f"🚀 NFA Engine")
     print("=" * 50)
 
-    # creez si incarc NFA
+    # creez si incarc NFA (fisierele .lfab sunt in format binar)
     nfa = NFA()
-    if not nfa.load_from_file(config_file):
+    if config_file.endswith('.lfab'):
+        loaded = nfa.load_binary(config_file)
+    else:
+        loaded = nfa.load_from_file(config_file)
+    if not loaded:
+        return
+
+    if len(sys.argv) == 4:
+        nfa.save_binary(sys.argv[3])
         return
 
+    input_string = sys.argv[2]
+
     # afisez informatii despre NFA
     nfa.display_info()
 
@@ -322,15 +576,19 @@ def main():
     else:
         print("🚫 REZULTAT: REJECT")
 
-    # optional: afisez arborele de computatie pentru string-uri scurte
-    if len(input_string) <= 5:
-        print(f"\n🌳 ARBORE DE COMPUTAȚIE pentru '{input_string}':")
-        paths = nfa.get_computation_tree(input_string)
-        for i, (path, is_accepting) in enumerate(paths[:10], 1):  # afisez primele 10 cai
+    # afisez graful de computatie; caile sunt generate pe rand, doar primele 10
+    layers = nfa.build_computation_dag(input_string)
+    total_paths, accepting_paths = nfa.count_computation_paths(layers)
+    print(f"\n🌳 GRAF DE COMPUTAȚIE pentru '{input_string}':")
+    print(f"📊 Noduri (poziție, stare): {sum(len(layer) for layer in layers)}")
+    print(f"📊 Căi complete: {total_paths} (acceptate: {accepting_paths})")
+
+    if len(input_string) <= 20:
+        for i, (path, is_accepting) in enumerate(itertools.islice(nfa.get_computation_tree(input_string), 10), 1):
             status = "✅ ACCEPT" if is_accepting else "❌ REJECT"
             print(f"{i:2d}. {' '.join(map(str, path))} → {status}")
-        if len(paths) > 10:
-            print(f"    ... și încă {len(paths) - 10} căi")
+        if total_paths > 10:
+            print(f"    ... și încă {total_paths - 10} căi")
 
 
 if __name__ == "__main__":
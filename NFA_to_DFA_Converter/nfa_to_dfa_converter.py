@@ -7,36 +7,99 @@ conversia intr un automat finit determinist (dfa_output1.json).
 
 
 
+import os
 import sys
 import json
 from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from lfa_core.automaton import Automaton
+from lfa_core.binary_format import KIND_DFA, KIND_NFA, open_automaton
+from lfa_core.bitset import build_step_tables
+from lfa_core.closure import epsilon_closures
+from lfa_core.json_stream import find_json_member, load_json
+from lfa_core.minimize import hopcroft_minimize
+
+
+# tabelele de mutare din fiecare proces worker (setate o singura data, de init_worker)
+WORKER_TABLES = {}
+
+
+def expand_subsets(step_tables, num_bytes, masks):
+    """Calculeaza, pentru fiecare submultime (bitmask), mastile urmatoare pe fiecare simbol (0 = fara tranzitie)"""
+    results = []
+    for mask in masks:
+        mask_bytes = [(i, value) for i, value in enumerate(mask.to_bytes(num_bytes, 'little')) if value]
+        next_masks = []
+        for byte_tables in step_tables:
+            next_mask = 0
+            for byte_index, value in mask_bytes:
+                next_mask |= byte_tables[byte_index][value]
+            next_masks.append(next_mask)
+        results.append(next_masks)
+    return results
+
+
+def init_worker(step_tables, num_bytes):
+    """Initializeaza un proces worker cu tabelele de mutare"""
+    WORKER_TABLES['step_tables'] = step_tables
+    WORKER_TABLES['num_bytes'] = num_bytes
+
+
+def expand_in_worker(masks):
+    """Expandeaza o bucata din frontiera BFS intr-un proces worker"""
+    return expand_subsets(WORKER_TABLES['step_tables'], WORKER_TABLES['num_bytes'], masks)
 
 
 class NFAToDFAConverter:
     def __init__(self, nfa_config_file, nfa_example_key=None):
         """Initializeaza convertorul cu fișierul NFA de configuratie"""
         self.nfa = self.load_nfa_config(nfa_config_file, nfa_example_key)
+        self.closure_cache = self.build_closure_cache()
         self.dfa_states = {}
         self.dfa_transitions = {}
         self.dfa_final_states = set()
 
+    def load_nfa_binary(self, filename):
+        """Incarca un NFA salvat in format binar (.lfab) in configuratia de tip dictionar"""
+        try:
+            automaton = open_automaton(filename, use_mmap=False)
+        except FileNotFoundError:
+            print(f"Error: File '{filename}' not found")
+            sys.exit(1)
+        except ValueError as e:
+            print(f"Error: Invalid binary automaton '{filename}': {e}")
+            sys.exit(1)
+
+        with automaton:
+            if automaton.kind != KIND_NFA:
+                print(f"Error: '{filename}' does not contain an NFA")
+                sys.exit(1)
+
+            return Automaton.from_binary(automaton).to_config()
+
     def load_nfa_config(self, filename, nfa_example_key=None):
         """Incarca configuratia NFA din fisier"""
-        try:
-            with open(filename, 'r') as f:
-                data = json.load(f)
+        if filename.endswith('.lfab'):
+            return self.load_nfa_binary(filename)
 
-            # daca fisierul contine multiple exemple de NFA
-            if nfa_example_key:
-                if nfa_example_key not in data:
+        try:
+            # fisierul este parsat incremental, pe evenimente; se construieste doar NFA-ul cerut
+            with open(filename, 'r', encoding='utf-8') as f:
+                if nfa_example_key:
+                    found, result = find_json_member(f, nfa_example_key)
+                    if found:
+                        return result
                     print(f"Error: NFA example '{nfa_example_key}' not found in file")
-                    available_keys = [k for k in data.keys() if k != 'comment']
+                    available_keys = [k for k in result if k != 'comment']
                     print(f"Available examples: {available_keys}")
                     sys.exit(1)
-                return data[nfa_example_key]
+
+                data = load_json(f)
 
             # daca este un singur NFA direct în fisier
-            elif 'states' in data and 'alphabet' in data:
+            if 'states' in data and 'alphabet' in data:
                 return data
 
             # daca fisierul contine exemple multiple, afisează optiunile
@@ -57,22 +120,21 @@ class NFAToDFAConverter:
             print(f"Error: Invalid JSON format in '{filename}'")
             sys.exit(1)
 
-    def epsilon_closure(self, states):
-        """Calculeaza epsilon-closure pentru un set de stari"""
-        closure = set(states)
-        stack = list(states)
-
-        while stack:
-            state = stack.pop()
-            # verific pentru tranzitii epsilon
-            if state in self.nfa.get('transitions', {}):
-                for symbol, next_states in self.nfa['transitions'][state].items():
-                    if symbol == 'ε' or symbol == 'epsilon':
-                        for next_state in next_states:
-                            if next_state not in closure:
-                                closure.add(next_state)
-                                stack.append(next_state)
+    def build_closure_cache(self):
+        """Precalculeaza o singura data epsilon-closure pentru fiecare stare NFA"""
+        epsilon_edges = defaultdict(list)
+        for state, transitions in self.nfa.get('transitions', {}).items():
+            for symbol, next_states in transitions.items():
+                if symbol == 'ε' or symbol == 'epsilon':
+                    epsilon_edges[state].extend(next_states)
+        # si sursele ε nedeclarate (stari folosite doar in tranzitii), ca inchiderile lor sa fie complete
+        return epsilon_closures(list(self.nfa.get('states', [])) + list(epsilon_edges), epsilon_edges)
 
+    def epsilon_closure(self, states):
+        """Calculeaza epsilon-closure pentru un set de stari, ca reuniune a inchiderilor precalculate"""
+        closure = set()
+        for state in states:
+            closure |= self.closure_cache.get(state, {state})
         return frozenset(closure)
 
     def move(self, states, symbol):
@@ -160,12 +222,227 @@ class NFAToDFAConverter:
 
         return dfa_config
 
+    def nfa_states(self):
+        """Starile NFA numerotate: cele declarate, apoi cele folosite fara declarare (ca in convert_to_dfa)
+
+        Conversia implicita accepta tranzitii spre stari nedeclarate (sau un start nedeclarat), deci si
+        varianta pe bitmask-uri le interneaza, in ordinea primei aparitii, in loc sa esueze cu KeyError.
+        """
+        states = list(dict.fromkeys(self.nfa['states']))
+        known = set(states)
+
+        def intern(state):
+            if state not in known:
+                known.add(state)
+                states.append(state)
+
+        for state, transitions in self.nfa.get('transitions', {}).items():
+            intern(state)
+            for next_states in transitions.values():
+                for next_state in next_states:
+                    intern(next_state)
+        intern(self.nfa['start_state'])
+        for state in self.nfa['final_states']:
+            intern(state)
+        for closure in self.closure_cache.values():
+            for state in closure:
+                intern(state)
+        return states
+
+    def compile_nfa(self):
+        """Numeroteaza starile NFA si precalculeaza, pe simbol, tabelele de succesori pe bitmask-uri"""
+        transitions = self.nfa.get('transitions', {})
+        states = self.nfa_states()
+        state_ids = {state: i for i, state in enumerate(states)}
+        alphabet = [sym for sym in self.nfa['alphabet'] if sym not in ['ε', 'epsilon']]
+
+        closure_masks = []
+        for state in states:
+            mask = 0
+            for closure_state in self.closure_cache.get(state, {state}):
+                mask |= 1 << state_ids[closure_state]
+            closure_masks.append(mask)
+
+        step_tables = []
+        for symbol in alphabet:
+            # succesorii pe simbol ai fiecarei stari, deja inchisi la epsilon
+            successors = []
+            for state in states:
+                mask = 0
+                for next_state in transitions.get(state, {}).get(symbol, []):
+                    mask |= closure_masks[state_ids[next_state]]
+                successors.append(mask)
+            step_tables.append(build_step_tables(successors))
+
+        start_mask = closure_masks[state_ids[self.nfa['start_state']]]
+        final_mask = 0
+        for state in self.nfa['final_states']:
+            final_mask |= 1 << state_ids[state]
+
+        return alphabet, step_tables, start_mask, final_mask
+
+    def subset_construction(self):
+        """Constructia subseturilor pe bitmask-uri; intoarce (alfabet, randuri, finale) cu stari DFA numerotate BFS"""
+        alphabet, step_tables, start_mask, final_mask = self.compile_nfa()
+        num_bytes = (len(self.nfa_states()) + 7) // 8
+
+        masks = [start_mask]  # id -> submultimea de stari NFA
+        mask_ids = {start_mask: 0}  # submultime -> id (deduplicare)
+        rows = []  # rows[id][symbol_id] -> id-ul starii urmatoare sau -1
+        finals = []
+
+        next_id = 0
+        while next_id < len(masks):
+            mask = masks[next_id]
+            next_id += 1
+            finals.append((mask & final_mask) != 0)
+
+            mask_bytes = list(enumerate(mask.to_bytes(num_bytes, 'little')))
+            row = []
+            for byte_tables in step_tables:
+                next_mask = 0
+                for byte_index, value in mask_bytes:
+                    if value:
+                        next_mask |= byte_tables[byte_index][value]
+
+                if not next_mask:
+                    row.append(-1)
+                    continue
+
+                target = mask_ids.get(next_mask)
+                if target is None:
+                    target = len(masks)
+                    mask_ids[next_mask] = target
+                    masks.append(next_mask)
+                row.append(target)
+            rows.append(row)
+
+        return alphabet, rows, finals
+
+    def subset_construction_parallel(self, workers=None, chunk_size=4096):
+        """Constructia subseturilor cu un pool de procese; aceeasi numerotare ca subset_construction
+
+        BFS-ul avanseaza pe niveluri: frontiera curenta este impartita in bucati expandate in paralel,
+    iar deduplicarea si numerotarea se fac in procesul principal, in ordinea frontierei, deci
+    rezultatul este identic cu cel secvential (fisiere de iesire reproductibile).
+        """
+        alphabet, step_tables, start_mask, final_mask = self.compile_nfa()
+        num_bytes = (len(self.nfa_states()) + 7) // 8
+
+        masks = [start_mask]
+        mask_ids = {start_mask: 0}
+        rows = []
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker,
+                                 initargs=(step_tables, num_bytes)) as pool:
+            level_start = 0
+            while level_start < len(masks):
+                frontier = masks[level_start:]
+                level_start = len(masks)
+
+                # frontierele mici nu merita trimise in alte procese
+                if len(frontier) <= chunk_size:
+                    expanded = [expand_subsets(step_tables, num_bytes, frontier)]
+                else:
+                    chunks = [frontier[i:i + chunk_size] for i in range(0, len(frontier), chunk_size)]
+                    expanded = pool.map(expand_in_worker, chunks)
+
+                for chunk_result in expanded:
+                    for next_masks in chunk_result:
+                        row = []
+                        for next_mask in next_masks:
+                            if not next_mask:
+                                row.append(-1)
+                                continue
+                            target = mask_ids.get(next_mask)
+                            if target is None:
+                                target = len(masks)
+                                mask_ids[next_mask] = target
+                                masks.append(next_mask)
+                            row.append(target)
+                        rows.append(row)
+
+        finals = [(mask & final_mask) != 0 for mask in masks]
+        return alphabet, rows, finals
+
+    def convert_to_dfa_parallel(self, workers=None):
+        """Conversie silentioasa NFA -> DFA pe mai multe procese (vezi subset_construction_parallel)"""
+        alphabet, rows, finals = self.subset_construction_parallel(workers)
+        return self.build_dfa_config(alphabet, rows, finals)
+
+    def build_dfa_config(self, alphabet, rows, finals):
+        """Construieste configuratia DFA (acelasi format ca la convert_to_dfa) din randurile numerotate"""
+        names = [f'q{i}' for i in range(len(rows))]
+        transitions = {}
+        for name, row in zip(names, rows):
+            targets = {symbol: names[target] for symbol, target in zip(alphabet, row) if target >= 0}
+            if targets:
+                transitions[name] = targets
+
+        return {
+            'states': names,
+            'alphabet': list(alphabet),
+            'transitions': transitions,
+            'start_state': names[0],
+            'final_states': [name for name, is_final in zip(names, finals) if is_final]
+        }
+
+    def convert_to_dfa_fast(self):
+        """Conversie silentioasa NFA -> DFA: id-uri intregi, submultimi ca bitmask-uri si tabele de mutare precalculate"""
+        alphabet, rows, finals = self.subset_construction()
+        return self.build_dfa_config(alphabet, rows, finals)
+
+    def minimize_dfa(self, dfa_config):
+        """Minimizeaza DFA-ul rezultat din constructia subseturilor (algoritmul lui Hopcroft)"""
+        states = dfa_config['states']
+        alphabet = dfa_config['alphabet']
+        state_ids = {state: i for i, state in enumerate(states)}
+        num_symbols = len(alphabet)
+
+        # tabel plat indexat prin intregi, -1 pentru tranzitiile lipsa
+        table = [-1] * (len(states) * num_symbols)
+        for state, transitions in dfa_config['transitions'].items():
+            for symbol_id, symbol in enumerate(alphabet):
+                if symbol in transitions:
+                    table[state_ids[state] * num_symbols + symbol_id] = state_ids[transitions[symbol]]
+
+        final_states = set(dfa_config['final_states'])
+        final_flags = [state in final_states for state in states]
+        new_table, new_finals, _ = hopcroft_minimize(
+            len(states), num_symbols, table, final_flags, state_ids[dfa_config['start_state']])
+
+        # starile minimizate sunt renumerotate q0, q1, ... in ordinea BFS
+        new_states = [f'q{i}' for i in range(len(new_finals))]
+        transitions = {}
+        for i, state in enumerate(new_states):
+            row = {}
+            for symbol_id, symbol in enumerate(alphabet):
+                target = new_table[i * num_symbols + symbol_id]
+                if target >= 0:
+                    row[symbol] = new_states[target]
+            if row:
+                transitions[state] = row
+
+        print(f"Minimized DFA: {len(states)} -> {len(new_states)} states")
+        return {
+            'states': new_states,
+            'alphabet': list(alphabet),
+            'transitions': transitions,
+            'start_state': new_states[0],
+            'final_states': [state for state, is_final in zip(new_states, new_finals) if is_final]
+        }
+
     def save_dfa_config(self, dfa_config, filename):
         """Salveaza configuratia DFA intr-un fisier"""
         with open(filename, 'w') as f:
             json.dump(dfa_config, f, indent=2)
         print(f"DFA configuration saved to '{filename}'")
 
+    def save_dfa_binary(self, dfa_config, filename):
+        """Salveaza configuratia DFA in formatul binar compact (.lfab), incarcabil cu DFA.load_binary"""
+        Automaton.from_config(dfa_config).save_binary(filename, KIND_DFA)
+        print(f"DFA configuration saved to '{filename}' (binary)")
+
     def print_dfa_info(self, dfa_config):
         """Printez informatiile despre DFA"""
         print("=== DFA Configuration ===")
@@ -181,27 +458,59 @@ class NFAToDFAConverter:
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: python nfa_to_dfa_converter.py nfa_config_file converted_dfa_config_file [nfa_example_key]")
+    args = sys.argv[1:]
+    workers = None
+    if '--workers' in args:
+        position = args.index('--workers')
+        try:
+            workers = int(args[position + 1])
+        except (IndexError, ValueError):
+            print("Error: --workers expects a number of processes")
+            sys.exit(1)
+        del args[position:position + 2]
+
+    options = {arg for arg in args if arg in ('--minimize', '--fast')}
+    args = [arg for arg in args if arg not in options]
+    minimize = '--minimize' in options
+    fast = '--fast' in options or workers is not None
+
+    if len(args) < 2:
+        print("Usage: python nfa_to_dfa_converter.py [--minimize] [--fast] [--workers N] nfa_config_file converted_dfa_config_file [nfa_example_key]")
         print("Examples:")
         print("  python nfa_to_dfa_converter.py nfa_examples.json output.json nfa_example_1")
         print("  python nfa_to_dfa_converter.py single_nfa.json output.json")
+        print("  python nfa_to_dfa_converter.py --minimize nfa_examples.json output.json nfa_example_2")
+        print("  python nfa_to_dfa_converter.py --fast big_nfa.json output.json")
+        print("  python nfa_to_dfa_converter.py --workers 32 big_nfa.json output.json")
         sys.exit(1)
 
-    nfa_config_file = sys.argv[1]
-    dfa_config_file = sys.argv[2]
-    nfa_example_key = sys.argv[3] if len(sys.argv) > 3 else None
+    nfa_config_file = args[0]
+    dfa_config_file = args[1]
+    nfa_example_key = args[2] if len(args) > 2 else None
 
     try:
         # creez convertorul si convertesc NFA-ul la DFA
         converter = NFAToDFAConverter(nfa_config_file, nfa_example_key)
-        dfa_config = converter.convert_to_dfa()
-
-        # afisez informatiile despre DFA
-        converter.print_dfa_info(dfa_config)
-
-        # salvez configuratia DFA-ului
-        converter.save_dfa_config(dfa_config, dfa_config_file)
+        if workers is not None:
+            dfa_config = converter.convert_to_dfa_parallel(workers)
+        elif fast:
+            dfa_config = converter.convert_to_dfa_fast()
+        else:
+            dfa_config = converter.convert_to_dfa()
+        if minimize:
+            dfa_config = converter.minimize_dfa(dfa_config)
+
+        # afisez informatiile despre DFA (in modul rapid doar un rezumat)
+        if fast:
+            print(f"DFA: {len(dfa_config['states'])} states, {len(dfa_config['final_states'])} final")
+        else:
+            converter.print_dfa_info(dfa_config)
+
+        # salvez configuratia DFA-ului (.lfab = format binar)
+        if dfa_config_file.endswith('.lfab'):
+            converter.save_dfa_binary(dfa_config, dfa_config_file)
+        else:
+            converter.save_dfa_config(dfa_config, dfa_config_file)
 
     except Exception as e:
         print(f"Error: {e}")
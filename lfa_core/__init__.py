@@ -0,0 +1,5 @@
+"""
+    Biblioteca comuna pentru programele din laboratoare (DFA, NFA, NFA_to_DFA_Converter, ...).
+Contine algoritmii care lucreaza pe reprezentarea compilata (stari si simboluri numerotate cu intregi),
+astfel incat fiecare optimizare sa fie implementata o singura data.
+"""
@@ -0,0 +1,279 @@
+"""
+    Reprezentarea comuna a automatelor finite, folosita de DFA, NFA, AutomatonValidator si
+NFAToDFAConverter, impreuna cu parserul formatului text Sigma/States/Transitions.
+
+    Numele starilor si simbolurilor sunt internate (id = pozitia in lista), iar tranzitiile sunt
+pastrate ca trei array-uri paralele de intregi (sursa, simbol, destinatie). Indexurile de adiacenta,
+tabelele DFA/NFA si formatul binar (.lfab) se construiesc o singura data, aici, din aceste array-uri.
+"""
+
+
+from array import array
+
+from lfa_core.binary_format import KIND_DFA, KIND_NFA, write_automaton
+from lfa_core.section_parser import iter_section_lines
+
+
+EPSILON = 'ε'
+EPSILON_ALIASES = ('ε', 'epsilon', 'eps')
+
+
+class AutomatonFormatError(ValueError):
+    """linie de tranzitie care nu respecta formatul stare, simbol, stare"""
+
+    def __init__(self, line_num, line):
+        super().__init__(f"Eroare la linia {line_num}: format tranziție invalid '{line}'")
+        self.line_num = line_num
+        self.line = line
+
+
+class Automaton:
+    """automat finit (DFA sau NFA) cu stari si simboluri internate
+
+    Starile si simbolurile care apar doar in tranzitii (nedeclarate in States/Sigma) sunt si ele
+internate, dar marcate in declared_states/declared_symbols, ca validatorii sa le poata raporta.
+    """
+
+    def __init__(self):
+        self.symbols = []  # id -> simbol
+        self.symbol_ids = {}  # simbol -> id
+        self.states = []  # id -> stare
+        self.state_ids = {}  # stare -> id
+        self.declared_symbols = bytearray()  # 1 daca simbolul apare in Sigma
+        self.declared_states = bytearray()  # 1 daca starea apare in States
+        self.final_flags = bytearray()  # 1 daca starea este finala
+        self.start_states = []  # id-urile starilor de start, in ordinea declararii
+
+        # tranzitia i: sources[i] --labels[i]--> targets[i]
+        self.sources = array('i')
+        self.labels = array('i')
+        self.targets = array('i')
+
+    def intern_state(self, name):
+        """id-ul starii (o adaug daca nu exista)"""
+        state_id = self.state_ids.get(name)
+        if state_id is None:
+            state_id = self.state_ids[name] = len(self.states)
+            self.states.append(name)
+            self.declared_states.append(0)
+            self.final_flags.append(0)
+        return state_id
+
+    def intern_symbol(self, name):
+        """id-ul simbolului (il adaug daca nu exista)"""
+        symbol_id = self.symbol_ids.get(name)
+        if symbol_id is None:
+            symbol_id = self.symbol_ids[name] = len(self.symbols)
+            self.symbols.append(name)
+            self.declared_symbols.append(0)
+        return symbol_id
+
+    def add_symbol(self, name):
+        symbol_id = self.intern_symbol(name)
+        self.declared_symbols[symbol_id] = 1
+        return symbol_id
+
+    def add_state(self, name, start=False, final=False):
+        state_id = self.intern_state(name)
+        self.declared_states[state_id] = 1
+        if final:
+            self.final_flags[state_id] = 1
+        if start:
+            self.start_states.append(state_id)
+        return state_id
+
+    def add_transition(self, source, symbol, target):
+        self.add_edge(self.intern_state(source), self.intern_symbol(symbol), self.intern_state(target))
+
+    def add_edge(self, source_id, symbol_id, target_id):
+        self.sources.append(source_id)
+        self.labels.append(symbol_id)
+        self.targets.append(target_id)
+
+    def alphabet(self):
+        """multimea simbolurilor declarate in Sigma"""
+        return {symbol for symbol, flag in zip(self.symbols, self.declared_symbols) if flag}
+
+    def state_names(self):
+        """multimea starilor declarate in States"""
+        return {state for state, flag in zip(self.states, self.declared_states) if flag}
+
+    def final_states(self):
+        return {state for state, flag in zip(self.states, self.final_flags) if flag}
+
+    def start_state(self):
+        """starea de start pentru DFA/NFA: ultima stare marcata cu ,S (sau None)"""
+        return self.states[self.start_states[-1]] if self.start_states else None
+
+    def transitions(self):
+        """generator: tranzitiile ca (stare, simbol, stare), in ordinea din fisier"""
+        states, symbols = self.states, self.symbols
+        for source, label, target in zip(self.sources, self.labels, self.targets):
+            yield states[source], symbols[label], states[target]
+
+    def adjacency(self, reverse=False):
+        """index CSR al tranzitiilor pe stari, construit prin numarare (liniar)
+
+        Intoarce (offsets, edges): tranzitiile care pleaca din starea s (cu reverse: care ajung in s)
+        sunt edges[offsets[s]:offsets[s + 1]], ca indici in sources/labels/targets.
+        """
+        keys = self.targets if reverse else self.sources
+        offsets = array('i', [0]) * (len(self.states) + 1)
+        for key in keys:
+            offsets[key + 1] += 1
+        for state_id in range(len(self.states)):
+            offsets[state_id + 1] += offsets[state_id]
+
+        position = offsets[:-1]
+        edges = array('i', [0]) * len(keys)
+        for edge, key in enumerate(keys):
+            edges[position[key]] = edge
+            position[key] += 1
+        return offsets, edges
+
+    def dfa_table(self):
+        """tabel plat table[stare * numar_simboluri + simbol] -> stare sau -1 (ultima tranzitie castiga)"""
+        num_symbols = len(self.symbols)
+        table = array('i', [-1]) * (len(self.states) * num_symbols)
+        for source, label, target in zip(self.sources, self.labels, self.targets):
+            table[source * num_symbols + label] = target
+        return table
+
+    def nfa_table(self):
+        """tabelele NFA din formatul binar: (simboluri fara ε, offsets, targets), cu ε pe ultima coloana"""
+        symbols = [symbol for symbol in self.symbols if symbol != EPSILON]
+        column = {self.symbol_ids[symbol]: i for i, symbol in enumerate(symbols)}
+        epsilon_column = len(symbols)
+        width = epsilon_column + 1
+
+        buckets = [[] for _ in range(len(self.states) * width)]
+        for source, label, target in zip(self.sources, self.labels, self.targets):
+            buckets[source * width + column.get(label, epsilon_column)].append(target)
+
+        offsets = array('I', [0])
+        targets = array('I')
+        for bucket in buckets:
+            targets.extend(bucket)
+            offsets.append(len(targets))
+        return symbols, offsets, targets
+
+    def save_binary(self, filename, kind):
+        """scriu automatul in formatul .lfab (KIND_DFA sau KIND_NFA)"""
+        start = self.start_states[-1] if self.start_states else None
+        if kind == KIND_DFA:
+            write_automaton(filename, KIND_DFA, self.symbols, self.states, start, self.final_flags, self.dfa_table())
+        else:
+            symbols, offsets, targets = self.nfa_table()
+            write_automaton(filename, KIND_NFA, symbols, self.states, start, self.final_flags, offsets, targets)
+
+    @classmethod
+    def from_binary(cls, binary):
+        """construiesc automatul dintr-un BinaryAutomaton deschis (DFA sau NFA)"""
+        automaton = cls()
+        for symbol in binary.symbols():
+            automaton.add_symbol(symbol)
+        for state_id, (state, flag) in enumerate(zip(binary.states(), binary.finals)):
+            automaton.add_state(state, start=state_id == binary.start, final=flag)
+
+        num_states = binary.num_states
+        num_symbols = binary.num_symbols
+        if binary.kind == KIND_DFA:
+            table = binary.table
+            for state_id in range(num_states):
+                for symbol_id in range(num_symbols):
+                    target = table[state_id * num_symbols + symbol_id]
+                    if target >= 0:
+                        automaton.add_edge(state_id, symbol_id, target)
+        else:
+            for state_id in range(num_states):
+                for symbol_id in range(num_symbols + 1):
+                    next_states = binary.nfa_targets(state_id, symbol_id)
+                    if len(next_states):
+                        # ε este ultima coloana si devine simbol doar daca are tranzitii
+                        label = symbol_id if symbol_id < num_symbols else automaton.add_symbol(EPSILON)
+                        for target in next_states:
+                            automaton.add_edge(state_id, label, target)
+        return automaton
+
+    @classmethod
+    def from_config(cls, config):
+        """construiesc automatul din configuratia JSON a convertorului (tranzitii stare -> simbol -> stare/lista)"""
+        automaton = cls()
+        for symbol in config.get('alphabet', []):
+            automaton.add_symbol(symbol)
+        final_states = set(config.get('final_states', []))
+        for state in config.get('states', []):
+            automaton.add_state(state, start=state == config.get('start_state'), final=state in final_states)
+
+        for state, moves in config.get('transitions', {}).items():
+            for symbol, next_states in moves.items():
+                if isinstance(next_states, str):
+                    next_states = [next_states]
+                for next_state in next_states:
+                    automaton.add_transition(state, symbol, next_state)
+        return automaton
+
+    def to_config(self):
+        """configuratia JSON a convertorului (tranzitii NFA: stare -> simbol -> lista de stari)"""
+        transitions = {state: {} for state in self.states}
+        for source, symbol, target in self.transitions():
+            transitions[source].setdefault(symbol, []).append(target)
+
+        return {
+            'states': list(self.states),
+            'alphabet': list(self.symbols),
+            'transitions': transitions,
+            'start_state': self.start_state(),
+            'final_states': [state for state, flag in zip(self.states, self.final_flags) if flag],
+        }
+
+
+def parse_state(line):
+    """intorc (nume, start, final) pentru o linie din States (marcaje ,S ,F ,S,F ,F,S)"""
+    if line.endswith(',S,F') or line.endswith(',F,S'):
+        return line[:-4], True, True
+    if line.endswith(',F'):
+        return line[:-2], False, True
+    if line.endswith(',S'):
+        return line[:-2], True, False
+    return line, False, False
+
+
+def parse_automaton(lines, normalize_epsilon=False):
+    """parsez incremental formatul Sigma/States/Transitions intr-un Automaton
+
+    lines poate fi orice iterabil de linii (de exemplu un fisier deschis). Cu normalize_epsilon,
+    'epsilon' si 'eps' devin 'ε'. Liniile '...' sunt ignorate (placeholder).
+    """
+    automaton = Automaton()
+
+    for line_num, section, line in iter_section_lines(lines):
+        if line == "...":
+            continue
+
+        if section == "sigma":
+            if normalize_epsilon and line in EPSILON_ALIASES:
+                line = EPSILON
+            automaton.add_symbol(line)
+
+        elif section == "states":
+            state, start, final = parse_state(line)
+            automaton.add_state(state, start, final)
+
+        elif section == "transitions":
+            # parsez tranzitia: stateX, symbolY, stateZ
+            parts = [part.strip() for part in line.split(',')]
+            if len(parts) != 3:
+                raise AutomatonFormatError(line_num, line)
+            from_state, symbol, to_state = parts
+            if normalize_epsilon and symbol in EPSILON_ALIASES:
+                symbol = EPSILON
+            automaton.add_transition(from_state, symbol, to_state)
+
+    return automaton
+
+
+def load_automaton(filename, normalize_epsilon=False):
+    """parsez fisierul de configurare linie cu linie (OSError/UnicodeDecodeError/AutomatonFormatError)"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        return parse_automaton(file, normalize_epsilon)
@@ -0,0 +1,223 @@
+"""
+    Format binar compact pentru automate (extensia .lfab), comun pentru DFA, NFA si NFAToDFAConverter.
+    Toate valorile sunt little-endian, iar fiecare sectiune incepe la un offset multiplu de 8:
+
+        header        magic 'LFAB', versiune, tip (DFA/NFA), numere de stari/simboluri/muchii,
+                      starea de start si offset-urile sectiunilor urmatoare
+        strings       uint32[num_symbols + num_states + 1]: offset-urile numelor in blob
+                      (intai simbolurile, apoi starile)
+        blob          numele simbolurilor si starilor, UTF-8, concatenate
+        finals        uint8[num_states]: 1 pentru starile finale
+        table         DFA: int32[num_states * num_symbols], starea urmatoare sau -1
+                      NFA: uint32[num_states * (num_symbols + 1) + 1], offset-uri in targets
+                      (tranzitiile starii s pe simbolul a sunt targets[off[s*(k+1)+a]:off[s*(k+1)+a+1]],
+                      ultimul simbol, cu indicele k, fiind ε)
+        targets       NFA: uint32[num_edges], starile destinatie
+
+    Fisierul poate fi deschis cu mmap; tabelele sunt expuse ca memoryview/NumPy fara copiere.
+"""
+
+
+import mmap
+import struct
+import sys
+from array import array
+
+import numpy as np
+
+
+MAGIC = b'LFAB'
+VERSION = 1
+KIND_DFA = 0
+KIND_NFA = 1
+NO_STATE = 0xFFFFFFFF
+
+# magic, versiune, tip, rezervat, num_states, num_symbols, start, num_edges,
+# offset-urile: strings, blob, finals, table, targets, dimensiunea fisierului
+HEADER = struct.Struct('<4sHBBIIIQQQQQQQ')
+HEADER_SIZE = (HEADER.size + 7) // 8 * 8
+
+
+def align(offset):
+    """rotunjesc un offset la urmatorul multiplu de 8"""
+    return (offset + 7) // 8 * 8
+
+
+def to_little_endian(values):
+    """intorc octetii unui array in ordinea little-endian"""
+    if sys.byteorder != 'little':
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def write_automaton(filename, kind, symbols, states, start, finals, table, targets=None):
+    """scriu un automat in format binar
+
+    symbols/states: listele de nume (id = pozitia); start: id-ul starii de start (sau None);
+    finals: secventa de 0/1 pe stari; table/targets: array-urile descrise in antetul modulului.
+    """
+    encoded = [name.encode('utf-8') for name in list(symbols) + list(states)]
+    string_offsets = array('I', [0])
+    for name in encoded:
+        string_offsets.append(string_offsets[-1] + len(name))
+    blob = b''.join(encoded)
+
+    table = array('i' if kind == KIND_DFA else 'I', table)
+    targets = array('I', targets or [])
+
+    strings_offset = HEADER_SIZE
+    blob_offset = align(strings_offset + 4 * len(string_offsets))
+    finals_offset = align(blob_offset + len(blob))
+    table_offset = align(finals_offset + len(states))
+    targets_offset = align(table_offset + 4 * len(table))
+    file_size = targets_offset + 4 * len(targets)
+
+    header = HEADER.pack(MAGIC, VERSION, kind, 0, len(states), len(symbols),
+                         NO_STATE if start is None else start, len(targets),
+                         strings_offset, blob_offset, finals_offset, table_offset, targets_offset, file_size)
+
+    sections = [
+        (0, header),
+        (strings_offset, to_little_endian(string_offsets)),
+        (blob_offset, blob),
+        (finals_offset, bytes(1 if flag else 0 for flag in finals)),
+        (table_offset, to_little_endian(table)),
+        (targets_offset, to_little_endian(targets)),
+    ]
+
+    with open(filename, 'wb') as file:
+        position = 0
+        for offset, data in sections:
+            file.write(b'\0' * (offset - position))
+            file.write(data)
+            position = offset + len(data)
+
+
+class BinaryAutomaton:
+    """vedere read-only peste un fisier .lfab (incarcat in memorie sau mapat cu mmap)"""
+
+    def __init__(self, buffer, mapped=None):
+        self.buffer = memoryview(buffer)
+        self.mapped = mapped
+
+        if len(self.buffer) < HEADER_SIZE:
+            raise ValueError("fișier binar trunchiat")
+        (magic, version, self.kind, _, self.num_states, self.num_symbols, start, self.num_edges,
+         self.strings_offset, self.blob_offset, self.finals_offset, self.table_offset,
+         self.targets_offset, file_size) = HEADER.unpack_from(self.buffer, 0)
+
+        if magic != MAGIC:
+            raise ValueError("nu este un fișier .lfab (magic invalid)")
+        if version != VERSION:
+            raise ValueError(f"versiune de format nesuportată: {version}")
+        if len(self.buffer) < file_size:
+            raise ValueError("fișier binar trunchiat")
+        if self.kind not in (KIND_DFA, KIND_NFA):
+            raise ValueError(f"tip de automat necunoscut: {self.kind}")
+        if self.kind == KIND_DFA:
+            table_count = self.num_states * self.num_symbols
+        else:
+            table_count = self.num_states * (self.num_symbols + 1) + 1
+
+        # sectiunile trebuie sa fie aliniate, in ordine si sa incapa in fisier; altfel un antet corupt
+        # ar da vederi scurte, iar eroarea ar aparea abia la prima tranzitie citita
+        num_strings = self.num_symbols + self.num_states + 1
+        sections = [
+            (self.strings_offset, 4 * num_strings),
+            (self.blob_offset, 0),  # lungimea blob-ului este verificata dupa citirea offset-urilor
+            (self.finals_offset, self.num_states),
+            (self.table_offset, 4 * table_count),
+            (self.targets_offset, 4 * self.num_edges),
+        ]
+        position = HEADER_SIZE
+        for offset, size in sections:
+            if offset % 8 or offset < position or offset + size > file_size:
+                raise ValueError("fișier binar trunchiat")
+            position = offset + size
+        if start != NO_STATE and start >= self.num_states:
+            raise ValueError("fișier binar trunchiat")
+
+        self.start = None if start == NO_STATE else start
+        self.string_offsets = self.view(self.strings_offset, 'I', num_strings)
+        if self.blob_offset + self.string_offsets[-1] > self.finals_offset:
+            raise ValueError("fișier binar trunchiat")
+        self.finals = self.buffer[self.finals_offset:self.finals_offset + self.num_states]
+
+        if self.kind == KIND_DFA:
+            self.table = self.view(self.table_offset, 'i', table_count)
+            self.targets = None
+        else:
+            self.table = self.view(self.table_offset, 'I', table_count)
+            self.targets = self.view(self.targets_offset, 'I', self.num_edges)
+
+    def view(self, offset, typecode, count):
+        """vedere tipizata peste o sectiune (fara copiere pe masinile little-endian)"""
+        section = self.buffer[offset:offset + 4 * count]
+        if sys.byteorder == 'little':
+            return section.cast(typecode)
+        values = array(typecode, section.tobytes())
+        values.byteswap()
+        return memoryview(values)
+
+    def numpy_view(self, offset, dtype, count):
+        """vedere NumPy (zero-copy) peste o sectiune"""
+        return np.frombuffer(self.buffer, dtype=dtype, count=count, offset=offset)
+
+    def table_array(self):
+        """tabelul de tranzitii ca vector NumPy, fara copiere"""
+        if self.kind == KIND_DFA:
+            return self.numpy_view(self.table_offset, '<i4', self.num_states * self.num_symbols)
+        return self.numpy_view(self.table_offset, '<u4', self.num_states * (self.num_symbols + 1) + 1)
+
+    def name(self, index):
+        """decodez numele cu indicele dat din tabela de string-uri (simbolurile, apoi starile)"""
+        start = self.blob_offset + self.string_offsets[index]
+        end = self.blob_offset + self.string_offsets[index + 1]
+        return self.buffer[start:end].tobytes().decode('utf-8')
+
+    def symbol(self, symbol_id):
+        """numele simbolului cu id-ul dat"""
+        return self.name(symbol_id)
+
+    def state(self, state_id):
+        """numele starii cu id-ul dat"""
+        return self.name(self.num_symbols + state_id)
+
+    def symbols(self):
+        """lista numelor simbolurilor, in ordinea id-urilor"""
+        return [self.symbol(i) for i in range(self.num_symbols)]
+
+    def states(self):
+        """lista numelor starilor, in ordinea id-urilor"""
+        return [self.state(i) for i in range(self.num_states)]
+
+    def nfa_targets(self, state_id, symbol_id):
+        """starile destinatie ale unei stari NFA pe un simbol (symbol_id == num_symbols inseamna ε)"""
+        position = state_id * (self.num_symbols + 1) + symbol_id
+        return self.targets[self.table[position]:self.table[position + 1]]
+
+    def close(self):
+        """eliberez vederile si inchid maparea (daca exista)"""
+        for name in ('string_offsets', 'finals', 'table', 'targets'):
+            view = getattr(self, name)
+            if isinstance(view, memoryview):
+                view.release()
+        self.buffer.release()
+        if self.mapped is not None:
+            self.mapped.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def open_automaton(filename, use_mmap=True):
+    """deschid un fisier .lfab; cu use_mmap fisierul este mapat read-only, fara sa fie citit"""
+    with open(filename, 'rb') as file:
+        if not use_mmap:
+            return BinaryAutomaton(file.read())
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return BinaryAutomaton(mapped, mapped)
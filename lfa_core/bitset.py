@@ -0,0 +1,30 @@
+"""
+    Multimi de stari reprezentate ca bitmask-uri intregi (bitul i = starea cu id-ul i).
+    Pentru un simbol fixat, succesorii fiecarei stari sunt grupati cate 8 (un octet din masca):
+table[byte_index][byte_value] este reuniunea succesorilor starilor din acel octet, deci un pas al
+simularii este cate un OR pentru fiecare octet nenul al mastii curente.
+"""
+
+
+def build_step_tables(successors):
+    """construiesc tabelele pe octeti pentru un simbol; successors[state_id] -> masca succesorilor"""
+    num_states = len(successors)
+    byte_tables = []
+    for byte_index in range((num_states + 7) // 8):
+        table = [0] * 256
+        for value in range(1, 256):
+            low_bit = value & -value
+            state_id = byte_index * 8 + low_bit.bit_length() - 1
+            low_mask = successors[state_id] if state_id < num_states else 0
+            table[value] = table[value & (value - 1)] | low_mask
+        byte_tables.append(table)
+    return byte_tables
+
+
+def step_mask(byte_tables, mask):
+    """aplic un pas (tabelele unui simbol) pe o masca de stari"""
+    result = 0
+    for byte_index, value in enumerate(mask.to_bytes(len(byte_tables), 'little')):
+        if value:
+            result |= byte_tables[byte_index][value]
+    return result
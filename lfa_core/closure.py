@@ -0,0 +1,73 @@
+"""
+    Precalcularea ε-closure pentru toate starile unui automat, o singura data.
+    Graful tranzitiilor ε este condensat in componente tare conexe (Tarjan, iterativ): toate starile
+dintr-un ciclu de ε-tranzitii au aceeasi inchidere, iar componentele sunt terminate in ordine
+topologica inversa, deci inchiderea unei componente se obtine din inchiderile succesorilor ei.
+"""
+
+
+def epsilon_closures(states, epsilon_edges):
+    """intorc un dictionar state -> frozenset (ε-closure), pentru starile date si cele accesibile prin ε
+
+    epsilon_edges: state -> lista starilor in care se ajunge printr-o ε-tranzitie
+    """
+    index_of = {}
+    lowlink = {}
+    on_stack = set()
+    scc_stack = []
+    closures = {}
+    counter = 0
+
+    for root in states:
+        if root in index_of:
+            continue
+
+        # stiva de lucru: (stare, iterator prin succesorii ei ε)
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(epsilon_edges.get(root, ())))]
+
+        while work:
+            state, successors = work[-1]
+            advanced = False
+            for next_state in successors:
+                if next_state not in index_of:
+                    index_of[next_state] = lowlink[next_state] = counter
+                    counter += 1
+                    scc_stack.append(next_state)
+                    on_stack.add(next_state)
+                    work.append((next_state, iter(epsilon_edges.get(next_state, ()))))
+                    advanced = True
+                    break
+                if next_state in on_stack:
+                    lowlink[state] = min(lowlink[state], index_of[next_state])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[state])
+
+            if lowlink[state] == index_of[state]:
+                # componenta completa: succesorii din afara ei au deja inchiderea calculata
+                component = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == state:
+                        break
+
+                closure = set(component)
+                for member in component:
+                    for next_state in epsilon_edges.get(member, ()):
+                        if next_state in closures:
+                            closure |= closures[next_state]
+                closure = frozenset(closure)
+                for member in component:
+                    closures[member] = closure
+
+    return closures
@@ -0,0 +1,166 @@
+"""
+    Conversia unei gramatici independente de context in forma normala Chomsky (CNF), in etape
+separate (fiecare primeste si intoarce un Grammar):
+
+        START   simbol de start nou S0 -> S, daca S apare in dreapta unei reguli
+        TERM    in corpurile de lungime >= 2, fiecare terminal a este inlocuit cu T -> a
+        BIN     corpurile de lungime > 2 sunt sparte in lanturi de reguli binare
+        DEL     eliminarea regulilor ε (doar S0 -> ε ramane, daca limbajul contine ε)
+        UNIT    eliminarea regulilor unitare A -> B
+
+    to_cnf aplica etapele in ordinea START, TERM, BIN, DEL, UNIT: dupa BIN fiecare corp are cel
+mult doua simboluri, deci DEL produce cel mult trei variante pe regula si gramatica ramane liniara
+in dimensiunea celei initiale (in afara de UNIT, patratica doar in numarul de neterminali).
+Toate etapele folosesc indexuri pe cap de regula si liste de lucru, fara a rescana gramatica.
+"""
+
+
+from collections import deque
+
+from lfa_core.grammar import Grammar, nullable_heads
+
+
+def unique_rules(rules):
+    """elimin regulile duplicate, pastrand ordinea primei aparitii"""
+    seen = set()
+    result = []
+    for rule in rules:
+        if rule not in seen:
+            seen.add(rule)
+            result.append(rule)
+    return result
+
+
+def cnf_start(grammar):
+    """START: adaug S0 -> S daca simbolul de start apare in corpul vreunei reguli"""
+    if not any(grammar.start in body for _, body in grammar.rules):
+        return grammar
+
+    new_start = grammar.fresh_nonterminal(grammar.start, set(grammar.nonterminals))
+    return Grammar(new_start, [new_start] + grammar.nonterminals, grammar.terminals,
+                   [(new_start, (grammar.start,))] + grammar.rules)
+
+
+def cnf_term(grammar):
+    """TERM: in corpurile cu cel putin doua simboluri, terminalii sunt inlocuiti cu neterminali noi T -> a"""
+    known = set(grammar.nonterminals)
+    used = set(known)
+    proxies = {}  # terminal -> neterminalul care il produce
+    nonterminals = list(grammar.nonterminals)
+    rules = []
+
+    for head, body in grammar.rules:
+        if len(body) >= 2:
+            new_body = []
+            for symbol in body:
+                if symbol not in known:
+                    if symbol not in proxies:
+                        proxies[symbol] = grammar.fresh_nonterminal('T', used)
+                        nonterminals.append(proxies[symbol])
+                    symbol = proxies[symbol]
+                new_body.append(symbol)
+            body = tuple(new_body)
+        rules.append((head, body))
+
+    rules.extend((proxy, (terminal,)) for terminal, proxy in proxies.items())
+    return Grammar(grammar.start, nonterminals, grammar.terminals, rules)
+
+
+def cnf_bin(grammar):
+    """BIN: A -> X1 X2 ... Xk (k > 2) devine A -> X1 B1, B1 -> X2 B2, ..., B(k-2) -> X(k-1) Xk"""
+    used = set(grammar.nonterminals)
+    nonterminals = list(grammar.nonterminals)
+    rules = []
+
+    for head, body in grammar.rules:
+        while len(body) > 2:
+            link = grammar.fresh_nonterminal('X', used)
+            nonterminals.append(link)
+            rules.append((head, (body[0], link)))
+            head, body = link, body[1:]
+        rules.append((head, body))
+
+    return Grammar(grammar.start, nonterminals, grammar.terminals, rules)
+
+
+def cnf_del(grammar):
+    """DEL: elimin regulile ε; fiecare regula primeste variantele fara simbolurile anulabile
+
+    Daca simbolul de start este anulabil se pastreaza doar regula start -> ε (corect in CNF
+    dupa START, cand simbolul de start nu apare in dreapta).
+    """
+    nullable = nullable_heads(grammar.to_dict())
+    rules = []
+
+    for head, body in grammar.rules:
+        # toate variantele obtinute omitand orice submultime a aparitiilor anulabile
+        variants = [()]
+        for symbol in body:
+            if symbol in nullable:
+                variants = [variant + (symbol,) for variant in variants] + variants
+            else:
+                variants = [variant + (symbol,) for variant in variants]
+        rules.extend((head, variant) for variant in variants if variant)
+
+    if grammar.start in nullable:
+        rules.append((grammar.start, ()))
+    return Grammar(grammar.start, grammar.nonterminals, grammar.terminals, unique_rules(rules))
+
+
+def cnf_unit(grammar):
+    """UNIT: elimin regulile A -> B, copiind in A regulile neunitare ale fiecarui B atins prin lanturi unitare"""
+    known = set(grammar.nonterminals)
+    unit_edges = {nonterminal: [] for nonterminal in grammar.nonterminals}
+    proper = {nonterminal: [] for nonterminal in grammar.nonterminals}  # regulile neunitare, pe cap
+
+    for head, body in grammar.rules:
+        if len(body) == 1 and body[0] in known:
+            unit_edges[head].append(body[0])
+        else:
+            proper[head].append(body)
+
+    rules = []
+    for nonterminal in grammar.nonterminals:
+        # BFS in graful regulilor unitare (cicluri A -> B -> A sunt tratate prin multimea seen)
+        seen = {nonterminal}
+        queue = deque([nonterminal])
+        while queue:
+            current = queue.popleft()
+            rules.extend((nonterminal, body) for body in proper[current])
+            for target in unit_edges[current]:
+                if target not in seen:
+                    seen.add(target)
+                    queue.append(target)
+
+    return Grammar(grammar.start, grammar.nonterminals, grammar.terminals, unique_rules(rules))
+
+
+CNF_STAGES = [
+    ('START', cnf_start),
+    ('TERM', cnf_term),
+    ('BIN', cnf_bin),
+    ('DEL', cnf_del),
+    ('UNIT', cnf_unit),
+]
+
+
+def to_cnf(grammar, stages=None):
+    """aplic etapele CNF (implicit START, TERM, BIN, DEL, UNIT) si intorc gramatica rezultata"""
+    for _, stage in (stages or CNF_STAGES):
+        grammar = stage(grammar)
+    return grammar
+
+
+def is_cnf(grammar):
+    """verific forma normala Chomsky: A -> B C, A -> a sau start -> ε (start nu apare in dreapta)"""
+    known = set(grammar.nonterminals)
+    for head, body in grammar.rules:
+        if len(body) == 2:
+            if not all(symbol in known and symbol != grammar.start for symbol in body):
+                return False
+        elif len(body) == 1:
+            if body[0] in known:
+                return False
+        elif head != grammar.start:
+            return False
+    return True
@@ -0,0 +1,104 @@
+"""
+    Recunoastere CYK bit-paralela cu NumPy, pentru gramatici in forma normala Chomsky.
+
+    Fiecare celula a tabelului CYK este un vector bool peste neterminali (bitul A = "A deriva
+subsirul"). Pentru o lungime de span, toate pozitiile de inceput si toate sirurile din lot
+(de aceeasi lungime) sunt calculate deodata: pentru fiecare regula binara A -> B C se face
+AND intre coloana B a celulelor din stanga si coloana C a celor din dreapta, rezultatele se
+combina cu OR peste punctele de taiere, iar la final sunt reduse pe capul regulii
+(np.logical_or.reduceat). Buclele Python raman doar peste (span, taiere), adica O(n^2) operatii
+vectorizate pentru un lot intreg.
+"""
+
+
+import numpy as np
+
+from lfa_core.cnf import to_cnf
+
+
+class BitsetCYK:
+    """recunoscator CYK compilat dintr-un Grammar (convertit intern in CNF)"""
+
+    def __init__(self, grammar):
+        grammar = to_cnf(grammar)
+        self.nonterminals = list(grammar.nonterminals)
+        nonterminal_ids = {symbol: i for i, symbol in enumerate(self.nonterminals)}
+        num_nonterminals = len(self.nonterminals)
+
+        self.start_id = nonterminal_ids.get(grammar.start, -1)
+        self.accepts_empty = (grammar.start, ()) in grammar.rules
+
+        # regulile A -> a: terminal -> vectorul neterminalilor care il produc (ultimul rand = terminal necunoscut)
+        terminals = sorted({body[0] for _, body in grammar.rules if len(body) == 1})
+        self.terminal_ids = {terminal: i for i, terminal in enumerate(terminals)}
+        self.terminal_matrix = np.zeros((len(terminals) + 1, num_nonterminals), dtype=bool)
+        binary = []
+        for head, body in grammar.rules:
+            if len(body) == 1:
+                self.terminal_matrix[self.terminal_ids[body[0]], nonterminal_ids[head]] = True
+            elif len(body) == 2:
+                binary.append((nonterminal_ids[head], nonterminal_ids[body[0]], nonterminal_ids[body[1]]))
+
+        # regulile binare sortate dupa cap, pentru reducerea cu reduceat
+        binary.sort()
+        self.num_nonterminals = num_nonterminals
+        self.left = np.array([b for _, b, _ in binary], dtype=np.intp)
+        self.right = np.array([c for _, _, c in binary], dtype=np.intp)
+        heads = np.array([a for a, _, _ in binary], dtype=np.intp)
+        if len(binary):
+            boundaries = np.flatnonzero(np.r_[True, heads[1:] != heads[:-1]])
+        else:
+            boundaries = np.zeros(0, dtype=np.intp)
+        self.group_starts = boundaries
+        self.group_heads = heads[boundaries]
+
+    def encode(self, tokens):
+        """id-urile terminalilor (terminalii necunoscuti primesc randul gol din terminal_matrix)"""
+        unknown = len(self.terminal_ids)
+        return [self.terminal_ids.get(token, unknown) for token in tokens]
+
+    def recognize_batch(self, batch):
+        """recunosc un lot de siruri codificate, toate de aceeasi lungime n (array int de forma (lot, n))"""
+        size, n = batch.shape
+        if self.start_id < 0:
+            return np.zeros(size, dtype=bool)
+        if n == 0:
+            return np.full(size, self.accepts_empty, dtype=bool)
+
+        # spans[l][s, i, A]: neterminalul A deriva subsirul de lungime l care incepe la i, in sirul s
+        spans = [None, self.terminal_matrix[batch]]
+        for length in range(2, n + 1):
+            count = n - length + 1
+            cell = np.zeros((size, count, self.num_nonterminals), dtype=bool)
+            if len(self.group_heads):
+                pairs = np.zeros((size, count, len(self.left)), dtype=bool)
+                for split in range(1, length):
+                    left = spans[split][:, :count]
+                    right = spans[length - split][:, split:split + count]
+                    pairs |= left[:, :, self.left] & right[:, :, self.right]
+                cell[:, :, self.group_heads] = np.logical_or.reduceat(pairs, self.group_starts, axis=2)
+            spans.append(cell)
+
+        return spans[n][:, 0, self.start_id]
+
+    def recognize_many(self, token_lists, batch_size=256):
+        """recunosc o colectie de siruri de tokeni; sirurile sunt grupate pe lungime si procesate pe loturi
+
+        batch_size limiteaza numarul de siruri procesate deodata (memoria este O(lot * n^2 * neterminali)).
+        """
+        token_lists = list(token_lists)
+        result = np.zeros(len(token_lists), dtype=bool)
+
+        groups = {}
+        for index, tokens in enumerate(token_lists):
+            groups.setdefault(len(tokens), []).append(index)
+
+        for length, indices in groups.items():
+            for offset in range(0, len(indices), batch_size):
+                chunk = indices[offset:offset + batch_size]
+                batch = np.array([self.encode(token_lists[index]) for index in chunk], dtype=np.intp)
+                result[chunk] = self.recognize_batch(batch.reshape(len(chunk), length))
+        return result
+
+    def recognize(self, tokens):
+        return bool(self.recognize_many([tokens])[0])
@@ -0,0 +1,136 @@
+"""
+    Cautarea unei derivari de stanga pentru un sir dat, pe o gramatica compilata (CompiledGrammar).
+
+    O stare a cautarii este (i, rest): forma propozitionala curenta este tinta[:i] + rest, unde
+terminalii de la inceputul formei au fost deja potriviti si consumati, deci rest incepe cu
+neterminalul cel mai din stanga. Starile sunt explorate best-first (cat mai mult din tinta
+potrivit, apoi forme cat mai scurte), iar fiecare stare este memorata si vizitata o singura data.
+
+    Taieturile folosesc subsirurile recunoscute de Earley (EarleyRecognizer.completed): pentru
+fiecare sufix al lui rest se pastreaza masca pozitiilor p din care sufixul poate deriva tinta[p:].
+Masca se calculeaza incremental (doar pentru simbolurile corpului nou introdus), iar o stare este
+pastrata doar daca i este in masca intregului rest. Verificarea include taieturile clasice pe
+prefix/sufix de terminali si pe lungimea formei fata de tinta, dar este exacta: orice stare pastrata
+poate fi completata, deci formele cu neterminali anulabili (S -> S S | ε) nu mai cresc la nesfarsit.
+"""
+
+
+import heapq
+
+from lfa_core.earley import EarleyRecognizer
+
+
+class DerivationSearch:
+    """cautare best-first, memoizata, a unei derivari de stanga (compilata o data pe gramatica)"""
+
+    def __init__(self, compiled, recognizer=None):
+        self.compiled = compiled
+        self.recognizer = recognizer or EarleyRecognizer(compiled)
+        self.truncated = False  # True daca ultima cautare s-a oprit la limita de stari
+        self.explored = 0  # numarul de stari distincte generate la ultima cautare
+
+    def search(self, tokens, max_states=200000):
+        """lista regulilor (id-uri) unei derivari de stanga a secventei de tokeni, sau None
+
+        max_states limiteaza numarul de stari memorate (timp si memorie); daca limita este atinsa,
+        rezultatul este None si truncated devine True.
+        """
+        compiled = self.compiled
+        target = compiled.encode(tokens)
+        self.truncated = False
+        self.explored = 0
+        if compiled.start < 0 or -1 in target:
+            return None
+
+        n = len(target)
+        num_nonterminals = compiled.num_nonterminals
+        ends = self.recognizer.completed(tokens)
+        matches = {}  # terminal -> masca pozitiilor p cu tinta[p] == terminal
+        for p, symbol in enumerate(target):
+            matches[symbol] = matches.get(symbol, 0) | (1 << p)
+        cache = {}
+
+        def starts(symbol, after):
+            """masca pozitiilor p din care symbol urmat de un sufix cu masca after poate deriva tinta[p:]"""
+            key = (symbol, after)
+            mask = cache.get(key)
+            if mask is None:
+                if symbol >= num_nonterminals:
+                    mask = (after >> 1) & matches.get(symbol, 0)
+                else:
+                    symbol_ends, mask = ends[symbol], 0
+                    while after:
+                        low = after & -after
+                        mask |= symbol_ends[low.bit_length() - 1]
+                        after ^= low
+                cache[key] = mask
+            return mask
+
+        # masks[k]: masca sufixului rest[k:]; ultimul element este masca formei vide (doar pozitia n)
+        start = (0, (compiled.start,))
+        start_masks = [starts(compiled.start, 1 << n), 1 << n]
+        if not start_masks[0] & 1:
+            return None
+
+        parents = {start: None}  # stare -> (starea parinte, regula aplicata)
+        masks_of = {start: start_masks}
+        heap = [(n, 1, 0, start)]
+        counter = 1
+        by_head, bodies = compiled.by_head, compiled.bodies
+
+        while heap:
+            state = heapq.heappop(heap)[3]
+            i, rest = state
+            masks = masks_of.pop(state)
+            tail, tail_masks = rest[1:], masks[1:]
+            for rule_id in by_head[rest[0]]:
+                body = bodies[rule_id]
+                body_masks = []
+                after = tail_masks[0]
+                for symbol in reversed(body):
+                    after = starts(symbol, after)
+                    body_masks.append(after)
+                if not after >> i & 1:
+                    continue
+
+                # consum terminalii de la inceput (potrivirea este garantata de masca)
+                child_rest, child_masks = body + tail, body_masks[::-1] + tail_masks
+                consumed = 0
+                while consumed < len(child_rest) and child_rest[consumed] >= num_nonterminals:
+                    consumed += 1
+                child = (i + consumed, child_rest[consumed:])
+                if child in parents:
+                    continue
+                parents[child] = (state, rule_id)
+                if not child[1]:
+                    self.explored = len(parents)
+                    return self.path(parents, child)
+                if len(parents) >= max_states:
+                    self.explored = len(parents)
+                    self.truncated = True
+                    return None
+                masks_of[child] = child_masks[consumed:]
+                heapq.heappush(heap, (n - child[0], len(child[1]), counter, child))
+                counter += 1
+
+        self.explored = len(parents)
+        return None
+
+    def path(self, parents, state):
+        """regulile aplicate de la starea initiala pana la state"""
+        rule_ids = []
+        while parents[state] is not None:
+            state, rule_id = parents[state]
+            rule_ids.append(rule_id)
+        rule_ids.reverse()
+        return rule_ids
+
+
+def leftmost_forms(compiled, rule_ids):
+    """generator: formele propozitionale (tupluri de id-uri) dupa fiecare regula aplicata cel mai din stanga"""
+    form = (compiled.start,)
+    num_nonterminals = compiled.num_nonterminals
+    for rule_id in rule_ids:
+        index = next(k for k, symbol in enumerate(form) if symbol < num_nonterminals)
+        form = form[:index] + compiled.bodies[rule_id] + form[index + 1:]
+        yield form
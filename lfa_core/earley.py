@@ -0,0 +1,156 @@
+"""
+    Recunoastere Earley pentru gramatici independente de context (CFG).
+
+    Gramatica este compilata o singura data: simbolurile devin intregi, iar fiecare pozitie a
+punctului dintr-o regula ("item punctat") primeste un id; un item Earley (pozitie, origine) este
+codificat ca un singur intreg pozitie * (n + 1) + origine, deci multimile din chart sunt multimi de int.
+
+    Gramaticile ambigue si cele recursive la stanga sunt tratate direct. Regulile ε sunt tratate cu
+corectia Aycock-Horspool: la predictia unui neterminal anulabil, punctul este avansat imediat.
+Complexitatea este O(n^3) in cel mai rau caz, O(n^2) pentru gramatici neambigue si liniara pentru
+majoritatea gramaticilor deterministe (de exemplu expresiile aritmetice recursive la stanga).
+"""
+
+
+class EarleyRecognizer:
+    """recunoscator Earley pentru o gramatica compilata (CompiledGrammar)
+
+    Foloseste direct id-urile simbolurilor si indexurile gramaticii compilate (regulile pe cap,
+    anulabilitatea), deci nu reface internarea pentru fiecare recunoscator.
+    """
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        num_nonterminals = compiled.num_nonterminals
+
+        # pozitiile punctului: next_symbol[pos] = simbolul de dupa punct (-1 daca itemul este complet)
+        self.next_symbol = []
+        self.head_of = []  # neterminalul regulii careia ii apartine pozitia
+        self.predictions = [[] for _ in range(num_nonterminals)]  # neterminal -> pozitiile de inceput ale regulilor
+        self.nullable = compiled.nullable
+        self.rule_positions = [0] * len(compiled.bodies)  # regula -> pozitia de inceput (punctul la stanga)
+
+        for head_id, rule_ids in enumerate(compiled.by_head):
+            for rule_id in rule_ids:
+                self.rule_positions[rule_id] = len(self.next_symbol)
+                self.predictions[head_id].append(len(self.next_symbol))
+                self.next_symbol.extend(compiled.bodies[rule_id])
+                self.next_symbol.append(-1)
+                self.head_of.extend([head_id] * (len(compiled.bodies[rule_id]) + 1))
+
+        self.num_nonterminals = num_nonterminals
+        self.start_id = compiled.start
+
+        # pozitiile finale (item complet) ale regulilor simbolului de start
+        self.accepting = []
+        if self.start_id >= 0:
+            for position in self.predictions[self.start_id]:
+                while self.next_symbol[position] >= 0:
+                    position += 1
+                self.accepting.append(position)
+
+    def encode(self, tokens):
+        """transform tokenii in id-uri de terminali (-1 pentru tokenii necunoscuti)"""
+        return self.compiled.encode(tokens)
+
+    def chart(self, tokens):
+        """construiesc chart-ul Earley; intorc lista multimilor de itemi (codificati) pe pozitii"""
+        tokens = self.encode(tokens)
+        n = len(tokens)
+        width = n + 1
+        next_symbol = self.next_symbol
+        head_of = self.head_of
+        predictions = self.predictions
+        nullable = self.nullable
+        num_nonterminals = self.num_nonterminals
+
+        items = [[] for _ in range(width)]  # items[k]: lista de lucru (ordinea adaugarii)
+        seen = [set() for _ in range(width)]
+        if self.start_id < 0:
+            return seen
+
+        for position in predictions[self.start_id]:
+            item = position * width
+            if item not in seen[0]:
+                seen[0].add(item)
+                items[0].append(item)
+
+        waiting_at = []  # waiting_at[k]: neterminal -> itemii din chart[k] care il asteapta dupa punct
+        for k in range(width):
+            current, current_seen = items[k], seen[k]
+            waiting = {}
+            waiting_at.append(waiting)
+            token = tokens[k] if k < n else -2
+            scanned = items[k + 1] if k < n else None
+            scanned_seen = seen[k + 1] if k < n else None
+
+            index = 0
+            while index < len(current):
+                item = current[index]
+                index += 1
+                position, origin = divmod(item, width)
+                symbol = next_symbol[position]
+
+                if symbol < 0:
+                    # completare: avansez itemii din chart[origin] care asteptau neterminalul
+                    head = head_of[position]
+                    for parent in waiting_at[origin].get(head, ()):
+                        advanced = parent + width
+                        if advanced not in current_seen:
+                            current_seen.add(advanced)
+                            current.append(advanced)
+
+                elif symbol < num_nonterminals:
+                    # predictie (o singura data pe neterminal si pozitie)
+                    if symbol not in waiting:
+                        waiting[symbol] = []
+                        for start_position in predictions[symbol]:
+                            predicted = start_position * width + k
+                            if predicted not in current_seen:
+                                current_seen.add(predicted)
+                                current.append(predicted)
+                    waiting[symbol].append(item)
+
+                    # corectia Aycock-Horspool pentru neterminalele anulabile
+                    if nullable[symbol]:
+                        advanced = item + width
+                        if advanced not in current_seen:
+                            current_seen.add(advanced)
+                            current.append(advanced)
+
+                elif symbol == token:
+                    # scanare
+                    advanced = item + width
+                    if advanced not in scanned_seen:
+                        scanned_seen.add(advanced)
+                        scanned.append(advanced)
+
+        return seen
+
+    def completed(self, tokens, chart=None):
+        """subsirurile derivate de neterminali, citite din itemii completi ai chart-ului
+
+        Intorc ends, unde ends[A][k] este masca de biti a originilor j pentru care A =>* tokens[j:k].
+        Apar doar perechile (A, j) prezise, deci exact cele care pot aparea intr-o derivare din start.
+        chart: chart-ul deja construit pentru tokens (optional).
+        """
+        tokens = list(tokens)
+        if chart is None:
+            chart = self.chart(tokens)
+        width = len(tokens) + 1
+        next_symbol, head_of = self.next_symbol, self.head_of
+        ends = [[0] * width for _ in range(self.num_nonterminals)]
+        for k, items in enumerate(chart):
+            for item in items:
+                position, origin = divmod(item, width)
+                if next_symbol[position] < 0:
+                    ends[head_of[position]][k] |= 1 << origin
+        return ends
+
+    def recognize(self, tokens):
+        """True daca secventa de tokeni (terminali) este derivabila din simbolul de start"""
+        tokens = list(tokens)
+        final = self.chart(tokens)[len(tokens)]
+        # un item complet al unei reguli de start, cu originea 0
+        width = len(tokens) + 1
+        return any(position * width in final for position in self.accepting)
@@ -0,0 +1,221 @@
+"""
+    Generarea sirurilor unei gramatici independente de context: enumerarea tuturor sirurilor de
+lungime <= n in ordine canonica (dupa lungime, apoi lexicografic dupa terminali) si esantionarea
+aleatoare a sirurilor de lungime exact n.
+
+    Gramatica este convertita in CNF, iar tabelul counts[A][l] (numarul de arbori de derivare ai lui A
+cu frontiera de lungime l) este calculat pe lungimi crescatoare si memorat: se extinde doar cand se
+cere o lungime mai mare, cu O(|R| * n^2) operatii pe intregi, fara a expanda vreo derivare.
+
+    Esantionarea alege un index uniform in [0, counts[S][n]) si construieste derivarea cu acel index
+(regula si taietura fiecarui nod dupa numarul de derivari pe care le acopera), deci nu exista
+respingere. Pentru gramaticile neambigue (un arbore pe sir) distributia este uniforma pe siruri;
+pentru cele ambigue, un sir este ales proportional cu numarul lui de derivari.
+
+    Enumerarea parcurge prefixele in ordine lexicografica si continua doar prefixele care pot fi
+completate la lungimea ceruta: CYK pe prefix, cu pozitiile ramase tratate ca "orice terminal"
+(A acopera l pozitii oarecare daca counts[A][l] > 0). Fiecare sir apare o singura data, chiar si
+pentru gramaticile ambigue, iar memoria ramane polinomiala in n.
+"""
+
+
+import random
+
+from lfa_core.cnf import to_cnf
+from lfa_core.grammar import CompiledGrammar
+
+
+class StringGenerator:
+    """enumerator si esantionator de siruri pentru un Grammar (convertit intern in CNF)"""
+
+    def __init__(self, grammar):
+        compiled = CompiledGrammar(to_cnf(grammar))
+        self.compiled = compiled
+        self.start = compiled.start
+        num_nonterminals = compiled.num_nonterminals
+
+        self.terminal_rules = [[] for _ in range(num_nonterminals)]  # A -> terminalii t din regulile A -> t
+        self.binary_rules = [[] for _ in range(num_nonterminals)]  # A -> perechile (B, C) din regulile A -> B C
+        self.by_left = [[] for _ in range(num_nonterminals)]  # B -> perechile (C, A), pentru CYK
+        self.produces = {}  # terminal -> masca neterminalilor A cu A -> t
+        self.combined = {}  # (masca stanga, masca dreapta) -> masca capetelor (memorat)
+        empty = [0] * num_nonterminals
+        for rule_id, body in enumerate(compiled.bodies):
+            head = compiled.heads[rule_id]
+            if len(body) == 1:
+                self.terminal_rules[head].append(body[0])
+                self.produces[body[0]] = self.produces.get(body[0], 0) | 1 << head
+            elif len(body) == 2:
+                self.binary_rules[head].append(body)
+                self.by_left[body[0]].append((body[1], head))
+            else:
+                empty[head] = 1  # doar start -> ε, iar startul nu apare in dreapta
+        self.terminals = sorted(self.produces)  # id-urile sunt in ordinea numelor (ordinea canonica)
+
+        # counts[A][l]: numarul de derivari ale lui A de lungime l; derivable[l]: masca celor cu counts > 0
+        self.counts = [[empty[symbol]] for symbol in range(num_nonterminals)]
+        self.derivable = [sum(1 << symbol for symbol in range(num_nonterminals) if empty[symbol])]
+
+    def extend(self, length):
+        """completez tabelul de numarare pana la lungimea length (lungimile deja calculate raman)"""
+        counts = self.counts
+        for size in range(len(self.derivable), length + 1):
+            mask = 0
+            for symbol, row in enumerate(counts):
+                if size == 1:
+                    total = len(self.terminal_rules[symbol])
+                else:
+                    total = 0
+                    for left, right in self.binary_rules[symbol]:
+                        left_row, right_row = counts[left], counts[right]
+                        for split in range(1, size):
+                            total += left_row[split] * right_row[size - split]
+                row.append(total)
+                if total:
+                    mask |= 1 << symbol
+            self.derivable.append(mask)
+
+    def count(self, length):
+        """numarul de derivari de lungime length (egal cu numarul de siruri daca gramatica este neambigua)"""
+        if self.start < 0 or length < 0:
+            return 0
+        self.extend(length)
+        return self.counts[self.start][length]
+
+    def unrank(self, length, index):
+        """sirul (tuplu de terminali) al derivarii cu numarul index (0 <= index < count(length))"""
+        if not 0 <= index < self.count(length):
+            raise IndexError("derivation index out of range")
+        counts, symbols = self.counts, self.compiled.symbols
+        tokens = []
+        stack = [(self.start, length, index)]
+        while stack:
+            symbol, size, index = stack.pop()
+            if size == 0:
+                continue
+            if size == 1:
+                tokens.append(symbols[self.terminal_rules[symbol][index]])
+                continue
+
+            # regula si taietura care contin derivarea index, apoi indexurile celor doi copii
+            for left, right in self.binary_rules[symbol]:
+                for split in range(1, size):
+                    right_count = counts[right][size - split]
+                    block = counts[left][split] * right_count
+                    if index < block:
+                        break
+                    index -= block
+                else:
+                    continue
+                break
+            # copilul stang iese primul de pe stiva, deci tokenii raman in ordine
+            stack.append((right, size - split, index % right_count))
+            stack.append((left, split, index // right_count))
+        return tuple(tokens)
+
+    def sample(self, length, rng=random):
+        """un sir aleator de lungime exact length (derivare uniforma, fara respingere)
+
+        rng: orice obiect cu randrange (implicit modulul random; random.Random(seed) pentru repetabilitate).
+        ValueError daca gramatica nu genereaza siruri de aceasta lungime.
+        """
+        total = self.count(length)
+        if total == 0:
+            raise ValueError(f"No strings of length {length}")
+        return self.unrank(length, rng.randrange(total))
+
+    def enumerate(self, max_length):
+        """generator: toate sirurile (tupluri de terminali) de lungime <= max_length, in ordine canonica"""
+        for length in range(max_length + 1):
+            yield from self.strings_of_length(length)
+
+    def strings_of_length(self, length):
+        """generator: sirurile distincte de lungime exact length, in ordine lexicografica
+
+        Parcurgere in adancime iterativa pe prefixe; columns[k][i] este masca neterminalilor care
+        deriva prefix[i:k + 1], adaugata incremental la fiecare terminal nou.
+        """
+        if self.count(length) == 0:
+            return
+        if length == 0:
+            yield ()
+            return
+
+        symbols = self.compiled.symbols
+        prefix, columns = [], []
+        candidates = [iter(self.terminals)]
+        while candidates:
+            terminal = next(candidates[-1], None)
+            if terminal is None:
+                candidates.pop()
+                if prefix:
+                    prefix.pop()
+                    columns.pop()
+                continue
+
+            prefix.append(terminal)
+            columns.append(self.scan(columns, terminal))
+            if not self.completable(columns, length - len(prefix)):
+                prefix.pop()
+                columns.pop()
+            elif len(prefix) == length:
+                yield tuple(symbols[symbol] for symbol in prefix)
+                prefix.pop()
+                columns.pop()
+            else:
+                candidates.append(iter(self.terminals))
+
+    def combine(self, left, right):
+        """masca capetelor A -> B C cu B in masca left si C in masca right (memorat pe perechi de masti)"""
+        if not left or not right:
+            return 0
+        key = (left, right)
+        if key in self.combined:
+            return self.combined[key]
+        heads = 0
+        while left:
+            low = left & -left
+            left ^= low
+            for right_symbol, head in self.by_left[low.bit_length() - 1]:
+                if right >> right_symbol & 1:
+                    heads |= 1 << head
+        self.combined[key] = heads
+        return heads
+
+    def scan(self, columns, terminal):
+        """coloana CYK pentru un terminal nou la pozitia k = len(columns): masca pentru fiecare inceput i"""
+        k = len(columns)
+        column = [0] * (k + 1)
+        column[k] = self.produces[terminal]
+        for i in range(k - 1, -1, -1):
+            mask = 0
+            for j in range(i + 1, k + 1):
+                mask |= self.combine(columns[j - 1][i], column[j])
+            column[i] = mask
+        return column
+
+    def completable(self, columns, remaining):
+        """True daca prefixul (columns) urmat de exact remaining terminali oarecare poate fi derivat din start
+
+        extended[i][r]: masca neterminalilor care deriva prefix[i:] urmat de r terminali oarecare.
+        """
+        k = len(columns)
+        if remaining == 0:
+            return bool(columns[k - 1][0] >> self.start & 1)
+
+        derivable = self.derivable
+        extended = [None] * (k + 1)
+        extended[k] = derivable[:remaining + 1]
+        extended[k][0] = 0
+        for i in range(k - 1, -1, -1):
+            row = [columns[k - 1][i]]
+            for r in range(1, remaining + 1):
+                # taietura in prefix (stanga = prefix[i:j]) sau in pozitiile oarecare (dreapta = r - split)
+                mask = 0
+                for j in range(i + 1, k + 1):
+                    mask |= self.combine(columns[j - 1][i], extended[j][r])
+                for split in range(1, r):
+                    mask |= self.combine(row[split], derivable[r - split])
+                row.append(mask)
+            extended[i] = row
+        return bool(extended[0][remaining] >> self.start & 1)
@@ -0,0 +1,160 @@
+"""
+    Reprezentarea comuna a gramaticilor independente de context folosita de algoritmii din lfa_core
+(Earley, CNF, CYK): o lista de reguli (cap, corp), unde corpul este un tuplu de simboluri si
+ε este tuplul gol. Orice simbol care nu este neterminal este terminal.
+
+    CompiledGrammar este forma compilata (o singura data, la incarcare): simbolurile sunt internate
+(neterminalii primii), corpurile sunt tupluri de id-uri, iar regulile sunt indexate dupa cap, dupa
+primul terminal si dupa anulabilitate.
+"""
+
+
+from array import array
+
+
+class Grammar:
+    """gramatica (start, neterminali ordonati, terminali, reguli)"""
+
+    def __init__(self, start, nonterminals, terminals, rules):
+        self.start = start
+        self.nonterminals = list(nonterminals)  # ordinea este pastrata (determinism la afisare)
+        self.terminals = set(terminals)
+        self.rules = list(rules)  # lista de (cap, corp)
+
+    @classmethod
+    def from_dict(cls, start, rules, terminals=()):
+        """construiesc gramatica dintr-un dictionar neterminal -> lista de corpuri"""
+        nonterminals = list(rules)
+        if start is not None and start not in rules:
+            nonterminals.insert(0, start)
+        known = set(nonterminals)
+        flat = [(head, tuple(body)) for head, bodies in rules.items() for body in bodies]
+        symbols = {symbol for _, body in flat for symbol in body if symbol not in known}
+        return cls(start, nonterminals, set(terminals) | symbols, flat)
+
+    def to_dict(self):
+        """dictionarul neterminal -> lista de corpuri (toti neterminalii apar, chiar fara reguli)"""
+        rules = {nonterminal: [] for nonterminal in self.nonterminals}
+        for head, body in self.rules:
+            rules[head].append(body)
+        return rules
+
+    def fresh_nonterminal(self, prefix, used):
+        """un nume nou de neterminal (prefix + numar) care nu apare in used; il adaug in used"""
+        counter = 0
+        while True:
+            name = f"{prefix}{counter}"
+            if name not in used and name not in self.terminals:
+                used.add(name)
+                return name
+            counter += 1
+
+
+class CompiledGrammar:
+    """gramatica cu simboluri internate si reguli indexate
+
+    Id-urile 0 .. num_nonterminals - 1 sunt neterminali (in ordinea din Grammar), restul sunt
+terminali. Regula r are capul heads[r] si corpul bodies[r] (tuplu de id-uri).
+    """
+
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.symbols = list(grammar.nonterminals)  # id -> simbol
+        self.num_nonterminals = len(self.symbols)
+        body_symbols = {symbol for _, body in grammar.rules for symbol in body}
+        self.symbols.extend(sorted((set(grammar.terminals) | body_symbols) - set(self.symbols), key=str))
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}  # simbol -> id
+        self.start = self.symbol_ids.get(grammar.start, -1)
+        if self.start >= self.num_nonterminals:
+            self.start = -1
+
+        self.heads = array('i')
+        self.bodies = []
+        self.by_head = [[] for _ in range(self.num_nonterminals)]  # neterminal -> regulile lui
+        self.by_first_terminal = {}  # terminal -> regulile al caror corp incepe cu el
+        for rule_id, (head, body) in enumerate(grammar.rules):
+            head_id = self.symbol_ids[head]
+            body = tuple(self.symbol_ids[symbol] for symbol in body)
+            self.heads.append(head_id)
+            self.bodies.append(body)
+            self.by_head[head_id].append(rule_id)
+            if body and body[0] >= self.num_nonterminals:
+                self.by_first_terminal.setdefault(body[0], []).append(rule_id)
+
+        # anulabilitatea, pe neterminali si pe reguli (toate simbolurile din corp anulabile)
+        nullable = nullable_heads(self.rules_by_head())
+        self.nullable = bytearray(symbol in nullable for symbol in range(self.num_nonterminals))
+        self.rule_nullable = bytearray(
+            all(symbol < self.num_nonterminals and self.nullable[symbol] for symbol in body) for body in self.bodies
+        )
+
+    def is_terminal(self, symbol_id):
+        return symbol_id >= self.num_nonterminals
+
+    def rules_by_head(self):
+        """dictionarul id neterminal -> lista de corpuri (tupluri de id-uri)"""
+        return {head: [self.bodies[rule_id] for rule_id in rule_ids] for head, rule_ids in enumerate(self.by_head)}
+
+    def encode(self, tokens):
+        """id-urile terminalilor din secventa de tokeni (-1 pentru tokenii care nu sunt terminali)"""
+        symbol_ids, num_nonterminals = self.symbol_ids, self.num_nonterminals
+        encoded = []
+        for token in tokens:
+            symbol_id = symbol_ids.get(token, -1)
+            encoded.append(symbol_id if symbol_id >= num_nonterminals else -1)
+        return encoded
+
+    def decode(self, symbol_ids):
+        """numele simbolurilor pentru o secventa de id-uri"""
+        return tuple(self.symbols[symbol_id] for symbol_id in symbol_ids)
+
+
+def nullable_heads(rules):
+    """multimea neterminalelor care deriva ε (punct fix, cu numaratoare pe reguli)
+
+    rules: neterminal -> lista de corpuri. Fiecare corp este vizitat o data pentru fiecare simbol
+    al lui, deci costul este liniar in dimensiunea gramaticii.
+    """
+    nullable = set()
+    remaining = {}  # (head, index) -> numarul de simboluri din corp inca neanulabile
+    waiting = {}  # simbol -> regulile in al caror corp apare
+    queue = []
+
+    for head, bodies in rules.items():
+        for index, body in enumerate(bodies):
+            remaining[(head, index)] = len(body)
+            for symbol in body:
+                waiting.setdefault(symbol, []).append((head, index))
+            if not body and head not in nullable:
+                nullable.add(head)
+                queue.append(head)
+
+    while queue:
+        symbol = queue.pop()
+        for rule in waiting.get(symbol, ()):
+            # fiecare aparitie a simbolului in corp scade numaratoarea o data
+            remaining[rule] -= 1
+            if remaining[rule] == 0 and rule[0] not in nullable:
+                nullable.add(rule[0])
+                queue.append(rule[0])
+
+    return nullable
+
+
+def format_tree(tree):
+    """arborele de derivare ca text indentat
+
+    Un nod este (simbol, copii); frunzele sunt tokenii (siruri). Parcurgerea este iterativa, deci
+    merge si pentru arbori foarte adanci.
+    """
+    lines = []
+    stack = [(tree, 0)]
+    while stack:
+        node, depth = stack.pop()
+        if isinstance(node, tuple):
+            symbol, children = node
+            lines.append('  ' * depth + (symbol if children else f"{symbol} -> ε"))
+            stack.extend((child, depth + 1) for child in reversed(children))
+        else:
+            lines.append('  ' * depth + f"'{node}'")
+    return '\n'.join(lines)
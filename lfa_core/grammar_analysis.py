@@ -0,0 +1,216 @@
+"""
+    Analize de punct fix pe gramatica compilata (CompiledGrammar): neterminali productivi si
+accesibili, eliminarea simbolurilor inutile, multimile FIRST si FOLLOW.
+
+    Toate sunt algoritmi cu lista de lucru pe indexul de reguli: o regula este revizitata doar cand
+se schimba ceva pentru un simbol din corpul ei, deci productivitatea si accesibilitatea sunt liniare
+in dimensiunea gramaticii, iar FIRST/FOLLOW sunt liniare pentru fiecare terminal propagat
+(O(|G| * |T|)). Anulabilitatea este calculata deja la compilare (compiled.nullable).
+
+    Multimile FIRST/FOLLOW contin id-uri de terminali; END (-1) este marcajul de sfarsit '$'.
+"""
+
+
+from lfa_core.grammar import Grammar
+
+
+END = -1
+END_MARKER = '$'
+
+
+def occurrences(compiled):
+    """neterminal -> lista de (regula, pozitie) in care apare in corpuri"""
+    num_nonterminals = compiled.num_nonterminals
+    where = [[] for _ in range(num_nonterminals)]
+    for rule_id, body in enumerate(compiled.bodies):
+        for position, symbol in enumerate(body):
+            if symbol < num_nonterminals:
+                where[symbol].append((rule_id, position))
+    return where
+
+
+def productive_nonterminals(compiled):
+    """bytearray: 1 daca neterminalul deriva macar un sir de terminali (numaratoare pe reguli)"""
+    num_nonterminals = compiled.num_nonterminals
+    productive = bytearray(num_nonterminals)
+    remaining = []  # regula -> aparitiile de neterminali inca neproductivi din corp
+    queue = []
+
+    for rule_id, body in enumerate(compiled.bodies):
+        count = sum(1 for symbol in body if symbol < num_nonterminals)
+        remaining.append(count)
+        head = compiled.heads[rule_id]
+        if count == 0 and not productive[head]:
+            productive[head] = 1
+            queue.append(head)
+
+    where = occurrences(compiled)
+    while queue:
+        symbol = queue.pop()
+        for rule_id, _ in where[symbol]:
+            remaining[rule_id] -= 1
+            head = compiled.heads[rule_id]
+            if remaining[rule_id] == 0 and not productive[head]:
+                productive[head] = 1
+                queue.append(head)
+
+    return productive
+
+
+def reachable_nonterminals(compiled, rule_filter=None):
+    """bytearray: 1 daca neterminalul apare intr-o forma derivata din start
+
+    rule_filter: bytearray optional pe reguli; regulile cu 0 sunt ignorate.
+    """
+    num_nonterminals = compiled.num_nonterminals
+    reachable = bytearray(num_nonterminals)
+    if compiled.start < 0:
+        return reachable
+
+    reachable[compiled.start] = 1
+    queue = [compiled.start]
+    while queue:
+        head = queue.pop()
+        for rule_id in compiled.by_head[head]:
+            if rule_filter is not None and not rule_filter[rule_id]:
+                continue
+            for symbol in compiled.bodies[rule_id]:
+                if symbol < num_nonterminals and not reachable[symbol]:
+                    reachable[symbol] = 1
+                    queue.append(symbol)
+    return reachable
+
+
+def useful_rules(compiled):
+    """bytearray pe reguli: 1 daca regula apare intr-o derivare completa din start
+
+    Intai sunt eliminate regulile care contin neterminali neproductivi, apoi cele ale caror cap nu
+    mai este accesibil (ordinea conteaza: invers ar putea ramane simboluri inutile).
+    """
+    num_nonterminals = compiled.num_nonterminals
+    productive = productive_nonterminals(compiled)
+    keep = bytearray(
+        productive[compiled.heads[rule_id]] and all(symbol >= num_nonterminals or productive[symbol] for symbol in body)
+        for rule_id, body in enumerate(compiled.bodies)
+    )
+    reachable = reachable_nonterminals(compiled, keep)
+    for rule_id, head in enumerate(compiled.heads):
+        if not reachable[head]:
+            keep[rule_id] = 0
+    return keep
+
+
+def remove_useless(compiled):
+    """Grammar echivalent, fara simbolurile neproductive sau inaccesibile (startul ramane mereu)"""
+    grammar = compiled.grammar
+    keep = useful_rules(compiled)
+    rules = [rule for rule, flag in zip(grammar.rules, keep) if flag]
+    used = {head for head, _ in rules}
+    used.update(symbol for _, body in rules for symbol in body)
+    nonterminals = [symbol for symbol in grammar.nonterminals if symbol in used or symbol == grammar.start]
+    terminals = {symbol for symbol in grammar.terminals if symbol in used}
+    return Grammar(grammar.start, nonterminals, terminals, rules)
+
+
+def first_sets(compiled):
+    """FIRST pentru fiecare neterminal (liste de multimi de id-uri de terminali)
+
+    A primeste terminalul t direct din regulile A -> α t ... cu α anulabil, iar din A -> α B ...
+    (α anulabil) primeste tot ce primeste B. Fiecare pereche (neterminal, terminal) intra o singura
+    data in lista de lucru.
+    """
+    num_nonterminals = compiled.num_nonterminals
+    nullable = compiled.nullable
+    first = [set() for _ in range(num_nonterminals)]
+    feeds = [[] for _ in range(num_nonterminals)]  # B -> neterminalii A care includ FIRST(B)
+    queue = []
+
+    for rule_id, body in enumerate(compiled.bodies):
+        head = compiled.heads[rule_id]
+        for symbol in body:
+            if symbol >= num_nonterminals:
+                if symbol not in first[head]:
+                    first[head].add(symbol)
+                    queue.append((head, symbol))
+                break
+            if symbol != head:
+                feeds[symbol].append(head)
+            if not nullable[symbol]:
+                break
+
+    while queue:
+        symbol, terminal = queue.pop()
+        for head in feeds[symbol]:
+            if terminal not in first[head]:
+                first[head].add(terminal)
+                queue.append((head, terminal))
+
+    return first
+
+
+def first_of_sequence(compiled, first, symbols):
+    """(FIRST al secventei de simboluri, True daca secventa este anulabila)"""
+    num_nonterminals = compiled.num_nonterminals
+    result = set()
+    for symbol in symbols:
+        if symbol >= num_nonterminals:
+            result.add(symbol)
+            return result, False
+        result |= first[symbol]
+        if not compiled.nullable[symbol]:
+            return result, False
+    return result, True
+
+
+def follow_sets(compiled, first=None):
+    """FOLLOW pentru fiecare neterminal (id-uri de terminali, END pentru sfarsitul sirului)
+
+    Pentru A -> α B β: FIRST(β) intra in FOLLOW(B), iar daca β este anulabil, FOLLOW(A) se propaga in
+    FOLLOW(B). Corpurile sunt parcurse o data de la dreapta la stanga; propagarea foloseste lista de lucru.
+    """
+    if first is None:
+        first = first_sets(compiled)
+    num_nonterminals = compiled.num_nonterminals
+    nullable = compiled.nullable
+    follow = [set() for _ in range(num_nonterminals)]
+    feeds = [[] for _ in range(num_nonterminals)]  # A -> neterminalii B care includ FOLLOW(A)
+    queue = []
+
+    def add(symbol, terminal):
+        if terminal not in follow[symbol]:
+            follow[symbol].add(terminal)
+            queue.append((symbol, terminal))
+
+    if compiled.start >= 0:
+        add(compiled.start, END)
+
+    for rule_id, body in enumerate(compiled.bodies):
+        head = compiled.heads[rule_id]
+        trailer = set()  # FIRST al sufixului de dupa pozitia curenta
+        tail_nullable = True
+        for symbol in reversed(body):
+            if symbol >= num_nonterminals:
+                trailer = {symbol}
+                tail_nullable = False
+                continue
+            for terminal in trailer:
+                add(symbol, terminal)
+            if tail_nullable and symbol != head:
+                feeds[head].append(symbol)
+            if nullable[symbol]:
+                trailer = trailer | first[symbol]
+            else:
+                trailer = set(first[symbol])
+                tail_nullable = False
+
+    while queue:
+        symbol, terminal = queue.pop()
+        for target in feeds[symbol]:
+            add(target, terminal)
+
+    return follow
+
+
+def symbol_names(compiled, symbol_ids):
+    """numele ordonate ale unei multimi de id-uri (END devine '$')"""
+    return sorted(END_MARKER if symbol_id == END else compiled.symbols[symbol_id] for symbol_id in symbol_ids)
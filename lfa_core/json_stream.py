@@ -0,0 +1,253 @@
+"""
+    Parser JSON incremental, pe evenimente: fisierul este citit in bucati de dimensiune fixa, iar
+textul deja consumat este eliberat imediat. Memoria ramane proportionala cu obiectele construite,
+nu cu dimensiunea fisierului.
+
+    Evenimente produse de iter_json_events: ('start_map', None), ('map_key', cheie), ('end_map', None),
+('start_array', None), ('end_array', None) si ('value', valoare) pentru string-uri, numere,
+true/false/null.
+"""
+
+
+import json
+import re
+from json.decoder import scanstring
+
+
+WHITESPACE = ' \t\r\n'
+NUMBER = re.compile(r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?')
+LITERALS = (('true', True), ('false', False), ('null', None))
+
+
+def iter_json_tokens(stream, chunk_size=64 * 1024):
+    """impart textul JSON in atomi: punctuatie ('{', '}', '[', ']', ':', ','), 'string', 'number', 'literal'"""
+    buffer = ''
+    position = 0
+    consumed = 0  # caractere eliberate deja (pentru pozitia din mesajele de eroare)
+    eof = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in WHITESPACE:
+            position += 1
+
+        # atomul curent poate fi taiat la capatul bucatii: mai citesc, pastrand doar restul necitit
+        if position >= len(buffer) or (not eof and len(buffer) - position < 5):
+            if eof:
+                if position >= len(buffer):
+                    return
+            else:
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                consumed += position
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+
+        char = buffer[position]
+        if char in '{}[]:,':
+            position += 1
+            yield char, None
+            continue
+
+        if char == '"':
+            try:
+                value, end = scanstring(buffer, position + 1)
+            except json.JSONDecodeError:
+                if eof:
+                    raise json.JSONDecodeError("Unterminated or invalid string", buffer, position)
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                consumed += position
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            position = end
+            yield 'string', value
+            continue
+
+        match = NUMBER.match(buffer, position)
+        if match:
+            # un numar taiat la capatul bucatii ('12', '1.', '1e+') poate continua in bucata urmatoare
+            if match.end() + 2 >= len(buffer) and not eof:
+                chunk = stream.read(chunk_size)
+                eof = not chunk
+                consumed += position
+                buffer = buffer[position:] + chunk
+                position = 0
+                continue
+            text = match.group()
+            position = match.end()
+            # '01', '1.', '1e': restul nu mai formeaza un numar valid (json.load le respinge)
+            if position < len(buffer) and buffer[position] in '0123456789.eE':
+                raise json.JSONDecodeError(f"Invalid number at offset {consumed + match.start()}",
+                                           buffer, match.start())
+            yield 'number', float(text) if any(c in text for c in '.eE') else int(text)
+            continue
+
+        for word, value in LITERALS:
+            if buffer.startswith(word, position):
+                position += len(word)
+                yield 'literal', value
+                break
+        else:
+            raise json.JSONDecodeError(f"Unexpected character {char!r} at offset {consumed + position}",
+                                       buffer, position)
+
+
+def iter_json_events(stream, chunk_size=64 * 1024):
+    """transform atomii in evenimente, verificand sintaxa (cheile din obiecte sunt separate de valori)"""
+    containers = []  # True pentru obiect, False pentru lista
+    expect = 'value'  # ce urmeaza: 'value', 'key', 'colon', 'separator' (',' sau inchidere) sau 'end'
+    allow_close = False  # container gol: se poate inchide imediat
+
+    def syntax_error(message):
+        return json.JSONDecodeError(message, '', 0)
+
+    for kind, value in iter_json_tokens(stream, chunk_size):
+        if expect == 'colon':
+            if kind != ':':
+                raise syntax_error("Expecting ':' delimiter")
+            expect = 'value'
+            continue
+
+        if kind in ('}', ']') and (expect == 'separator' or allow_close):
+            if not containers or containers[-1] != (kind == '}'):
+                raise syntax_error(f"Unexpected '{kind}'")
+            containers.pop()
+            allow_close = False
+            expect = 'separator' if containers else 'end'
+            yield ('end_map' if kind == '}' else 'end_array'), None
+            continue
+
+        if expect == 'separator':
+            if kind != ',':
+                raise syntax_error("Expecting ',' delimiter")
+            expect = 'key' if containers[-1] else 'value'
+            continue
+
+        if expect == 'end':
+            raise syntax_error("Extra data after JSON value")
+
+        allow_close = False
+        if expect == 'key':
+            if kind != 'string':
+                raise syntax_error("Expecting property name enclosed in double quotes")
+            expect = 'colon'
+            yield 'map_key', value
+        elif kind == '{':
+            containers.append(True)
+            expect = 'key'
+            allow_close = True
+            yield 'start_map', None
+        elif kind == '[':
+            containers.append(False)
+            expect = 'value'
+            allow_close = True
+            yield 'start_array', None
+        elif kind in ('string', 'number', 'literal'):
+            expect = 'separator' if containers else 'end'
+            yield 'value', value
+        else:
+            raise syntax_error(f"Unexpected '{kind}'")
+
+    if containers or expect != 'end':
+        raise syntax_error("Unexpected end of JSON input")
+
+
+def build_value(events, event):
+    """construiesc valoarea Python care incepe cu evenimentul dat, consumand restul ei din events"""
+    kind, value = event
+    if kind == 'value':
+        return value
+
+    root = {} if kind == 'start_map' else []
+    stack = [root]
+    key = None
+    for kind, value in events:
+        current = stack[-1]
+        if kind == 'map_key':
+            key = value
+            continue
+        if kind in ('end_map', 'end_array'):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+
+        if kind == 'start_map':
+            item = {}
+        elif kind == 'start_array':
+            item = []
+        else:
+            item = value
+
+        if isinstance(current, dict):
+            current[key] = item
+        else:
+            current.append(item)
+        if kind in ('start_map', 'start_array'):
+            stack.append(item)
+
+    raise json.JSONDecodeError("Unexpected end of JSON input", '', 0)
+
+
+def skip_value(events, event):
+    """sar peste valoarea care incepe cu evenimentul dat, fara sa o construiesc"""
+    if event[0] == 'value':
+        return
+    depth = 1
+    for kind, _ in events:
+        if kind in ('start_map', 'start_array'):
+            depth += 1
+        elif kind in ('end_map', 'end_array'):
+            depth -= 1
+            if depth == 0:
+                return
+    raise json.JSONDecodeError("Unexpected end of JSON input", '', 0)
+
+
+def expect_end(events):
+    """citesc evenimentele ramase pana la capat: orice atom sau text dupa valoare este o eroare"""
+    for _ in events:
+        raise json.JSONDecodeError("Extra data after JSON value", '', 0)
+
+
+def load_json(stream, chunk_size=64 * 1024):
+    """echivalentul lui json.load, construit din evenimente (datele de dupa valoare sunt respinse)"""
+    events = iter_json_events(stream, chunk_size)
+    try:
+        first = next(events)
+    except StopIteration:
+        raise json.JSONDecodeError("Expecting value", '', 0)
+    value = build_value(events, first)
+    expect_end(events)
+    return value
+
+
+def find_json_member(stream, key, chunk_size=64 * 1024):
+    """caut o cheie din obiectul de pe primul nivel si construiesc doar valoarea ei
+
+    Intorc (True, valoare) daca cheia exista, altfel (False, lista cheilor de pe primul nivel).
+    Restul documentului este verificat (fara a fi construit), ca la load_json; la chei repetate
+    castiga ultima aparitie, ca la json.load.
+    """
+    events = iter_json_events(stream, chunk_size)
+    first = next(events, None)
+    if first is None or first[0] != 'start_map':
+        raise json.JSONDecodeError("Expecting a JSON object", '', 0)
+
+    keys = []
+    found, member = False, None
+    for kind, value in events:
+        if kind == 'end_map':
+            break
+        if kind != 'map_key':
+            raise json.JSONDecodeError("Expecting property name", '', 0)
+        if value == key:
+            found, member = True, build_value(events, next(events))
+            continue
+        keys.append(value)
+        skip_value(events, next(events))
+    expect_end(events)
+
+    return (True, member) if found else (False, keys)
@@ -0,0 +1,158 @@
+"""
+    Minimizarea automatelor finite deterministe cu algoritmul lui Hopcroft, in O(n * k * log n),
+unde n este numarul de stari si k dimensiunea alfabetului.
+    Automatul este dat in forma compilata: un tabel plat table[state * num_symbols + symbol] -> next_state,
+cu -1 pentru tranzitiile lipsa (automat partial).
+"""
+
+
+from collections import deque
+
+
+def reachable_states(num_symbols, table, start):
+    """intorc starile accesibile din start, in ordinea BFS (simbolurile in ordinea id-urilor)"""
+    order = [start]
+    seen = {start}
+    queue = deque([start])
+
+    while queue:
+        state = queue.popleft()
+        base = state * num_symbols
+        for symbol in range(num_symbols):
+            next_state = table[base + symbol]
+            if next_state >= 0 and next_state not in seen:
+                seen.add(next_state)
+                order.append(next_state)
+                queue.append(next_state)
+
+    return order
+
+
+def hopcroft_partition(num_states, num_symbols, delta, final_flags):
+    """rafinez partitia {F, Q\\F} pentru un automat complet; intorc block_of[state] -> id bloc"""
+    # tranzitiile inverse: inverse[symbol][state] -> predecesorii lui state pe symbol
+    inverse = [[[] for _ in range(num_states)] for _ in range(num_symbols)]
+    for state in range(num_states):
+        row = delta[state]
+        for symbol in range(num_symbols):
+            inverse[symbol][row[symbol]].append(state)
+
+    finals = {state for state in range(num_states) if final_flags[state]}
+    others = set(range(num_states)) - finals
+    blocks = [block for block in (finals, others) if block]
+
+    block_of = [0] * num_states
+    for block_id, block in enumerate(blocks):
+        for state in block:
+            block_of[state] = block_id
+
+    # lista de lucru (bloc, simbol); daca exista doua blocuri e suficient cel mai mic
+    worklist = []
+    if len(blocks) == 2:
+        smaller = 0 if len(blocks[0]) <= len(blocks[1]) else 1
+        worklist = [(smaller, symbol) for symbol in range(num_symbols)]
+    pending = set(worklist)
+
+    while worklist:
+        splitter = worklist.pop()
+        pending.discard(splitter)
+        splitter_block, symbol = splitter
+
+        # grupez predecesorii splitter-ului dupa blocul in care se afla
+        touched = {}
+        inverse_symbol = inverse[symbol]
+        for state in blocks[splitter_block]:
+            for predecessor in inverse_symbol[state]:
+                touched.setdefault(block_of[predecessor], []).append(predecessor)
+
+        for block_id, inside in touched.items():
+            if len(inside) == len(blocks[block_id]):
+                continue
+
+            # separ blocul in partea care intra in splitter si restul
+            new_block = set(inside)
+            blocks[block_id] -= new_block
+            new_id = len(blocks)
+            blocks.append(new_block)
+            for state in new_block:
+                block_of[state] = new_id
+
+            for other_symbol in range(num_symbols):
+                if (block_id, other_symbol) in pending:
+                    entry = (new_id, other_symbol)
+                elif len(blocks[block_id]) <= len(new_block):
+                    entry = (block_id, other_symbol)
+                else:
+                    entry = (new_id, other_symbol)
+                worklist.append(entry)
+                pending.add(entry)
+
+    return block_of
+
+
+def hopcroft_minimize(num_states, num_symbols, table, final_flags, start):
+    """minimizez un DFA compilat
+
+    Intorc (new_table, new_final_flags, block_of): noul tabel plat are starea de start 0 si starile
+numerotate in ordinea BFS; block_of[state] este starea noua a fiecarei stari vechi sau -1 pentru starile
+eliminate (inaccesibile sau din care nu se mai poate ajunge intr-o stare finala).
+    """
+    # 1. pastrez doar starile accesibile si le renumerotez 0..r-1
+    reachable = reachable_states(num_symbols, table, start)
+    local_id = {state: i for i, state in enumerate(reachable)}
+    sink = len(reachable)
+
+    # 2. completez automatul cu o stare capcana (sink) pentru tranzitiile lipsa
+    delta = []
+    for state in reachable:
+        base = state * num_symbols
+        row = []
+        for symbol in range(num_symbols):
+            next_state = table[base + symbol]
+            row.append(local_id[next_state] if next_state >= 0 else sink)
+        delta.append(row)
+    delta.append([sink] * num_symbols)
+    local_finals = [bool(final_flags[state]) for state in reachable] + [False]
+
+    # 3. partitia Hopcroft
+    block_of_local = hopcroft_partition(sink + 1, num_symbols, delta, local_finals)
+    dead_block = block_of_local[sink]
+
+    # 4. renumerotez blocurile in ordinea BFS de la blocul de start; blocul capcanei dispare
+    representative = {}
+    for state in range(sink, -1, -1):
+        representative[block_of_local[state]] = state
+
+    new_id = {block_of_local[0]: 0} if block_of_local[0] != dead_block else {}
+    order = list(new_id)
+    queue = deque(order)
+    while queue:
+        block = queue.popleft()
+        row = delta[representative[block]]
+        for symbol in range(num_symbols):
+            target = block_of_local[row[symbol]]
+            if target != dead_block and target not in new_id:
+                new_id[target] = len(order)
+                order.append(target)
+                queue.append(target)
+
+    if not order:
+        # limbajul este vid: ramane doar starea de start, nefinala si fara tranzitii
+        block_of = [-1] * num_states
+        block_of[start] = 0
+        return [-1] * num_symbols, [False], block_of
+
+    new_table = []
+    new_finals = []
+    for block in order:
+        state = representative[block]
+        new_finals.append(local_finals[state])
+        for symbol in range(num_symbols):
+            target = block_of_local[delta[state][symbol]]
+            new_table.append(new_id[target] if target != dead_block else -1)
+
+    block_of = [-1] * num_states
+    for state, local in local_id.items():
+        block_of[state] = new_id.get(block_of_local[local], -1)
+
+    return new_table, new_finals, block_of
@@ -0,0 +1,419 @@
+"""
+    Generator de tabele de analiza sintactica deterministe pentru CFG: LL(1) si, cand gramatica nu
+este LL(1), LALR(1). Analiza cu tabel este liniara in lungimea sirului si construieste arborele de
+derivare (noduri (simbol, copii), frunzele sunt tokenii).
+
+    Tabelele lucreaza pe id-urile gramaticii compilate (terminali, END = -1 pentru '$') si se pot
+salva in JSON (save_table / load_table), impreuna cu simbolurile si regulile, deci un tabel incarcat
+de pe disc nu mai are nevoie de gramatica. Conflictele sunt pastrate in tabel (conflicts); un tabel
+cu conflicte nu este folosit pentru analiza.
+
+    LALR(1) este construit ca in cartea dragonului: colectia LR(0), apoi lookahead-urile nucleelor,
+generate spontan sau propagate (prin inchiderea LR(1) cu lookahead-ul fictiv '#').
+"""
+
+
+import json
+
+from lfa_core.grammar_analysis import END, END_MARKER, first_of_sequence, first_sets, follow_sets
+
+
+PROPAGATE = -2  # lookahead-ul fictiv '#'
+
+
+def is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def rows_from_pairs(rows):
+    """randurile unui tabel salvat (liste de perechi [simbol, valoare]) ca dictionare; ValueError la alta forma"""
+    if not isinstance(rows, list):
+        raise ValueError("malformed parse table rows")
+    result = []
+    for row in rows:
+        if not (isinstance(row, list)
+                and all(isinstance(pair, list) and len(pair) == 2 and is_int(pair[0]) and is_int(pair[1])
+                        for pair in row)):
+            raise ValueError("malformed parse table row")
+        result.append({key: value for key, value in row})
+    return result
+
+
+class ParseTable:
+    """parte comuna LL(1)/LALR(1): simbolurile, regulile si conflictele"""
+
+    kind = None
+
+    def __init__(self, symbols, num_nonterminals, start, heads, bodies, conflicts):
+        self.symbols = list(symbols)
+        self.symbol_ids = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.num_nonterminals = num_nonterminals
+        self.start = start
+        self.heads = list(heads)
+        self.bodies = [tuple(body) for body in bodies]
+        self.conflicts = conflicts  # lista de mesaje (stare sau neterminal, lookahead, actiunile in conflict)
+
+    @classmethod
+    def from_compiled(cls, compiled):
+        return cls(compiled.symbols, compiled.num_nonterminals, compiled.start, compiled.heads, compiled.bodies, [])
+
+    def name(self, symbol_id):
+        return END_MARKER if symbol_id == END else self.symbols[symbol_id]
+
+    def rule_text(self, rule_id):
+        body = ' '.join(self.symbols[symbol] for symbol in self.bodies[rule_id]) or 'ε'
+        return f"{self.symbols[self.heads[rule_id]]} -> {body}"
+
+    def encode(self, tokens):
+        """id-urile tokenilor, urmate de END; None daca un token nu este terminal al gramaticii"""
+        encoded = []
+        for token in tokens:
+            symbol_id = self.symbol_ids.get(token, -1)
+            if symbol_id < self.num_nonterminals:
+                return None
+            encoded.append(symbol_id)
+        encoded.append(END)
+        return encoded
+
+    def same_grammar(self, compiled):
+        """True daca tabelul a fost generat pentru aceasta gramatica (aceleasi simboluri si reguli)"""
+        return (self.symbols == compiled.symbols and self.start == compiled.start
+                and self.heads == list(compiled.heads) and self.bodies == compiled.bodies)
+
+    def to_dict(self):
+        return {
+            'kind': self.kind,
+            'symbols': self.symbols,
+            'num_nonterminals': self.num_nonterminals,
+            'start': self.start,
+            'rules': [[head, list(body)] for head, body in zip(self.heads, self.bodies)],
+            'conflicts': self.conflicts,
+        }
+
+    @classmethod
+    def common_from_dict(cls, data):
+        """partea comuna din dictionarul scris de to_dict (ValueError daca structura difera)"""
+        symbols, rules, conflicts = data['symbols'], data['rules'], data['conflicts']
+        if not (isinstance(symbols, list) and all(isinstance(symbol, str) for symbol in symbols)
+                and is_int(data['num_nonterminals']) and is_int(data['start'])
+                and isinstance(rules, list) and isinstance(conflicts, list)):
+            raise ValueError("malformed parse table")
+        heads, bodies = [], []
+        for rule in rules:
+            if not (isinstance(rule, list) and len(rule) == 2 and is_int(rule[0]) and isinstance(rule[1], list)
+                    and all(is_int(symbol) for symbol in rule[1])):
+                raise ValueError("malformed parse table rule")
+            heads.append(rule[0])
+            bodies.append(rule[1])
+        return cls(symbols, data['num_nonterminals'], data['start'], heads, bodies, conflicts)
+
+
+class LL1Table(ParseTable):
+    """tabel LL(1): table[A] = {terminal: regula}"""
+
+    kind = 'LL(1)'
+
+    @classmethod
+    def build(cls, compiled, first=None, follow=None):
+        if first is None:
+            first = first_sets(compiled)
+        if follow is None:
+            follow = follow_sets(compiled, first)
+
+        table = cls.from_compiled(compiled)
+        table.table = [{} for _ in range(compiled.num_nonterminals)]
+        clashes = {}  # (A, terminal) -> toate regulile candidate
+        for rule_id, body in enumerate(compiled.bodies):
+            head = compiled.heads[rule_id]
+            lookaheads, nullable = first_of_sequence(compiled, first, body)
+            if nullable:
+                lookaheads = lookaheads | follow[head]
+            for terminal in lookaheads:
+                row = table.table[head]
+                if terminal in row:
+                    clashes.setdefault((head, terminal), [row[terminal]]).append(rule_id)
+                else:
+                    row[terminal] = rule_id
+
+        for (head, terminal), rule_ids in sorted(clashes.items()):
+            rules = ' | '.join(table.rule_text(rule_id) for rule_id in rule_ids)
+            table.conflicts.append(f"{table.symbols[head]}, {table.name(terminal)}: {rules}")
+        return table
+
+    def parse(self, tokens):
+        """arborele de derivare al secventei de tokeni sau None daca sirul este respins"""
+        encoded = self.encode(tokens)
+        if encoded is None or self.start < 0:
+            return None
+
+        num_nonterminals, symbols = self.num_nonterminals, self.symbols
+        root = (symbols[self.start], [])
+        stack = [(self.start, root)]  # (simbol asteptat, nodul lui; None pentru terminali)
+        position = 0
+        while stack:
+            symbol, node = stack.pop()
+            lookahead = encoded[position]
+            if symbol >= num_nonterminals:
+                if symbol != lookahead:
+                    return None
+                position += 1
+                continue
+
+            rule_id = self.table[symbol].get(lookahead)
+            if rule_id is None:
+                return None
+            # copiii sunt creati in ordine; frunzele sunt chiar terminalii asteptati
+            expected = []
+            for child in self.bodies[rule_id]:
+                child_node = (symbols[child], []) if child < num_nonterminals else None
+                node[1].append(child_node or symbols[child])
+                expected.append((child, child_node))
+            stack.extend(reversed(expected))
+
+        return root if encoded[position] == END else None
+
+    def to_dict(self):
+        data = super().to_dict()
+        data['table'] = [sorted(row.items()) for row in self.table]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        table = cls.common_from_dict(data)
+        table.table = rows_from_pairs(data['table'])
+        return table
+
+
+class LALRTable(ParseTable):
+    """tabel LALR(1): action[stare] = {terminal: cod}, goto[stare] = {neterminal: stare}
+
+    Codul unei actiuni este 2 * stare pentru shift si 2 * regula + 1 pentru reduce; reducerea
+    regulii augmentate (S' -> S, id = numarul de reguli) inseamna accept.
+    """
+
+    kind = 'LALR(1)'
+
+    @classmethod
+    def build(cls, compiled, first=None):
+        if first is None:
+            first = first_sets(compiled)
+        table = cls.from_compiled(compiled)
+        builder = LALRBuilder(compiled, first)
+        table.action, table.goto = builder.tables(table)
+        table.num_states = len(table.action)
+        return table
+
+    def parse(self, tokens):
+        """arborele de derivare al secventei de tokeni sau None daca sirul este respins"""
+        encoded = self.encode(tokens)
+        if encoded is None or self.start < 0:
+            return None
+
+        accept = len(self.bodies)
+        states = [0]
+        nodes = []
+        position = 0
+        while True:
+            code = self.action[states[-1]].get(encoded[position])
+            if code is None:
+                return None
+            target, reduce = divmod(code, 2)
+            if not reduce:
+                nodes.append(tokens[position])
+                states.append(target)
+                position += 1
+                continue
+
+            if target == accept:
+                return nodes[-1]
+            size = len(self.bodies[target])
+            children = nodes[len(nodes) - size:]
+            del nodes[len(nodes) - size:]
+            del states[len(states) - size:]
+            head = self.heads[target]
+            nodes.append((self.symbols[head], children))
+            states.append(self.goto[states[-1]][head])
+
+    def to_dict(self):
+        data = super().to_dict()
+        data['action'] = [sorted(row.items()) for row in self.action]
+        data['goto'] = [sorted(row.items()) for row in self.goto]
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        table = cls.common_from_dict(data)
+        table.action = rows_from_pairs(data['action'])
+        table.goto = rows_from_pairs(data['goto'])
+        table.num_states = len(table.action)
+        return table
+
+
+class LALRBuilder:
+    """colectia LR(0) si lookahead-urile LALR(1) pentru o gramatica compilata
+
+    Itemii sunt perechi (regula, pozitia punctului); regula augmentata S' -> S are id-ul len(bodies).
+    """
+
+    def __init__(self, compiled, first):
+        self.compiled = compiled
+        self.first = first
+        self.augmented = len(compiled.bodies)
+        self.bodies = list(compiled.bodies) + [(compiled.start,) if compiled.start >= 0 else ()]
+
+        # colectia LR(0): nucleele starilor si tranzitiile
+        self.kernels = [((self.augmented, 0),)]
+        self.transitions = []  # stare -> {simbol: stare}
+        state_ids = {self.kernels[0]: 0}
+        state = 0
+        while state < len(self.kernels):
+            moves = {}
+            for rule_id, dot in self.lr0_closure(self.kernels[state]):
+                body = self.bodies[rule_id]
+                if dot < len(body):
+                    moves.setdefault(body[dot], []).append((rule_id, dot + 1))
+            row = {}
+            for symbol, kernel in moves.items():
+                kernel = tuple(sorted(set(kernel)))
+                if kernel not in state_ids:
+                    state_ids[kernel] = len(self.kernels)
+                    self.kernels.append(kernel)
+                row[symbol] = state_ids[kernel]
+            self.transitions.append(row)
+            state += 1
+
+        self.lookaheads = self.kernel_lookaheads()
+
+    def lr0_closure(self, kernel):
+        num_nonterminals = self.compiled.num_nonterminals
+        items = list(kernel)
+        seen = set(items)
+        for rule_id, dot in items:
+            body = self.bodies[rule_id]
+            if dot < len(body) and body[dot] < num_nonterminals:
+                for predicted in self.compiled.by_head[body[dot]]:
+                    if (predicted, 0) not in seen:
+                        seen.add((predicted, 0))
+                        items.append((predicted, 0))
+        return items
+
+    def lr1_closure(self, kernel):
+        """inchiderea LR(1): item -> multimea lookahead-urilor (kernel: item -> multime)"""
+        compiled, num_nonterminals = self.compiled, self.compiled.num_nonterminals
+        items = {item: set(lookaheads) for item, lookaheads in kernel.items()}
+        queue = list(items)
+        while queue:
+            rule_id, dot = item = queue.pop()
+            body = self.bodies[rule_id]
+            if dot >= len(body) or body[dot] >= num_nonterminals:
+                continue
+            lookaheads, nullable = first_of_sequence(compiled, self.first, body[dot + 1:])
+            if nullable:
+                lookaheads = lookaheads | items[item]
+            for predicted in compiled.by_head[body[dot]]:
+                current = items.get((predicted, 0))
+                if current is None:
+                    items[(predicted, 0)] = set(lookaheads)
+                    queue.append((predicted, 0))
+                elif not lookaheads <= current:
+                    current |= lookaheads
+                    queue.append((predicted, 0))
+        return items
+
+    def kernel_lookaheads(self):
+        """lookahead-urile fiecarui item din nuclee: generate spontan, apoi propagate (lista de lucru)"""
+        lookaheads = {(state, item): set() for state, kernel in enumerate(self.kernels) for item in kernel}
+        lookaheads[(0, (self.augmented, 0))].add(END)
+        propagates = {key: [] for key in lookaheads}
+
+        for state, kernel in enumerate(self.kernels):
+            for kernel_item in kernel:
+                closure = self.lr1_closure({kernel_item: {PROPAGATE}})
+                for (rule_id, dot), symbols in closure.items():
+                    body = self.bodies[rule_id]
+                    if dot >= len(body):
+                        continue
+                    target = (self.transitions[state][body[dot]], (rule_id, dot + 1))
+                    for lookahead in symbols:
+                        if lookahead == PROPAGATE:
+                            propagates[(state, kernel_item)].append(target)
+                        else:
+                            lookaheads[target].add(lookahead)
+
+        queue = [(key, lookahead) for key, symbols in lookaheads.items() for lookahead in symbols]
+        while queue:
+            key, lookahead = queue.pop()
+            for target in propagates[key]:
+                if lookahead not in lookaheads[target]:
+                    lookaheads[target].add(lookahead)
+                    queue.append((target, lookahead))
+        return lookaheads
+
+    def tables(self, table):
+        """tabelele action/goto; conflictele sunt adaugate in table.conflicts (shift castiga)"""
+        num_nonterminals = self.compiled.num_nonterminals
+        action, goto = [], []
+        for state, kernel in enumerate(self.kernels):
+            row = {}
+            goto.append({symbol: target for symbol, target in self.transitions[state].items()
+                         if symbol < num_nonterminals})
+            for symbol, target in self.transitions[state].items():
+                if symbol >= num_nonterminals:
+                    row[symbol] = 2 * target
+
+            closure = self.lr1_closure({item: self.lookaheads[(state, item)] for item in kernel})
+            clashes = {}
+            for (rule_id, dot), symbols in sorted(closure.items()):
+                if dot < len(self.bodies[rule_id]):
+                    continue
+                for lookahead in symbols:
+                    code = 2 * rule_id + 1
+                    if lookahead not in row:
+                        row[lookahead] = code
+                    elif row[lookahead] != code:
+                        clashes.setdefault(lookahead, [row[lookahead]]).append(code)
+            for lookahead, codes in sorted(clashes.items()):
+                described = ' | '.join(self.describe(table, code) for code in codes)
+                table.conflicts.append(f"state {state}, {table.name(lookahead)}: {described}")
+            action.append(row)
+        return action, goto
+
+    def describe(self, table, code):
+        target, reduce = divmod(code, 2)
+        if not reduce:
+            return f"shift {target}"
+        if target == self.augmented:
+            return "accept"
+        return f"reduce {table.rule_text(target)}"
+
+
+def build_parse_table(compiled):
+    """tabelul LL(1) daca gramatica este LL(1), altfel tabelul LALR(1) (eventual cu conflicte)"""
+    first = first_sets(compiled)
+    table = LL1Table.build(compiled, first, follow_sets(compiled, first))
+    if not table.conflicts:
+        return table
+    return LALRTable.build(compiled, first)
+
+
+TABLE_KINDS = {LL1Table.kind: LL1Table, LALRTable.kind: LALRTable}
+
+
+def save_table(table, filename):
+    with open(filename, 'w', encoding='utf-8') as file:
+        json.dump(table.to_dict(), file, ensure_ascii=False)
+
+
+def load_table(filename):
+    """incarc un tabel salvat cu save_table (OSError / ValueError pentru fisiere invalide)"""
+    with open(filename, 'r', encoding='utf-8') as file:
+        data = json.load(file)
+    kind = TABLE_KINDS.get(data.get('kind')) if isinstance(data, dict) else None
+    if kind is None:
+        raise ValueError(f"'{filename}' is not a parse table file")
+    try:
+        return kind.from_dict(data)
+    except KeyError as e:
+        raise ValueError(f"'{filename}' is not a valid parse table: missing {e}")
+    except ValueError as e:
+        raise ValueError(f"'{filename}' is not a valid parse table: {e}")
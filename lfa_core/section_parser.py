@@ -0,0 +1,64 @@
+"""
+    Parser incremental pentru formatul text cu sectiuni folosit de DFA, NFA si AutomatonValidator
+(interpretarea liniilor se face in lfa_core/automaton.py):
+
+        Sigma:        States:        Transitions:
+        ...           ...            ...
+        End           End            End
+
+    Fisierul este consumat linie cu linie (iterand obiectul fisier), deci textul nu este
+niciodata incarcat intreg in memorie.
+"""
+
+
+SECTION_HEADERS = {
+    "Sigma:": "sigma",
+    "States:": "states",
+    "Transitions:": "transitions",
+}
+
+
+def iter_section_lines(lines):
+    """generator: (numar_linie, sectiune, continut) pentru fiecare linie utila
+
+    Liniile goale, comentariile (#) si liniile de delimitare a sectiunilor nu sunt produse;
+    sectiune este None pentru continutul aflat in afara oricarei sectiuni.
+    """
+    current_section = None
+
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+
+        # ignor liniile goale si comentariile
+        if not line or line.startswith('#'):
+            continue
+
+        # detectez sectiunile
+        if line in SECTION_HEADERS:
+            current_section = SECTION_HEADERS[line]
+            continue
+        if line == "End":
+            current_section = None
+            continue
+
+        yield line_num, current_section, line
+
+
+def has_section_header(filename, max_lines=200):
+    """True daca prima linie utila (fara linii goale si comentarii) este un antet de sectiune
+
+    Se citesc cel mult max_lines linii, deci fisierele mari care nu sunt automate (de exemplu
+    requirements.txt sau un corpus) sunt recunoscute imediat. Un fisier care nu poate fi citit
+    este considerat automat, ca eroarea sa apara in raportul de validare.
+    """
+    try:
+        with open(filename, 'r', encoding='utf-8', errors='replace') as file:
+            for line_num, line in enumerate(file):
+                if line_num >= max_lines:
+                    return False
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    return line in SECTION_HEADERS
+    except OSError:
+        return True
+    return False
@@ -0,0 +1,284 @@
+"""
+    Padure de derivare partajata si impachetata (SPPF) pentru gramatici ambigue, construita din
+chart-ul Earley.
+
+    Nodurile sunt:
+    - noduri de simbol (X, i, k): X deriva tokens[i:k] (pentru terminali sunt frunze);
+    - noduri intermediare (r, d, i, k): primele d simboluri ale regulii r deriva tokens[i:k].
+Familiile (alternativele impachetate) unui nod de simbol sunt regulile complete (r, len, i, k), iar
+ale unui nod intermediar sunt taieturile j: (r, d - 1, i, j) urmat de (corp[d - 1], j, k). Fiecare
+nod are cel mult n + 1 familii, deci padurea are O(|G| * n^3) marime, chiar daca numarul de
+derivari creste exponential.
+
+    Numarul de derivari se calculeaza pe padure, fara enumerare. Regulile ε si cele unitare pot face
+padurea ciclica (de exemplu S -> S S | ε: S deriva acelasi subsir prin S S cu un S vid), caz in care
+exista o infinitate de derivari; ciclurile sunt taiate (vezi count_trees), cyclic devine True, iar
+numararea si enumerarea se refera la arborii ramasi. Arborii sunt construiti lenes, unul cate unul,
+dupa indexul lor in aceasta numarare.
+"""
+
+
+import heapq
+
+
+class SPPF:
+    """padure de derivare pentru o secventa de tokeni (root este None daca sirul este respins)"""
+
+    def __init__(self, compiled, tokens, families, root):
+        self.compiled = compiled
+        self.tokens = list(tokens)
+        self.families = families  # nod -> lista de familii (tupluri de noduri copii)
+        self.root = root
+        self.cyclic = False
+        self.counts = {}  # nod -> numarul de arbori (fara cicluri)
+        self.kept = {}  # nod -> lista de (familie, numar de arbori), fara familiile care inchid cicluri
+        if root is not None:
+            self.count_trees()
+
+    def is_leaf(self, node):
+        return len(node) == 3 and node[0] >= self.compiled.num_nonterminals
+
+    def size(self):
+        """(numarul de noduri, numarul de familii impachetate)"""
+        return len(self.families), sum(len(families) for families in self.families.values())
+
+    def count_trees(self):
+        """numararea derivarilor pe padurea fara cicluri (kept), in postordine iterativa
+
+        In interiorul unei componente tari conexe, o familie este pastrata doar daca copiii din
+        aceeasi componenta au inaltimea minima strict mai mica decat nodul. Astfel kept este aciclic,
+        fiecare nod isi pastreaza macar familia de inaltime minima, iar padurile fara cicluri raman
+        neschimbate (numararea este exacta).
+        """
+        heights = self.minimal_heights()
+        components = self.components()
+        for node, families in self.families.items():
+            component = components.get(node)
+            if component is None:
+                self.kept[node] = list(families)
+                continue
+            self.cyclic = True
+            self.kept[node] = [
+                family for family in families
+                if all(heights[child] < heights[node] for child in family if components.get(child) == component)
+            ]
+
+        counts = self.counts
+        stack = [self.root]
+        while stack:
+            node = stack[-1]
+            if node in counts:
+                stack.pop()
+                continue
+            pending = [child for family in self.kept[node] for child in family
+                       if child not in counts and not self.is_leaf(child)]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            alternatives = []
+            for family in self.kept[node]:
+                total = 1
+                for child in family:
+                    total *= counts.get(child, 1)
+                alternatives.append((family, total))
+            self.kept[node] = alternatives
+            counts[node] = sum(total for _, total in alternatives)
+        for node in self.families:
+            if node not in counts:
+                del self.kept[node]
+
+    def minimal_heights(self):
+        """inaltimea minima a unui arbore de derivare pentru fiecare nod (algoritmul lui Knuth)"""
+        heights = {}
+        remaining = {}  # (nod, familie) -> copiii inca nefixati
+        parents = {}  # copil -> familiile in care apare
+        queue = []
+        for node, families in self.families.items():
+            for index, family in enumerate(families):
+                inner = [child for child in family if not self.is_leaf(child)]
+                remaining[(node, index)] = len(inner)
+                for child in inner:
+                    parents.setdefault(child, []).append((node, index))
+                if not inner:
+                    queue.append((1, node))
+
+        heapq.heapify(queue)
+        while queue:
+            height, node = heapq.heappop(queue)
+            if node in heights:
+                continue
+            heights[node] = height
+            for parent, index in parents.get(node, ()):
+                remaining[(parent, index)] -= 1
+                if remaining[(parent, index)] == 0:
+                    family = self.families[parent][index]
+                    total = 1 + max(heights.get(child, 0) for child in family)
+                    heapq.heappush(queue, (total, parent))
+        return heights
+
+    def components(self):
+        """componentele tari conexe ale padurii (Tarjan iterativ): nod -> id componenta
+
+        Un nod care este propriul copil formeaza si el o componenta ciclica, deci primeste un id
+        diferit de None doar daca apartine unui ciclu.
+        """
+        index_of, low, on_stack = {}, {}, set()
+        stack, components = [], {}
+        counter = 0
+        for start in self.families:
+            if start in index_of:
+                continue
+            work = [(start, iter(self.children(start)))]
+            index_of[start] = low[start] = counter
+            counter += 1
+            stack.append(start)
+            on_stack.add(start)
+            while work:
+                node, children = work[-1]
+                for child in children:
+                    if self.is_leaf(child):
+                        continue
+                    if child not in index_of:
+                        index_of[child] = low[child] = counter
+                        counter += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.children(child))))
+                        break
+                    if child in on_stack:
+                        low[node] = min(low[node], index_of[child])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        low[parent] = min(low[parent], low[node])
+                    if low[node] == index_of[node]:
+                        members = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            members.append(member)
+                            if member == node:
+                                break
+                        if len(members) > 1 or node in self.children(node):
+                            for member in members:
+                                components[member] = index_of[node]
+        return components
+
+    def children(self, node):
+        """copiii distincti ai nodului, din toate familiile"""
+        seen = set()
+        for family in self.families.get(node, ()):
+            for child in family:
+                if child not in seen:
+                    seen.add(child)
+                    yield child
+
+    def count(self):
+        """numarul de arbori de derivare (fara cicluri) ai sirului; 0 daca sirul este respins"""
+        return self.counts[self.root] if self.root is not None else 0
+
+    def is_ambiguous(self):
+        return self.cyclic or self.count() > 1
+
+    def tree(self, index):
+        """arborele cu numarul index (0 <= index < count()), construit iterativ
+
+        Index-ul este descompus in baza mixta: intai alegerea familiei, apoi indexurile copiilor.
+        """
+        if not 0 <= index < self.count():
+            raise IndexError("tree index out of range")
+        symbols, tokens = self.compiled.symbols, self.tokens
+        root = []
+        stack = [(self.root, index, root)]
+        while stack:
+            node, index, siblings = stack.pop()
+            if self.is_leaf(node):
+                siblings.append(tokens[node[1]])
+                continue
+
+            for family, total in self.kept[node]:
+                if index < total:
+                    break
+                index -= total
+            if len(node) == 3:
+                # nod de simbol: familia este regula completa, copiii ei devin copiii noului nod
+                tree_node = (symbols[node[0]], [])
+                siblings.append(tree_node)
+                stack.append((family[0], index, tree_node[1]))
+                continue
+
+            # nod intermediar: prefixul regulii, apoi ultimul simbol (stiva: ultimul intra primul)
+            pending = []
+            for child in reversed(family):
+                count = self.counts.get(child, 1)
+                pending.append((child, index % count, siblings))
+                index //= count
+            stack.extend(pending)
+        return root[0]
+
+    def trees(self, limit=None):
+        """generator: arborii de derivare, lenes, in ordinea indexului (cel mult limit)"""
+        total = self.count()
+        if limit is not None:
+            total = min(total, limit)
+        for index in range(total):
+            yield self.tree(index)
+
+
+def build_sppf(recognizer, tokens):
+    """construiesc padurea de derivare din chart-ul Earley (doar nodurile accesibile din radacina)"""
+    compiled = recognizer.compiled
+    tokens = list(tokens)
+    encoded = compiled.encode(tokens)
+    n = len(tokens)
+    width = n + 1
+    chart = recognizer.chart(tokens)
+    root = (compiled.start, 0, n)
+    if compiled.start < 0 or not any(position * width in chart[n] for position in recognizer.accepting):
+        return SPPF(compiled, tokens, {}, None)
+
+    ends = recognizer.completed(tokens, chart)
+    num_nonterminals = compiled.num_nonterminals
+    bodies, positions = compiled.bodies, recognizer.rule_positions
+    families = {}
+    queue = [root]
+    while queue:
+        node = queue.pop()
+        if node in families or (len(node) == 3 and node[0] >= num_nonterminals):
+            continue
+
+        if len(node) == 3:
+            symbol, i, k = node
+            alternatives = []
+            for rule_id in compiled.by_head[symbol]:
+                size = len(bodies[rule_id])
+                if (positions[rule_id] + size) * width + i in chart[k]:
+                    alternatives.append(((rule_id, size, i, k),))
+        else:
+            rule_id, dot, i, k = node
+            alternatives = []
+            if dot == 0:
+                alternatives.append(())
+            else:
+                symbol = bodies[rule_id][dot - 1]
+                prefix_item = (positions[rule_id] + dot - 1) * width + i
+                if symbol >= num_nonterminals:
+                    splits = 1 << (k - 1) if k > i and encoded[k - 1] == symbol else 0
+                else:
+                    splits = ends[symbol][k] >> i << i
+                while splits:
+                    low = splits & -splits
+                    j = low.bit_length() - 1
+                    splits ^= low
+                    if prefix_item in chart[j]:
+                        # cu punctul la inceput, itemul exista doar in chart[i], deci j == i
+                        prefix = ((rule_id, dot - 1, i, j),) if dot > 1 else ()
+                        alternatives.append(prefix + ((symbol, j, k),))
+
+        families[node] = alternatives
+        for family in alternatives:
+            queue.extend(family)
+
+    return SPPF(compiled, tokens, families, root)